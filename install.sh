@@ -106,7 +106,7 @@ GIT_BRANCH=${GIT_BRANCH:-$DEFAULT_GIT_BRANCH}
 
 info "📦 Updating package list & installing system packages..."
 apt update
-apt install -y git python3 python3-pip python3-smbus python3-rpi.gpio i2c-tools libgpiod-dev
+apt install -y git python3 python3-pip python3-smbus python3-numpy python3-rpi.gpio i2c-tools libgpiod-dev python3-libgpiod
 
 
 # Clone repository
@@ -149,6 +149,11 @@ else
     warn "⚠️ Configuration file $CONFIG_FILE not found. Skipping copy operation."
 fi
 
+# Register dump tool for field debugging
+chmod +x "$APP_DIR/src/mupihat-dump"
+ln -sf "$APP_DIR/src/mupihat-dump" /usr/local/bin/mupihat-dump
+info "✅ mupihat-dump installed to /usr/local/bin."
+
 # ...existing code...
 
 # Detect OS and set config.txt path accordingly
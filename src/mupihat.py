@@ -7,15 +7,41 @@ Parameters
     Enable Logging and specify file
 -h : print help
 -j <json file> str
-    Enable generation of JSON file
+    Enable generation of JSON file (written atomically, only on change, with a "seq" counter)
+--json-indent <n> : int
+    Pretty-print the JSON file (default: compact)
+-s <server> : str
+    HTTP server: auto (waitress if installed), waitress or dev (Flask development server)
+--threads <n> : int
+    Worker threads of the waitress server
+--history <hours> : float
+    Retention of the telemetry history (/api/history), 0 to disable (default: 24)
+--store <directory> : str
+    Enable the binary telemetry store (see mupihat_store.py) in directory
+--store-days <days> : int
+    Retention of the binary telemetry store in days (default: 0, keep all)
+--period <group>=<s> : str
+    Poll period of a register group (adc, status, flags, config, part), 0 to read it once (default: adc=1 status=1 flags=1 config=5 part=0)
+--watchdog-fraction <f> : float
+    Kick the charger watchdog at this part of its timeout (default: 0.5)
+--samples <path> : str
+    Sample log, one CSV row (.jsonl: JSON line) per sample, "" to disable (default: /tmp/mupihat_samples.csv)
+--samples-interval <s> : float
+    Interval of the sample log in s (default: 5)
+--shm <path> : str
+    Status segment (and <path>.env for shell scripts) for local consumers (see mupihat_shm.py), "" to disable (default: /dev/shm/mupihat)
 
 Call to use for MuPiHAT Service:
 -------
 python3 -B /usr/local/bin/mupibox/mupihat.py -j /tmp/mupihat.json
 
-Call to use for MuPiHAT Print Logging for Debug only (e.g., for Battery test):
+Call to use for MuPiHAT Service in event mode (INT pin of the charger on GPIO <n>):
 -------
-python3 -B /usr/local/bin/mupibox/mupihat.py -l /tmp/mupihat.log
+python3 -B /usr/local/bin/mupibox/mupihat.py -j /tmp/mupihat.json -i <n>
+
+Call to use for MuPiHAT sample logging every second (e.g., for Battery test):
+-------
+python3 -B /usr/local/bin/mupibox/mupihat.py --samples /tmp/battery_test.csv --samples-interval 1
 
 Returns
 -------
@@ -34,24 +60,74 @@ import time
 import json
 import logging
 import argparse
-from datetime import datetime
-from flask import Flask, render_template, jsonify
-from threading import Thread
+import signal
+from flask import Flask, Response, render_template, jsonify, request
+from threading import Thread, Event, Lock
 from mupihat_bq25792 import bq25792
+from mupihat_events import ChargerEvents, GpiodLine, DEFAULT_FLAGS
+from mupihat_jsonfile import AtomicJsonFile
+from mupihat_stream import SnapshotStream, KEEPALIVE
+from mupihat_server import make_server, SERVERS, DEFAULT_THREADS
+from mupihat_history import TelemetryRing, FIELDS as HISTORY_FIELDS
+from mupihat_store import TelemetryStore
+from mupihat_metrics import Metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from mupihat_shm import StatusPublisher, SHM_PATH
+from mupihat_scheduler import PollScheduler
+from mupihat_samplelog import SampleLog
+from mupihat_watchdog import WatchdogKeeper, DEFAULT_FRACTION as WATCHDOG_FRACTION
+from mupihat_registers import REGISTER_GROUPS
 
 app = Flask(__name__)
 
 # Global variables
 hat = None
+events = None
+watchdog = None
+wakeup = Event()
+# set on shutdown, ends the poll loop
+stopping = Event()
+# time in s the shutdown waits for a running poll
+SHUTDOWN_TIMEOUT_S = 5
 log_flag = False
 json_flag = False
 json_file = "/tmp/mupihat.json"
+json_writer = None
 config_file = "/etc/mupibox/mupiboxconfig.json"
 
+# poll period in s of the register groups (mupihat_registers.REGISTER_GROUPS), None: read once
+POLL_PERIODS = {"adc": 1.0, "status": 1.0, "flags": 1.0, "config": 5.0, "part": None}
+# period in s of the sample log
+SAMPLES_INTERVAL_S = 5
+# minimal poll period in s in event mode, charger events wake the poll up early
+EVENT_POLL_INTERVAL_S = 30
+# shortest poll period in s, clients may cache the API responses that long
+poll_interval_s = min(period for period in POLL_PERIODS.values() if period)
+
+# /api/registers of the current snapshot, serialized once per snapshot generation:
+# (generation, etag, JSON bytes, registers dict)
+registers_cache = (None, None, None, None)
+registers_cache_lock = Lock()
+# ETags of a previous process run must not match
+ETAG_PREFIX = "%x" % int(time.time())
+
+# /api/stream, Server-Sent Events of every new snapshot
+stream = SnapshotStream()
+STREAM_KEEPALIVE_S = 15
 
-def timestamp():
-    """Returns the current timestamp."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# telemetry history of the poll loop, /api/history
+history = None
+# binary telemetry store on disk
+store = None
+
+# /metrics, rendered once per poll
+metrics = Metrics()
+
+# status segment in shared memory for the local consumers
+shm = None
+
+# CSV / JSON-lines sample log, written every samples_interval_s
+sample_log = None
+samples_interval_s = SAMPLES_INTERVAL_S
 
 
 def setup_logging(logfile):
@@ -64,58 +140,211 @@ def setup_logging(logfile):
     logging.info("----- Logfile mupihat.py -----")
 
 
-def log_register_values():
-    """Logs register values for debugging."""
-    logging.info("*** Timestamp: %s", timestamp())
-    logging.info("Thermal Regulation Threshold: %s", hat.REG16_Temperature_Control.get_thermal_reg_threshold())
-    logging.info("Thermal Shutdown Threshold: %s", hat.REG16_Temperature_Control.get_thermal_shutdown_threshold())
-    logging.info("Temperature Charger IC: %s", hat.REG41_TDIE_ADC.get_IC_temperature())
-    logging.info("Temperature Regulation Status: %s", hat.REG1D_Charger_Status_2.get_thermal_regulation_status())
-    logging.info("Charger Status: %s", hat.REG1C_Charger_Status_1.CHG_STAT_STRG)
-    logging.info("IBUS [mA]: %s", hat.get_ibus())
-    logging.info("IBAT [mA]: %s", hat.get_ibat())
-    logging.info("VBUS [mV]: %s", hat.get_vbus())
-    logging.info("VBAT [mV]: %s", hat.get_vbat())
-    logging.info("VSYS [mV]: %s", hat.REG3D_VSYS_ADC.VSYS_ADC)
-    logging.info("Charge Voltage Limit: %s", hat.REG01_Charge_Voltage_Limit.VREG)
-    logging.info("Input Current Limit: %s", hat.REG06_Input_Current_Limit.get())
+def cached_registers():
+    """
+    Returns (generation, etag, JSON bytes, registers dict) of the current snapshot.
+    The registers are serialized only once per snapshot, normally by the poll thread.
+    """
+    global registers_cache
+    snapshot = hat.snapshot
+    cache = registers_cache
+    if cache[0] == snapshot.generation:
+        return cache
+    with registers_cache_lock:
+        cache = registers_cache
+        if cache[0] != snapshot.generation:
+            data = hat.to_json_registers(snapshot)
+            body = json.dumps(data, separators=(",", ":"), sort_keys=True).encode()
+            cache = (snapshot.generation, "%s-%d" % (ETAG_PREFIX, snapshot.generation), body, data)
+            registers_cache = cache
+            stream.publish(snapshot.generation, data)
+    return cache
 
 
 @app.route("/")
 def index():
     """Flask route to display register values."""
     try:
-        return render_template("index.html", registers=hat.to_json_registers())
+        return render_template("index.html", registers=cached_registers()[3])
     except Exception as e:
         return f"Error reading registers: {str(e)}", 500
 
 
 @app.route("/api/registers")
 def api_registers():
-    """Flask API endpoint to return register values as JSON."""
-    try:     
-        return jsonify(hat.to_json_registers())
+    """Flask API endpoint to return register values as JSON, 304 if the client has them."""
+    try:
+        _, etag, body, _ = cached_registers()
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.max_age = int(poll_interval_s) or None
+    return response.make_conditional(request)
+
+
+def on_charger_event(flags, snapshot):
+    """Wakes up the periodic poll on a charger event."""
+    wakeup.set()
+
+
+def wait_adc_done(since):
+    """Returns the wait_done function of read_adc_oneshot() in event mode."""
+    return lambda timeout_s: events.wait_event("ADC_DONE_FLAG", timeout_s, since)
+
+
+@app.route("/api/stream")
+def api_stream():
+    """Flask API endpoint streaming every new snapshot as Server-Sent Events."""
+    client = stream.subscribe()
+    if client is None:
+        return jsonify({"error": "too many stream clients"}), 503
+    cached_registers()  # the client starts with the current snapshot
+
+    def generate():
+        try:
+            while True:
+                yield client.get(STREAM_KEEPALIVE_S) or KEEPALIVE
+        finally:
+            stream.unsubscribe(client)
+
+    response = Response(generate(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@app.route("/api/history")
+def api_history():
+    """
+    Flask API endpoint returning the telemetry history as columns,
+    e.g. /api/history?since=<unix time>&fields=VBAT,IBAT (default: the last hour)
+    """
+    if history is None:
+        return jsonify({"error": "history disabled"}), 404
+    since = request.args.get("since", type=float)
+    fields = request.args.get("fields")
+    try:
+        return jsonify(history.query(since, tuple(fields.split(",")) if fields else HISTORY_FIELDS))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route("/metrics")
+def api_metrics():
+    """Prometheus metrics of the charger and the poller, rendered by the poll loop."""
+    try:
+        body = metrics.exposition(hat)
+    except Exception as e:
+        return f"Error rendering metrics: {str(e)}", 500
+    return Response(body, content_type=METRICS_CONTENT_TYPE)
+
+
+def poll_periods():
+    """
+    Returns the periods of the poll jobs: the register groups and "samples".
+    In event mode the flags are read on INT only and the groups are read at least every EVENT_POLL_INTERVAL_S.
+    """
+    periods = dict(POLL_PERIODS)
+    if events is not None:
+        periods.pop("flags", None)
+        periods = {group: period and max(period, EVENT_POLL_INTERVAL_S) for group, period in periods.items()}
+    if sample_log is not None:
+        periods["samples"] = samples_interval_s
+    return periods
+
+
+def publish_snapshot():
+    """Publishes the current snapshot to the API caches, the history, the store and the status files."""
+    cached_registers()  # serialize the new snapshot once for all clients
+    metrics.render(hat)
+    if history is not None:
+        history.append(hat.snapshot)
+    if store is not None:
+        try:
+            store.append(hat.snapshot)
+        except OSError as e:
+            logging.error("Failed to write the telemetry store: %s", str(e))
+    status = hat.to_json()
+    if shm is not None:
+        try:
+            shm.publish(status, hat.snapshot.generation, hat.snapshot.wall)
+        except (OSError, ValueError) as e:
+            logging.error("Failed to publish the status: %s", str(e))
+    if json_flag:
+        try:
+            json_writer.write(status)
+        except Exception as e:
+            logging.error("Failed to write JSON dump: %s", str(e))
 
 
 def periodic_json_dump():
-    """Periodically writes the register values to a JSON file."""
-    global json_flag, json_file
-    while True:
-        hat.watchdog_reset()
-        time.sleep(0.1)  # Allow time for the watchdog reset
-        hat.read_all_register()
-        time.sleep(1)  # Allow time for the registers to be updated
-        if json_flag:
+    """Reads every register group at its own period and publishes the new snapshots."""
+    scheduler = PollScheduler(poll_periods())
+    while not stopping.is_set():
+        now = time.monotonic()
+        due = scheduler.due(now)
+        groups = tuple(group for group in due if group in REGISTER_GROUPS)
+        oneshot = "adc" in groups and hat.adc_mode == "oneshot"
+        if oneshot:
+            groups = tuple(group for group in groups if group != "adc")
+        if watchdog.due(now, polling=bool(groups or oneshot)):
+            watchdog.kick(now)  # rides along with this poll if registers are read anyway
+        if groups or oneshot:
+            started = time.monotonic()
+            if groups:
+                hat.read_registers(groups)
+            if oneshot:
+                hat.read_adc_oneshot(wait_done=None if events is None else wait_adc_done(time.monotonic()))
+            metrics.observe_poll(time.monotonic() - started)
+            publish_snapshot()
+        if "samples" in due:
             try:
-                with open(json_file, "w") as outfile:
-                    json.dump(hat.to_json(), outfile, indent=4)
-            except Exception as e:
-                logging.error("Failed to write JSON dump: %s", str(e))
-        if log_flag:
-            log_register_values()
-        time.sleep(3.9)  # Run every 4 seconds
+                sample_log.write(hat.snapshot)
+            except OSError as e:
+                logging.error("Failed to write the sample log: %s", str(e))
+        timeout_s = scheduler.wait_s()
+        kick_s = watchdog.wait_s()
+        if kick_s is not None:
+            timeout_s = kick_s if timeout_s is None else min(timeout_s, kick_s)
+        if wakeup.wait(timeout_s):
+            # charger event, read the status and the ADC now
+            wakeup.clear()
+            for group in ("status", "adc"):
+                scheduler.trigger(group)
+
+
+def on_sigterm(signum, frame):
+    """SIGTERM handler (systemctl stop), ends the web server in the main thread."""
+    raise SystemExit(0)
+
+
+def shutdown(poll_thread):
+    """Stops the poll loop, then flushes and closes the sample log and the telemetry store."""
+    stopping.set()
+    wakeup.set()
+    if poll_thread is not None:
+        poll_thread.join(SHUTDOWN_TIMEOUT_S)
+    if watchdog is not None:
+        watchdog.stop()
+    if sample_log is not None:
+        sample_log.close()
+    if store is not None:
+        store.close()
+
+
+def poll_period(value):
+    """Parses a --period argument <group>=<seconds>."""
+    group, _, period = value.partition("=")
+    if group not in REGISTER_GROUPS:
+        raise argparse.ArgumentTypeError("unknown register group %r, expected one of %s" % (group, ", ".join(REGISTER_GROUPS)))
+    try:
+        period = float(period)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid period %r, expected <group>=<seconds>" % value)
+    if period < 0:
+        raise argparse.ArgumentTypeError("period of %s must not be negative" % group)
+    return group, period or None
 
 
 def parse_arguments():
@@ -135,17 +364,117 @@ def parse_arguments():
         help="Enable JSON file generation and specify the JSON file path",
         default="/tmp/mupihat.json"
     )
+    parser.add_argument(
+        "--json-indent",
+        type=int,
+        help="Pretty-print the JSON file with the given indentation (default: compact)",
+        default=None
+    )
     parser.add_argument(
         "-c", "--config",
         type=str,
         help="Config (Json) File for MuPiHAT",
         default="/etc/mupihat/mupihatconfig.json"
     )
+    parser.add_argument(
+        "-b", "--bus",
+        type=str,
+        choices=["auto", "rdwr", "smbus", "sim"],
+        help="I2C bus backend: rdwr (I2C_RDWR, one transaction for all registers), smbus, auto or sim (simulated BQ25792, no hardware)",
+        default="auto"
+    )
+    parser.add_argument(
+        "-a", "--adc",
+        type=str,
+        choices=["continuous", "oneshot"],
+        help="ADC mode: continuous conversion or one conversion per poll (lower quiescent current)",
+        default="continuous"
+    )
+    parser.add_argument(
+        "-i", "--int-gpio",
+        type=int,
+        help="Event mode: GPIO line of the charger INT pin, the poll slows down and charger events are read on INT",
+        default=None
+    )
+    parser.add_argument(
+        "--int-chip",
+        type=str,
+        help="GPIO chip of the INT line (e.g. a gpio-sim chip for tests)",
+        default="/dev/gpiochip0"
+    )
+    parser.add_argument(
+        "-s", "--server",
+        type=str,
+        choices=SERVERS,
+        help="HTTP server: auto (waitress if installed), waitress (bounded worker pool, keep-alive, timeouts) or dev (Flask development server)",
+        default="auto"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Worker threads of the waitress server",
+        default=DEFAULT_THREADS
+    )
+    parser.add_argument(
+        "--history",
+        type=float,
+        help="Retention of the telemetry history (/api/history) in hours, 0 to disable",
+        default=24
+    )
+    parser.add_argument(
+        "--store",
+        type=str,
+        help="Enable the binary telemetry store in the given directory",
+        default=None
+    )
+    parser.add_argument(
+        "--store-days",
+        type=int,
+        help="Retention of the binary telemetry store in days, 0 to keep all",
+        default=0
+    )
+    parser.add_argument(
+        "--period",
+        type=poll_period,
+        action="append",
+        help="Poll period of a register group as <group>=<seconds>, 0 to read it once, e.g. --period adc=2 --period config=10",
+        default=[]
+    )
+    parser.add_argument(
+        "--watchdog-fraction",
+        type=float,
+        help="Kick the charger watchdog at this part of its timeout",
+        default=WATCHDOG_FRACTION
+    )
+    parser.add_argument(
+        "--samples",
+        type=str,
+        help="Sample log, one CSV row (.jsonl file: JSON line) per sample, empty to disable",
+        default="/tmp/mupihat_samples.csv"
+    )
+    parser.add_argument(
+        "--samples-interval",
+        type=float,
+        help="Interval of the sample log in s",
+        default=SAMPLES_INTERVAL_S
+    )
+    parser.add_argument(
+        "--shm",
+        type=str,
+        help="Status segment in shared memory for local consumers (mupihat_shm.py), empty to disable",
+        default=SHM_PATH
+    )
+    parser.add_argument(
+        "-p", "--port",
+        type=int,
+        help="HTTP port of the web API",
+        default=5000
+    )
     return parser.parse_args()
 
 
 def main():
-    global hat, log_flag, json_flag, json_file
+    global hat, events, watchdog, history, store, shm, sample_log, samples_interval_s, log_flag, json_flag, json_file, json_writer, poll_interval_s
 
     # Parse command-line arguments
     args = parse_arguments()
@@ -154,9 +483,30 @@ def main():
     config_file = args.config
     log_flag = bool(logfile)
     json_flag = bool(json_file)
+    if json_flag:
+        json_writer = AtomicJsonFile(json_file, indent=args.json_indent)
+    POLL_PERIODS.update(args.period)
+    poll_interval_s = min((period for period in POLL_PERIODS.values() if period), default=EVENT_POLL_INTERVAL_S)
+    if args.history > 0:
+        history = TelemetryRing(max(1, int(args.history * 3600 / poll_interval_s)))
+    if args.store:
+        store = TelemetryStore(args.store, retention_days=args.store_days or None)
+    if args.samples:
+        try:
+            sample_log = SampleLog(args.samples)
+            samples_interval_s = args.samples_interval
+        except OSError as e:
+            logging.error("Sample log %s not available: %s", args.samples, str(e))
+    if args.shm:
+        try:
+            shm = StatusPublisher(args.shm)
+        except OSError as e:
+            logging.error("Status segment %s not available: %s", args.shm, str(e))
 
     # Detect I2C bus
-    if os.path.exists("/dev/i2c-1"):
+    if args.bus == "sim":
+        i2c_device = 1
+    elif os.path.exists("/dev/i2c-1"):
         i2c_device = 1
     else:
         logging.error("No supported I2C device found (/dev/i2c-1). Check if the I2C bus is enabled.")
@@ -168,27 +518,51 @@ def main():
 
     # Initialize BQ25792
     try:
-        hat = bq25792(i2c_device=i2c_device, battery_conf_file=config_file)
+        hat = bq25792(i2c_device=i2c_device, battery_conf_file=config_file, bus=args.bus)
+        hat.adc_mode = args.adc
         hat.MuPiHAT_Default()
 
     except Exception as e:
         logging.error("MuPiHAT initialization failed: %s", str(e))
         sys.exit(1)
 
+    # Event mode on the INT pin, falls back to polling
+    if args.int_gpio is not None:
+        flags = DEFAULT_FLAGS + (("ADC_DONE_FLAG",) if args.adc == "oneshot" else ())
+        try:
+            events = ChargerEvents(hat, GpiodLine(args.int_chip, args.int_gpio), flags)
+            events.add_handler(on_charger_event)
+            if events.start() == -1:
+                raise OSError("charger interrupt configuration failed")
+        except (ImportError, OSError) as e:
+            logging.error("Event mode not available, polling: %s", str(e))
+            events = None
+
     # Start the periodic JSON dump in a background thread
+    json_thread = None
     if json_flag:
+        watchdog = WatchdogKeeper(hat, args.watchdog_fraction)
+        watchdog.start()
         json_thread = Thread(target=periodic_json_dump, daemon=True)
         json_thread.start()
 
-    # Flask web server
+    # Web server, SIGTERM and Ctrl-C flush the sample log and the store
+    signal.signal(signal.SIGTERM, on_sigterm)
     try:
-        app.run(host="0.0.0.0", port=5000, debug=False)
+        server = make_server(app, args.server, "0.0.0.0", args.port, args.threads)
+        if server.threads:
+            # every stream client holds a worker, keep the others for the API requests
+            stream.max_clients = max(1, server.threads // 2)
+        logging.info("MuPiHAT web API on port %d (%s server)", server.port, server.name)
+        server.serve_forever()
     except KeyboardInterrupt:
         print("MuPiHAT stopped by Keyboard Interrupt")
         sys.exit(0)
     except Exception as e:
         logging.error("MuPiHAT error: %s", str(e))
         sys.exit(1)
+    finally:
+        shutdown(json_thread)
 
 
 if __name__ == "__main__":
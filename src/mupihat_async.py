@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+""" Module mupihat_async.py, class: AsyncBQ25792
+asyncio facade of the blocking bq25792 driver.
+
+All bus transactions of the facade run on one dedicated executor thread, so
+they are serialized and never block the event loop. Callers asking for a
+fresh snapshot while a read of the same (or more) register groups is running
+share that read instead of queueing another bus transaction.
+
+Usage
+-----
+async def main():
+    charger = AsyncBQ25792(bq25792(bus="sim"))
+    snapshot = await charger.read_snapshot()
+    await charger.write_fields(WATCHDOG=7, WD_RST=1)
+    async for snapshot in charger.snapshots(period_s=1.0):
+        print(snapshot.value("VBAT_ADC"))
+
+The driver must not be used by other threads at the same time, except through
+this facade.
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mupihat_registers as registers
+
+# register groups of a poll (see mupihat_registers.REGISTER_GROUPS)
+DEFAULT_GROUPS = ("status", "flags", "adc")
+
+
+class AsyncBQ25792:
+    """
+    asyncio facade of a bq25792, bus transactions on a single executor thread.
+
+    Parameters
+    ----------
+    hat : bq25792
+        the blocking driver.
+
+    Attributes
+    ----------
+    reads : int
+        number of bus reads of read_snapshot(), shared reads count once.
+    shared : int
+        number of read_snapshot() calls served by a running read.
+    """
+    def __init__(self, hat):
+        self.hat = hat
+        self.reads = 0
+        self.shared = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mupihat-bus")
+        self._inflight = {}  # {groups: future} of the running reads
+
+    @property
+    def snapshot(self):
+        ''' the last RegisterSnapshot, without bus access '''
+        return self.hat.snapshot
+
+    async def call(self, func, *args, **kwargs):
+        '''
+        Runs func(*args, **kwargs), e.g. a method of the driver, on the bus thread and returns its result.
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def read_snapshot(self, groups=DEFAULT_GROUPS):
+        '''
+        Reads the register groups (None: all registers) and returns the new RegisterSnapshot,
+        -1 if the read failed. Joins a running read that covers the groups.
+        Raises ValueError for an unknown group.
+        '''
+        wanted = frozenset(registers.REGISTER_GROUPS if groups is None else groups)
+        unknown = wanted.difference(registers.REGISTER_GROUPS)
+        if unknown:
+            raise ValueError("unknown register group %s, expected one of %s" % (
+                ", ".join(sorted(unknown)), ", ".join(registers.REGISTER_GROUPS)))
+        for running, future in self._inflight.items():
+            if wanted <= running:
+                self.shared += 1
+                return await asyncio.shield(future)
+        loop = asyncio.get_running_loop()
+        if groups is None:
+            future = loop.run_in_executor(self._executor, self.hat.read_all_register)
+        else:
+            future = loop.run_in_executor(self._executor, self.hat.read_registers, tuple(groups))
+        self.reads += 1
+        self._inflight[wanted] = future
+        future.add_done_callback(lambda _: self._inflight.pop(wanted, None))
+        # a cancelled caller does not cancel the read the others are waiting for
+        return await asyncio.shield(future)
+
+    async def write_fields(self, **fields):
+        '''
+        Writes bitfields by name, e.g. write_fields(WATCHDOG=7, WD_RST=1), see bq25792.write_fields().
+        Returns 0, -1 if the write failed. Raises ValueError for an unknown or read-only bitfield.
+        '''
+        return await self.call(self.hat.write_fields, **fields)
+
+    async def snapshots(self, period_s=1.0, groups=DEFAULT_GROUPS):
+        '''
+        Async iterator of a new snapshot every period_s, on the monotonic clock.
+        Failed reads are skipped.
+        '''
+        deadline = time.monotonic()
+        while True:
+            snapshot = await self.read_snapshot(groups)
+            if snapshot != -1:
+                yield snapshot
+            deadline += period_s
+            now = time.monotonic()
+            if deadline < now:
+                deadline = now  # late, continue from now instead of catching up
+            await asyncio.sleep(deadline - now)
+
+    def close(self):
+        ''' waits for the running bus transaction and stops the bus thread '''
+        self._executor.shutdown(wait=True)
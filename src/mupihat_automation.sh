@@ -1,7 +1,9 @@
 #!/bin/bash
 
 SOUND_FILE="/home/dietpi/MuPiBox/sysmedia/sound/low.wav"
-JSON_FILE="/tmp/mupihat.json"
+SHM_FILE="/dev/shm/mupihat"
+STATUS_ENV="${SHM_FILE}.env"
+MAX_AGE=300
 BATTERY_LOW="/home/dietpi/MuPiBox/sysmedia/images/battery_low.jpg"
 CONFIG="/etc/mupibox/mupiboxconfig.json"
 
@@ -9,17 +11,27 @@ play_sound() {
     mplayer -nolirc "$SOUND_FILE" > /dev/null
 }
 
+# sets BatteryConnected, Vbus and Bat_Stat from the status file of mupihat.py
+# (see mupihat_shm.py), bash builtins only, fails if the status is missing or stale
+read_status() {
+    local now
+    [ -f "$STATUS_ENV" ] || return 1
+    . "$STATUS_ENV" || return 1
+    printf -v now '%(%s)T' -1
+    [ $(( now - ${MUPIHAT_TS:-0} )) -le $MAX_AGE ]
+}
+
 echo $! > /run/mupi_hat_control.pid
 sleep 30
 
-BAT_CONNECTED=$(jq -r '.BatteryConnected' ${JSON_FILE})
+read_status
 
-if [ "${BAT_CONNECTED}" -eq 1 ]; then
+if [ "${BatteryConnected}" -eq 1 ]; then
 	while true; do
-		if [ -f ${JSON_FILE} ]; then
-			VBUS=$(jq -r '.Vbus' ${JSON_FILE})
+		if read_status; then
+			VBUS=${Vbus}
             if [ "$VBUS" -le 1000 ]; then
-				STATE=$(jq -r '.Bat_Stat' ${JSON_FILE})
+				STATE=${Bat_Stat}
 				if [ "${STATE}" = "LOW" ]; then
 					play_sound
 					echo "Battery state low"
@@ -0,0 +1,264 @@
+#!/usr/bin/python3
+""" Benchmark of the MuPiHAT poll -> decode -> serialize -> serve pipeline
+Runs against the simulated BQ25792 (mupihat_sim), no hardware needed.
+
+Parameters
+----------
+-n <iterations> : int
+    Iterations per benchmark (default: 2000)
+--baseline <file> : str
+    Compare with a stored baseline, exit code 1 if a benchmark regressed
+--save-baseline <file> : str
+    Store the results as new baseline
+--tolerance <fraction> : float
+    Allowed slowdown of ops/s and p99 against the baseline (default: 0.25)
+--json : print the results as JSON
+
+Call
+-------
+python3 -B mupihat_bench.py --save-baseline bench_baseline.json
+python3 -B mupihat_bench.py --baseline bench_baseline.json
+
+Returns
+-------
+exit code 0, 1 if a benchmark regressed against the baseline
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import argparse
+import gc
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from mupihat_bq25792 import bq25792
+from mupihat_jsonfile import AtomicJsonFile
+from mupihat_shm import StatusPublisher, StatusClient
+from mupihat_sim import SimulatedBQ25792
+import mupihat_registers as registers
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "mupihatconfig.json")
+
+
+def measure(func, iterations, sim=None):
+    """
+    Runs func iterations times.
+    Returns ops/s, p50 and p99 latency in µs, the peak of the memory allocated
+    during an iteration in bytes (tracemalloc) and the bytes transferred on the
+    simulated bus per iteration.
+    """
+    for _ in range(min(iterations, 50)):  # warm up
+        func()
+    gc.collect()
+    transferred = sim.bytes_transferred if sim else 0
+    times = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(iterations):
+        t0 = clock()
+        func()
+        times.append(clock() - t0)
+    total = clock() - start
+    transferred = (sim.bytes_transferred - transferred) / iterations if sim else 0
+    times.sort()
+    # memory in a separate pass, tracemalloc slows down the timing
+    runs = min(iterations, 200)
+    tracemalloc.start()
+    peak = 0
+    for _ in range(runs):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        peak += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return {
+        "ops": iterations / (total / 1e9),
+        "p50_us": times[len(times) // 2] / 1e3,
+        "p99_us": times[min(len(times) - 1, int(len(times) * 0.99))] / 1e3,
+        "peak_bytes": peak // runs,
+        "bus_bytes": transferred,
+    }
+
+
+def benchmarks(hat, directory):
+    """
+    Returns the benchmarks as list of (name, function), files are written to directory.
+    """
+    raw = hat.snapshot.raw
+
+    def decode_view(view):
+        value = registers.raw_value(view._register, raw)
+        return lambda: view.set(value)
+
+    def fresh(func):
+        # a new snapshot as after each poll, nothing decoded yet
+        def run():
+            hat.snapshot = registers.RegisterSnapshot(raw)
+            return func()
+        return run
+
+    def json_dump():
+        json.dump(hat.to_json(), io.StringIO(), indent=4)
+
+    writer = AtomicJsonFile(os.path.join(directory, "mupihat.json"))
+
+    def json_file_unchanged():
+        # the poll loop with unchanged values, the file is not rewritten
+        writer.write(hat.to_json())
+
+    publisher = StatusPublisher(os.path.join(directory, "mupihat.shm"))
+    publisher.publish(hat.to_json())
+    status = StatusClient(publisher.path)
+
+    def shm_read_new():
+        status._seq = None  # as after a new poll, the payload is copied and decoded
+        return status.read()
+
+    result = [
+        ("read_all_register", hat.read_all_register),
+        ("read_registers_status_flags_adc", hat.read_registers),
+        ("read_registers_status_adc", lambda: hat.read_registers(("status", "adc"))),
+    ]
+    # the decode of every register view, REGxx.set()
+    result += [("decode_" + reg.name, decode_view(getattr(hat, reg.name))) for reg in registers.REGISTERS]
+    result += [
+        ("battery_soc", hat.battery_soc),
+        ("to_json", fresh(hat.to_json)),
+        ("to_json_cached", hat.to_json),
+        ("to_json_registers", fresh(hat.to_json_registers)),
+        ("to_json_registers_cached", hat.to_json_registers),
+        ("json_dump_indent4", json_dump),
+        ("json_file_unchanged", json_file_unchanged),
+        ("shm_publish", lambda: publisher.publish(hat.to_json())),
+        ("shm_read", status.read),
+        ("shm_read_new", shm_read_new),
+    ]
+    try:
+        import mupihat
+    except ImportError as _error:
+        logging.warning("web API benchmark skipped, %s", str(_error))
+        return result
+    mupihat.hat = hat
+    client = mupihat.app.test_client()
+
+    def api_registers():
+        response = client.get("/api/registers")
+        if response.status_code != 200:
+            raise RuntimeError("/api/registers returned %d" % response.status_code)
+
+    def api_registers_cold():
+        # the first request after a poll, the registers are serialized for the new generation
+        hat.snapshot = registers.RegisterSnapshot(raw, generation=hat.snapshot.generation + 1)
+        api_registers()
+
+    def api_registers_not_modified():
+        etag = mupihat.cached_registers()[1]
+        response = client.get("/api/registers", headers={"If-None-Match": '"%s"' % etag})
+        if response.status_code != 304:
+            raise RuntimeError("/api/registers returned %d, expected 304" % response.status_code)
+
+    def api_metrics():
+        response = client.get("/metrics")
+        if response.status_code != 200:
+            raise RuntimeError("/metrics returned %d" % response.status_code)
+
+    mupihat.metrics.render(hat)
+    result.append(("api_registers", api_registers))
+    result.append(("api_registers_cold", api_registers_cold))
+    result.append(("api_registers_304", api_registers_not_modified))
+    result.append(("metrics_render", lambda: mupihat.metrics.render(hat)))
+    result.append(("api_metrics", api_metrics))
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the list of regressions against the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["ops"] < base["ops"] * (1 - tolerance):
+            regressions.append("%s: %.0f ops/s, baseline %.0f ops/s" % (name, result["ops"], base["ops"]))
+        if result["p99_us"] > base["p99_us"] * (1 + tolerance):
+            regressions.append("%s: p99 %.1f µs, baseline %.1f µs" % (name, result["p99_us"], base["p99_us"]))
+        if result["bus_bytes"] > base.get("bus_bytes", result["bus_bytes"]):
+            regressions.append("%s: %.0f bus bytes, baseline %.0f" % (name, result["bus_bytes"], base["bus_bytes"]))
+    return regressions
+
+
+def parse_arguments():
+    """Parses command-line arguments using argparse."""
+    parser = argparse.ArgumentParser(description="MuPiHAT pipeline benchmark (simulated BQ25792)")
+    parser.add_argument("-n", "--iterations", type=int, default=2000, help="Iterations per benchmark")
+    parser.add_argument("--baseline", type=str, help="Baseline JSON file to compare with")
+    parser.add_argument("--save-baseline", type=str, help="Store the results as baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    sim = SimulatedBQ25792()
+    hat = bq25792(battery_conf_file=CONFIG_FILE, bus=sim)
+    hat.MuPiHAT_Default()
+    hat.read_all_register()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="mupihat_bench") as directory:
+        for name, func in benchmarks(hat, directory):
+            results[name] = measure(func, args.iterations, sim)
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+    else:
+        print("%s, Python %s, %d iterations" % (platform.machine(), platform.python_version(), args.iterations))
+        print("%-40s %12s %10s %10s %12s %10s" % ("benchmark", "ops/s", "p50 µs", "p99 µs", "peak B/it", "bus B/it"))
+        for name, r in results.items():
+            print("%-40s %12.0f %10.1f %10.1f %12d %10.0f" % (name, r["ops"], r["p50_us"], r["p99_us"], r["peak_bytes"], r["bus_bytes"]))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as outfile:
+            json.dump(results, outfile, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as infile:
+            regressions = compare(results, json.load(infile), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
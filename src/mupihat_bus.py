@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+""" Module mupihat_bus.py, I2C bus backends for the BQ25792 driver
+The driver talks to the bus through the three smbus2 style calls
+read_i2c_block_data, write_byte_data and write_i2c_block_data.
+
+Backends
+--------
+I2CRdwrBus : combined I2C_RDWR transfers, any length in one ioctl (e.g. all 73 registers)
+SMBusBus   : SMBus block transfers, max. 32 bytes per transaction
+FakeBus    : in-memory register file, counts transactions
+sim        : simulated BQ25792, see mupihat_sim
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import logging
+
+import smbus2
+
+# SMBus block transfers are limited to 32 bytes
+SMBUS_BLOCK_MAX = 32
+
+
+class SMBusBus:
+    """
+    SMBus backend, block transfers are split into transactions of up to 32 bytes.
+    """
+    max_block = SMBUS_BLOCK_MAX
+
+    def __init__(self, i2c_device=1):
+        self.bus = smbus2.SMBus(i2c_device)
+
+    def read_i2c_block_data(self, i2c_addr, register, length):
+        data = []
+        while length > 0:
+            n = min(length, SMBUS_BLOCK_MAX)
+            data += self.bus.read_i2c_block_data(i2c_addr, register, n)
+            register += n
+            length -= n
+        return data
+
+    def write_byte_data(self, i2c_addr, register, value):
+        self.bus.write_byte_data(i2c_addr, register, value)
+
+    def write_i2c_block_data(self, i2c_addr, register, data):
+        data = list(data)
+        while data:
+            self.bus.write_i2c_block_data(i2c_addr, register, data[:SMBUS_BLOCK_MAX])
+            register += SMBUS_BLOCK_MAX
+            data = data[SMBUS_BLOCK_MAX:]
+
+    def close(self):
+        self.bus.close()
+
+
+class I2CRdwrBus(SMBusBus):
+    """
+    I2C_RDWR backend, a block read is a plain I2C write (register pointer) followed by a
+    repeated start read of any length, sent to the kernel in one ioctl.
+    Raises OSError if the adapter does not support plain I2C transfers.
+    """
+    max_block = 0x100
+
+    def __init__(self, i2c_device=1):
+        super().__init__(i2c_device)
+        if not self.bus.funcs & smbus2.I2cFunc.I2C:
+            self.bus.close()
+            raise OSError("I2C adapter %s does not support I2C_RDWR" % i2c_device)
+
+    def read_i2c_block_data(self, i2c_addr, register, length):
+        write = smbus2.i2c_msg.write(i2c_addr, [register])
+        read = smbus2.i2c_msg.read(i2c_addr, length)
+        self.bus.i2c_rdwr(write, read)
+        return list(read)
+
+    def write_i2c_block_data(self, i2c_addr, register, data):
+        self.bus.i2c_rdwr(smbus2.i2c_msg.write(i2c_addr, [register] + list(data)))
+
+
+class FakeBus:
+    """
+    In-memory bus for tests, every device address has 256 plain bytes.
+    transactions counts the bus transactions.
+    """
+    max_block = 0x100
+
+    def __init__(self, i2c_device=1, memory=None):
+        self.memory = {}
+        self.transactions = 0
+        if memory is not None:
+            self.memory[0x6b] = bytearray(memory).ljust(0x100, b"\x00")
+
+    def _device(self, i2c_addr):
+        return self.memory.setdefault(i2c_addr, bytearray(0x100))
+
+    def read_i2c_block_data(self, i2c_addr, register, length):
+        self.transactions += 1
+        return list(self._device(i2c_addr)[register:register + length])
+
+    def write_byte_data(self, i2c_addr, register, value):
+        self.transactions += 1
+        self._device(i2c_addr)[register] = value
+
+    def write_i2c_block_data(self, i2c_addr, register, data):
+        self.transactions += 1
+        data = bytes(data)
+        self._device(i2c_addr)[register:register + len(data)] = data
+
+    def close(self):
+        pass
+
+
+BUSES = {
+    "rdwr": I2CRdwrBus,
+    "smbus": SMBusBus,
+    "fake": FakeBus,
+}
+
+
+def open_bus(bus="auto", i2c_device=1):
+    '''
+    Returns the bus backend for i2c_device, bus is
+        a name ("auto", "rdwr", "smbus", "fake" or "sim"),
+        a bus factory, called with i2c_device (e.g. mupihat_sim.SimulatedBQ25792),
+        or an object with the backend methods, returned as is.
+    "auto" uses I2C_RDWR and falls back to SMBus if the adapter does not support it.
+    '''
+    if callable(bus):
+        return bus(i2c_device)
+    if not isinstance(bus, str):
+        return bus
+    if bus == "sim":
+        # the simulator is only loaded when it is used
+        from mupihat_sim import SimulatedBQ25792
+        return SimulatedBQ25792(i2c_device)
+    if bus == "auto":
+        try:
+            return I2CRdwrBus(i2c_device)
+        except OSError as _error:
+            logging.info("I2C_RDWR not available, using SMBus, %s", str(_error))
+            return SMBusBus(i2c_device)
+    if bus not in BUSES:
+        raise ValueError("unknown bus %r, expected one of auto, sim, %s" % (bus, ", ".join(BUSES)))
+    return BUSES[bus](i2c_device)
@@ -0,0 +1,460 @@
+#!/usr/bin/python3
+""" Module mupihat_dump.py, classes: DumpWriter, DumpReader
+Raw register dump of the BQ25792 for field debugging: captures the complete
+73 byte register file at a chosen rate into a compact binary file, and decodes
+such a file offline, without hardware, into the to_json() / to_json_registers()
+views of bq25792.
+
+The capture opens the bus once and only imports the driver (no Flask, no numpy),
+it only reads registers and does not change the charger configuration.
+Note: the flag registers REG22 - REG27 are cleared on read, stop the service
+during a capture or leave out the flags group (-g).
+
+File (little endian)
+--------------------
+header (32 bytes)
+  magic        8s  b"MUPIDMP\\0"
+  version      H   1
+  record_size  H   77
+  i2c_device   B   I2C bus of the charger
+  i2c_addr     B   I2C address of the charger
+  conf_size    H   length of the battery configuration
+  base_time    d   Unix time of the capture start
+  reserved     8x
+battery configuration of the charger, conf_size bytes JSON
+chunks, one every flush_s
+  records      I   number of records
+  size         I   size of the compressed data
+  data             zlib compressed, byte-shuffled records
+
+record (77 bytes)
+  ms           I   ms since the previous record (first record: since base_time), monotonic clock
+  raw          73s REG00 - REG48
+
+The records of a chunk are stored byte-plane by byte-plane (the first byte of
+all records, then the second, ...), so the registers that do not change compress
+to almost nothing. 10 Hz take about 3 kB per minute instead of 46 kB uncompressed.
+DumpReader decodes a file with numpy into column arrays, every bitfield of all
+samples at once (numpy: python3-numpy, installed by install.sh; capture needs only
+the standard library).
+
+Call
+-------
+mupihat-dump capture /tmp/mupihat.dump --rate 10 --duration 3600
+mupihat-dump decode /tmp/mupihat.dump --view json > mupihat.jsonl
+mupihat-dump decode /tmp/mupihat.dump --fields VBAT_ADC IBAT_ADC CHG_STAT_STRG > charge.csv
+(mupihat-dump is installed by install.sh, same as python3 -B mupihat_dump.py)
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import argparse
+import json
+import logging
+import os
+import signal
+import struct
+import sys
+import time
+import zlib
+
+import mupihat_registers as registers
+
+MAGIC = b"MUPIDMP\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHBBHd8x")
+CHUNK = struct.Struct("<II")
+RECORD = struct.Struct("<I%ds" % registers.REGISTER_FILE_SIZE)
+
+# a chunk is written every FLUSH_S or after CHUNK_RECORDS records
+FLUSH_S = 60
+CHUNK_RECORDS = 4096
+LEVEL = 6
+
+VIEWS = ("json", "registers", "raw")
+
+
+class DumpError(Exception):
+    """Custom exception for invalid register dump files."""
+    pass
+
+
+class DumpWriter:
+    """
+    Writer of a register dump file, one record per append().
+
+    Parameters
+    ----------
+    path : str
+        path of the dump file, an existing file is replaced.
+    i2c_device, i2c_addr : int
+        bus and address of the charger, stored in the header.
+    battery_conf : dict
+        battery configuration of the charger, stored in the header for Bat_SOC / Bat_Stat.
+    flush_s : float
+        maximal time in s a record stays in the buffer (default: 60).
+
+    Attributes
+    ----------
+    records : int
+        number of written records.
+    """
+    def __init__(self, path, i2c_device=1, i2c_addr=0x6b, battery_conf=None, flush_s=FLUSH_S):
+        self.path = path
+        self.flush_s = flush_s
+        self.records = 0
+        conf = json.dumps(battery_conf or {}, separators=(",", ":")).encode("utf-8")
+        self.base_time = time.time()
+        self._base_monotonic = time.monotonic()
+        self._last_ms = 0
+        self._chunk = bytearray()
+        self._chunk_records = 0
+        self._chunk_start = self._base_monotonic
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, i2c_device, i2c_addr, len(conf), self.base_time))
+        self._file.write(conf)
+        self._file.flush()
+
+    def append(self, snapshot):
+        '''
+        Appends the register image of a RegisterSnapshot, taken at snapshot.monotonic.
+        '''
+        ms = max(self._last_ms, round((snapshot.monotonic - self._base_monotonic) * 1000))
+        self._chunk += RECORD.pack(ms - self._last_ms, snapshot.raw)
+        self._last_ms = ms
+        self._chunk_records += 1
+        self.records += 1
+        if self._chunk_records >= CHUNK_RECORDS or time.monotonic() - self._chunk_start >= self.flush_s:
+            self.flush()
+
+    def flush(self):
+        ''' writes the buffered records as one compressed chunk '''
+        self._chunk_start = time.monotonic()
+        if not self._chunk_records:
+            return
+        size = RECORD.size
+        chunk = bytes(self._chunk)
+        data = zlib.compress(b"".join(chunk[i::size] for i in range(size)), LEVEL)
+        self._file.write(CHUNK.pack(self._chunk_records, len(data)))
+        self._file.write(data)
+        self._file.flush()
+        self._chunk = bytearray()
+        self._chunk_records = 0
+
+    def tell(self):
+        ''' bytes written to the file so far '''
+        return self._file.tell()
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+
+class DumpReader:
+    """
+    Reader of a register dump file (requires numpy).
+    Raises ImportError if numpy is not installed, DumpError for an invalid file.
+
+    Attributes
+    ----------
+    i2c_device, i2c_addr : int
+        bus and address of the charger.
+    base_time : float
+        Unix time of the capture start.
+    battery_conf : dict
+        battery configuration of the charger at the capture.
+    """
+    def __init__(self, path):
+        import numpy
+        self.np = numpy
+        self.path = path
+        with open(path, "rb") as infile:
+            self._data = infile.read()
+        if len(self._data) < HEADER.size:
+            raise DumpError("%s: file too short" % path)
+        magic, version, record_size, self.i2c_device, self.i2c_addr, conf_size, self.base_time = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise DumpError("%s: no MuPiHAT register dump" % path)
+        if version != VERSION or record_size != RECORD.size:
+            raise DumpError("%s: unsupported dump version %d, record size %d" % (path, version, record_size))
+        self._offset = HEADER.size + conf_size
+        self.battery_conf = json.loads(self._data[HEADER.size:self._offset].decode("utf-8"))
+
+    def read(self, start=None, end=None):
+        '''
+        Returns (ts, raw) of the samples from Unix time start to end (default: all),
+        ts the Unix times as float array, raw the register images as (n, 73) uint8 array.
+        An incomplete last chunk is ignored.
+        '''
+        np = self.np
+        data, offset, size = self._data, self._offset, RECORD.size
+        planes = []
+        while offset + CHUNK.size <= len(data):
+            records, length = CHUNK.unpack_from(data, offset)
+            offset += CHUNK.size
+            try:
+                chunk = zlib.decompress(data[offset:offset + length])
+            except zlib.error as _error:
+                logging.warning("%s: chunk at %d skipped, %s", self.path, offset, str(_error))
+                break
+            if len(chunk) != records * size:
+                logging.warning("%s: chunk at %d skipped, size mismatch", self.path, offset)
+                break
+            planes.append(np.frombuffer(chunk, np.uint8).reshape(size, records))
+            offset += length
+        if not planes:
+            return np.empty(0), np.empty((0, registers.REGISTER_FILE_SIZE), np.uint8)
+        records = np.concatenate(planes, axis=1).T
+        ms = np.cumsum(np.ascontiguousarray(records[:, :4]).view("<u4").ravel(), dtype=np.int64)
+        ts = self.base_time + ms / 1000.0
+        lo = 0 if start is None else np.searchsorted(ts, start, "left")
+        hi = len(ts) if end is None else np.searchsorted(ts, end, "right")
+        return ts[lo:hi], records[lo:hi, 4:]
+
+
+def _register_values(np, raw, reg):
+    ''' raw register values of reg of all samples, 16 bit registers msb first '''
+    if reg.size == 2:
+        return (raw[:, reg.addr].astype(np.int32) << 8) | raw[:, reg.addr + 1]
+    return raw[:, reg.addr].astype(np.int32)
+
+
+def _decode_field(np, values, f, string=False):
+    ''' as mupihat_registers.decode_field for an array of raw register values, or the strings of the codes '''
+    code = (values & f.mask) >> f.shift
+    if string:
+        table = np.array(list(f.strings) + ["unknown"], dtype=object)
+        return table[np.minimum(code, len(f.strings))]
+    if f.signed:
+        code = np.where(code >> (f.bits - 1), code - (1 << f.bits), code)
+    if f.step != 1 or f.offset:
+        return code * f.step + f.offset
+    return code
+
+
+def decode_fields(raw, names):
+    '''
+    Returns {name: array} of the bitfields (e.g. "VBAT_ADC") or their strings (e.g. "CHG_STAT_STRG")
+    of all samples of raw, see RegisterSnapshot.value(). Raises KeyError for an unknown name.
+    '''
+    import numpy as np
+    columns = {}
+    for name in names:
+        reg, f = registers.FIELDS_BY_NAME[name]
+        columns[name] = _decode_field(np, _register_values(np, raw, reg), f, string=name != f.name)
+    return columns
+
+
+def battery_soc(vbat, battery_conf):
+    ''' as bq25792.battery_soc for an array of battery voltages, returns (Bat_SOC, Bat_Stat) arrays '''
+    import numpy as np
+    conf = battery_conf
+    soc = np.select([vbat > conf["v_100"], vbat > conf["v_75"], vbat > conf["v_50"], vbat > conf["v_25"], vbat > conf["v_0"]],
+                    ["100%", "75%", "50%", "25%", "0%"], "").astype(object)
+    stat = np.select([vbat > conf["th_warning"], (vbat < conf["th_warning"]) & (vbat > conf["th_shutdown"]), vbat < conf["th_shutdown"]],
+                     ["OK", "LOW", "SHUTDOWN"], "").astype(object)
+    return soc, stat
+
+
+def to_json(raw, battery_conf):
+    '''
+    Returns the columns of bq25792.to_json() of all samples of raw, {key: array}.
+    '''
+    values = decode_fields(raw, ("CHG_STAT_STRG", "VBAT_ADC", "VBUS_ADC", "IBAT_ADC", "IBUS_ADC",
+                                 "TemperatureIC", "VBAT_PRESENT_STAT", "ICO_ILIM"))
+    bat_soc, bat_stat = battery_soc(values["VBAT_ADC"], battery_conf)
+    return {
+        'Charger_Status': values["CHG_STAT_STRG"],
+        'Vbat': values["VBAT_ADC"],
+        'Vbus': values["VBUS_ADC"],
+        'Ibat': values["IBAT_ADC"],
+        'IBus': values["IBUS_ADC"],
+        'Temp': values["TemperatureIC"],
+        'BatteryConnected': values["VBAT_PRESENT_STAT"],
+        'Bat_SOC': bat_soc,
+        'Bat_Stat': bat_stat,
+        'Bat_Type': battery_conf.get('battery_type'),
+        'Input_Current_Limit': values["ICO_ILIM"],
+    }
+
+
+def to_json_registers(raw, battery_conf):
+    '''
+    Returns the columns of bq25792.to_json_registers() of all samples of raw,
+    {register name: {bitfield: array}, "battery_conf": battery_conf}.
+    '''
+    import numpy as np
+    result = {}
+    for reg in registers.REGISTERS:
+        values = _register_values(np, raw, reg)
+        out = {}
+        for f in reg.fields:
+            out[f.name] = _decode_field(np, values, f)
+            if f.strings is not None:
+                out[f.strg] = _decode_field(np, values, f, string=True)
+        result[reg.name] = out
+    result["battery_conf"] = battery_conf
+    return result
+
+
+def rows(columns, count):
+    '''
+    Returns the list of count row dicts of the columns of to_json() / to_json_registers(),
+    with plain Python values. A value that is no array is the same in every row.
+    '''
+    def listed(value):
+        return value.tolist() if hasattr(value, "tolist") else [value] * count
+
+    keys, lists = [], []
+    for key, value in columns.items():
+        if isinstance(value, dict) and value and all(hasattr(v, "tolist") for v in value.values()):
+            names = list(value)
+            lists.append([dict(zip(names, row)) for row in zip(*(listed(v) for v in value.values()))])
+        else:
+            lists.append(listed(value))
+        keys.append(key)
+    return [dict(zip(keys, row)) for row in zip(*lists)]
+
+
+def capture(hat, writer, rate_hz, count=None, duration_s=None, groups=None):
+    '''
+    Reads the registers of hat rate_hz times per second and appends them to writer,
+    until count samples or duration_s passed (default: until interrupted).
+    The first sample reads all registers, the following the register groups (default: all).
+    Returns (samples, errors, late).
+    '''
+    period_s = 1.0 / rate_hz
+    samples = errors = late = 0
+    started = deadline = time.monotonic()
+    snapshot = hat.read_all_register()
+    while True:
+        if snapshot == -1:
+            errors += 1
+        else:
+            writer.append(snapshot)
+            samples += 1
+        if count is not None and samples >= count:
+            break
+        deadline += period_s
+        now = time.monotonic()
+        if duration_s is not None and deadline - started >= duration_s:
+            break
+        if deadline < now:
+            late += 1
+            deadline = now  # late, continue from now instead of catching up
+        time.sleep(deadline - now)
+        if samples == 0 or groups is None:
+            snapshot = hat.read_all_register()
+        else:
+            snapshot = hat.read_registers(groups)
+    return samples, errors, late
+
+
+def parse_arguments():
+    """Parses command-line arguments using argparse."""
+    parser = argparse.ArgumentParser(description="MuPiHAT raw register dump")
+    commands = parser.add_subparsers(dest="command", required=True)
+    parser_capture = commands.add_parser("capture", help="Capture the registers into a dump file")
+    parser_capture.add_argument("file", type=str, help="Dump file, replaced if it exists")
+    parser_capture.add_argument("-r", "--rate", type=float, default=10.0, help="Samples per second")
+    parser_capture.add_argument("-d", "--duration", type=float, help="Capture duration in s (default: until Ctrl-C)")
+    parser_capture.add_argument("-n", "--count", type=int, help="Number of samples")
+    parser_capture.add_argument("-g", "--groups", type=str, nargs="+", choices=list(registers.REGISTER_GROUPS),
+                                help="Register groups read after the first sample (default: all)")
+    parser_capture.add_argument("-b", "--bus", type=str, choices=["auto", "rdwr", "smbus", "sim"], default="auto", help="I2C bus backend")
+    parser_capture.add_argument("--i2c-bus", type=int, default=1, help="I2C bus of the charger, /dev/i2c-<n>")
+    parser_capture.add_argument("--i2c-addr", type=lambda value: int(value, 0), default=0x6b, help="I2C address of the charger")
+    parser_capture.add_argument("-c", "--config", type=str, default="/etc/mupihat/mupihatconfig.json", help="Battery config (Json) file")
+    parser_decode = commands.add_parser("decode", help="Decode a dump file, without hardware")
+    parser_decode.add_argument("file", type=str, help="Dump file")
+    parser_decode.add_argument("--view", type=str, choices=VIEWS, help="Print every sample as JSON line: json (/api/data), registers (/api/registers) or raw (hex)")
+    parser_decode.add_argument("--fields", type=str, nargs="+", help="Print the bitfields as CSV, e.g. VBAT_ADC CHG_STAT_STRG")
+    parser_decode.add_argument("--since", type=float, help="Start, Unix time")
+    parser_decode.add_argument("--until", type=float, help="End, Unix time")
+    return parser.parse_args()
+
+
+def on_sigterm(signum, frame):
+    ''' SIGTERM ends a capture like Ctrl-C, the buffered records are written '''
+    raise KeyboardInterrupt()
+
+
+def main_capture(args):
+    from mupihat_bq25792 import bq25792
+    signal.signal(signal.SIGTERM, on_sigterm)
+    hat = bq25792(i2c_device=args.i2c_bus, i2c_addr=args.i2c_addr, battery_conf_file=args.config, bus=args.bus)
+    writer = DumpWriter(args.file, args.i2c_bus, args.i2c_addr, hat.battery_conf)
+    try:
+        samples, errors, late = capture(hat, writer, args.rate, args.count, args.duration, args.groups)
+    except KeyboardInterrupt:
+        samples, errors, late = writer.records, hat.i2c_errors, 0
+    finally:
+        writer.close()
+    elapsed_min = max(time.time() - writer.base_time, 1e-3) / 60
+    size = os.path.getsize(args.file)
+    print("%d samples, %d read errors, %d late, %d bytes (%.1f kB/min)" % (
+        samples, errors, late, size, size / 1024 / elapsed_min))
+
+
+def main_decode(args):
+    try:
+        reader = DumpReader(args.file)
+    except ImportError as _error:
+        logging.error("MuPiHAT dump: decode requires numpy (apt install python3-numpy), %s", str(_error))
+        sys.exit(1)
+    except (OSError, DumpError) as _error:
+        logging.error("MuPiHAT dump: %s", str(_error))
+        sys.exit(1)
+    ts, raw = reader.read(args.since, args.until)
+    out = sys.stdout
+    if args.fields:
+        columns = decode_fields(raw, args.fields)
+        out.write(",".join(["ts"] + args.fields) + "\n")
+        for row in zip(ts.tolist(), *(columns[name].tolist() for name in args.fields)):
+            out.write("%.3f," % row[0] + ",".join(str(value) for value in row[1:]) + "\n")
+    elif args.view == "raw":
+        for t, image in zip(ts.tolist(), raw):
+            out.write(json.dumps({"time": round(t, 3), "raw": image.tobytes().hex()}) + "\n")
+    elif args.view:
+        view = to_json if args.view == "json" else to_json_registers
+        for t, row in zip(ts.tolist(), rows(view(raw, reader.battery_conf), len(ts))):
+            row["time"] = round(t, 3)
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    elif len(ts):
+        print("%d samples of %d:0x%02x, %s - %s (%.1f s)" % (
+            len(ts), reader.i2c_device, reader.i2c_addr, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts[0])),
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts[-1])), ts[-1] - ts[0]))
+    else:
+        print("no samples")
+
+
+def main():
+    args = parse_arguments()
+    if args.command == "capture":
+        main_capture(args)
+    else:
+        main_decode(args)
+
+
+if __name__ == "__main__":
+    main()
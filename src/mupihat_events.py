@@ -0,0 +1,238 @@
+#!/usr/bin/python3
+""" Module mupihat_events.py, interrupt driven event mode of the BQ25792
+The BQ25792 pulls its open drain INT pin low for 256 µs when an unmasked flag
+(REG22 - REG27) is set. ChargerEvents waits for the falling edge on a GPIO line,
+reads only the flag registers and dispatches the set flags to the handlers,
+instead of polling the charger blindly.
+
+Lines
+-----
+GpiodLine : GPIO line of a gpiochip, via libgpiod (python3-libgpiod, v1 and v2 API),
+            also works with a gpio-sim chip of the kernel
+FakeLine  : in-memory line for tests, trigger() simulates an INT pulse
+            (e.g. SimulatedBQ25792(int_line=FakeLine()))
+
+Usage
+-----
+events = ChargerEvents(hat, GpiodLine("/dev/gpiochip0", 6))
+events.add_handler(lambda flags, snapshot: print(flags))
+events.start()
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import logging
+import threading
+import time
+
+# flags that pulse the INT pin in event mode: plug / unplug, charge state,
+# battery, temperature, watchdog and all faults
+DEFAULT_FLAGS = (
+    "WD_FLAG",
+    "PG_FLAG",
+    "VAC2_PRESENT_FLAG",
+    "VAC1_PRESENT_FLAG",
+    "VBUS_PRESENT_FLAG",
+    "CHG_FLAG",
+    "VBAT_PRESENT_FLAG",
+    "TS_COLD_FLAG",
+    "TS_HOT_FLAG",
+    "VBUS_OVP_FLAG",
+    "VBAT_OVP_FLAG",
+    "IBUS_OCP_FLAG",
+    "IBAT_OCP_FLAG",
+    "CONV_OCP_FLAG",
+    "VAC2_OVP_FLAG",
+    "VAC1_OVP_FLAG",
+    "VSYS_SHORT_FLAG",
+    "VSYS_OVP_FLAG",
+    "OTG_OVP_FLAG",
+    "OTG_UVP_FLAG",
+    "TSHUT_FLAG",
+)
+
+
+class GpiodLine:
+    """
+    Falling edge events of a GPIO line via libgpiod, with pull-up bias for the open drain INT pin.
+    Raises ImportError if the gpiod module is not installed, OSError if the line can not be requested.
+    """
+    def __init__(self, chip="/dev/gpiochip0", line=0, consumer="mupihat"):
+        import gpiod
+        self.chip = None
+        if hasattr(gpiod, "request_lines"):
+            # libgpiod v2
+            from gpiod.line import Bias, Edge
+            settings = gpiod.LineSettings(edge_detection=Edge.FALLING, bias=Bias.PULL_UP)
+            self.request = gpiod.request_lines(chip, consumer=consumer, config={line: settings})
+            self._wait = self.request.wait_edge_events
+            self._read = self.request.read_edge_events
+        else:
+            # libgpiod v1
+            self.chip = gpiod.Chip(chip)
+            self.request = self.chip.get_line(line)
+            self.request.request(consumer=consumer, type=gpiod.LINE_REQ_EV_FALLING_EDGE,
+                                 flags=getattr(gpiod, "LINE_REQ_FLAG_BIAS_PULL_UP", 0))
+            self._wait = lambda timeout_s: self.request.event_wait(sec=int(timeout_s), nsec=int(timeout_s % 1 * 1e9))
+            self._read = self.request.event_read
+
+    def wait_edge(self, timeout_s):
+        '''
+        Waits up to timeout_s for falling edges, returns True if there was at least one.
+        '''
+        if not self._wait(timeout_s):
+            return False
+        self._read()
+        return True
+
+    def close(self):
+        self.request.release()
+        if self.chip is not None:
+            self.chip.close()
+
+
+class FakeLine:
+    """
+    In-memory line for tests, trigger() simulates a falling edge.
+    edges counts the triggered edges.
+    """
+    def __init__(self):
+        self.edges = 0
+        self._event = threading.Event()
+
+    def trigger(self):
+        self.edges += 1
+        self._event.set()
+
+    def wait_edge(self, timeout_s):
+        if not self._event.wait(timeout_s):
+            return False
+        self._event.clear()
+        return True
+
+    def close(self):
+        pass
+
+
+class ChargerEvents:
+    """
+    Event mode of a bq25792: unmasks the interrupts of flags, waits for INT on line in a
+    background thread and dispatches the set flags to the handlers.
+
+    Parameters
+    ----------
+    hat : bq25792
+        charger driver.
+    line : GpiodLine or FakeLine
+        GPIO line connected to the INT pin.
+    flags : tuple
+        flags that pulse the INT pin (default: DEFAULT_FLAGS).
+
+    Attributes
+    ----------
+    interrupts : int
+        number of handled INT pulses.
+    """
+    def __init__(self, hat, line, flags=DEFAULT_FLAGS):
+        self.hat = hat
+        self.line = line
+        self.flags = tuple(flags)
+        self.interrupts = 0
+        self._handlers = []
+        self._seen = {}
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_handler(self, handler, flags=None):
+        '''
+        Adds handler(flags, snapshot), called with the list of set flags (only the ones
+        in flags, if given) and the snapshot holding them.
+        '''
+        self._handlers.append((handler, None if flags is None else frozenset(flags)))
+
+    def start(self):
+        '''
+        Unmasks the interrupts (kept by write_defaults()), clears stale flags and starts the event thread.
+        Returns 0, -1 if the charger could not be configured.
+        '''
+        self.hat.interrupt_flags = self.flags
+        if self.hat.unmask_interrupts(self.flags) == -1 or self.hat.read_flags() == -1:
+            return -1
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mupihat-events", daemon=True)
+        self._thread.start()
+        return 0
+
+    def stop(self):
+        '''
+        Stops the event thread and releases the line.
+        '''
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.line.close()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.line.wait_edge(1.0):
+                self.handle_interrupt()
+
+    def handle_interrupt(self):
+        '''
+        Reads the flag registers and dispatches the set flags.
+        Returns the list of set flags, -1 if the read failed.
+        '''
+        result = self.hat.read_flags(with_snapshot=True)
+        if result == -1:
+            return -1
+        # the snapshot of this read, the poll thread may have published a newer one
+        flags, snapshot = result
+        if not flags:
+            return flags
+        with self._condition:
+            self.interrupts += 1
+            now = time.monotonic()
+            for flag in flags:
+                self._seen[flag] = now
+            self._condition.notify_all()
+        logging.info("charger event: %s", ", ".join(flags))
+        for handler, wanted in self._handlers:
+            selected = flags if wanted is None else [flag for flag in flags if flag in wanted]
+            if not selected:
+                continue
+            try:
+                handler(selected, snapshot)
+            except Exception as e:
+                logging.error("charger event handler failed: %s", str(e))
+        return flags
+
+    def wait_event(self, flag, timeout_s, since=None):
+        '''
+        Waits up to timeout_s until flag is dispatched after the monotonic time since
+        (default: now), e.g. as wait_done of bq25792.read_adc_oneshot() for "ADC_DONE_FLAG".
+        Returns True if the flag was seen.
+        '''
+        if since is None:
+            since = time.monotonic()
+        with self._condition:
+            return self._condition.wait_for(lambda: self._seen.get(flag, -1.0) >= since, timeout_s)
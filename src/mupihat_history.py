@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+""" Module mupihat_history.py, class: TelemetryRing
+Fixed-capacity in-memory history of the charger telemetry for /api/history.
+
+Every sample is stored in typed array columns (no dict per sample), 23 bytes
+per sample: 24 h at 1 Hz take 1.99 MB, 24 h of the 5 s service poll 0.4 MB.
+
+Columns
+-------
+ts       : time of the read (deciseconds on the monotonic clock, returned as Unix time)
+VBAT     : battery voltage in mV
+IBAT     : battery current in mA (negative when discharging)
+VBUS     : bus voltage in mV
+IBUS     : bus current in mA
+VSYS     : system voltage in mV
+TDIE     : charger IC temperature in °C (0.5 °C resolution)
+CHG_STAT : charger status code (REG1C CHG_STAT)
+flags    : flags set in REG22 - REG27, returned as list of names
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import threading
+import time
+from array import array
+
+import mupihat_registers as registers
+
+# (column, array typecode, bitfield, scale of the returned value)
+COLUMNS = (
+    ("VBAT", "H", "VBAT_ADC", 1),
+    ("IBAT", "h", "IBAT_ADC", 1),
+    ("VBUS", "H", "VBUS_ADC", 1),
+    ("IBUS", "h", "IBUS_ADC", 1),
+    ("VSYS", "H", "VSYS_ADC", 1),
+    ("TDIE", "h", "TDIE_ADC", 0.5),
+    ("CHG_STAT", "B", "CHG_STAT", 1),
+)
+FIELDS = tuple(column[0] for column in COLUMNS) + ("flags",)
+
+# flag registers REG22 - REG27, stored as raw bytes
+FLAGS_START, FLAGS_LENGTH = registers.REGISTER_GROUPS["flags"][0]
+
+# (byte offset in the flag registers, bit mask, name) of every flag
+FLAG_BITS = tuple((registers.FIELDS_BY_NAME[flag][0].addr - FLAGS_START, registers.FIELDS_BY_NAME[flag][1].mask, flag)
+                  for flag in registers.FLAGS)
+
+# resolution of the stored time stamps in s
+TS_RESOLUTION_S = 0.1
+# time window of a query without since in s
+DEFAULT_WINDOW_S = 3600
+
+
+class TelemetryRing:
+    """
+    Ring buffer of the last capacity samples, the oldest sample is overwritten.
+
+    Parameters
+    ----------
+    capacity : int
+        number of samples, e.g. retention 24 h / poll period.
+    """
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1, got %d" % capacity)
+        self.capacity = capacity
+        self.count = 0
+        self._head = 0  # next index to write
+        self._epoch = time.monotonic()
+        self._ts = array("I", bytes(4 * capacity))
+        self._columns = {name: array(typecode, bytes(array(typecode).itemsize * capacity))
+                         for name, typecode, _, _ in COLUMNS}
+        self._flags = bytearray(FLAGS_LENGTH * capacity)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        ''' memory of the sample columns in bytes '''
+        return (self._ts.itemsize * self.capacity + len(self._flags)
+                + sum(column.itemsize * self.capacity for column in self._columns.values()))
+
+    def append(self, snapshot):
+        '''
+        Appends the sample of a RegisterSnapshot.
+        '''
+        ts = max(0, round((snapshot.monotonic - self._epoch) / TS_RESOLUTION_S))
+        values = [(self._columns[name], snapshot.value(field)) for name, _, field, _ in COLUMNS]
+        with self._lock:
+            i = self._head
+            self._ts[i] = ts
+            for column, value in values:
+                column[i] = value
+            self._flags[i * FLAGS_LENGTH:(i + 1) * FLAGS_LENGTH] = snapshot.raw[FLAGS_START:FLAGS_START + FLAGS_LENGTH]
+            self._head = (i + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def _first_after(self, oldest, ts):
+        ''' number of samples (from oldest) with a time stamp before ts, by bisection '''
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ts[(oldest + mid) % self.capacity] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def _slice(column, start, end):
+        ''' copy of the ring column entries start to end (end may wrap) '''
+        if end <= len(column):
+            return column[start:end]
+        return column[start:] + column[:end - len(column)]
+
+    def query(self, since=None, fields=FIELDS):
+        '''
+        Returns the samples since the Unix time since (default: the last DEFAULT_WINDOW_S)
+        as columns {"ts": [...], field: [...], ...}, oldest first.
+        Raises ValueError for an unknown field.
+        '''
+        unknown = [field for field in fields if field not in FIELDS]
+        if unknown:
+            raise ValueError("unknown history field %s, expected %s" % (", ".join(unknown), ", ".join(FIELDS)))
+        # the time stamps are monotonic, the current offset converts them to Unix time
+        now = time.time()
+        to_wall = now - time.monotonic() + self._epoch
+        if since is None:
+            since = now - DEFAULT_WINDOW_S
+        # only the raw columns are copied under the lock, append() is not blocked by the conversion
+        with self._lock:
+            oldest = (self._head - self.count) % self.capacity
+            skip = self._first_after(oldest, (since - to_wall) / TS_RESOLUTION_S)
+            start = (oldest + skip) % self.capacity
+            end = start + self.count - skip
+            ts = self._slice(self._ts, start, end)
+            columns = {name: self._slice(self._columns[name], start, end)
+                       for name, _, _, _ in COLUMNS if name in fields}
+            raw_flags = self._slice(self._flags, start * FLAGS_LENGTH, end * FLAGS_LENGTH) if "flags" in fields else None
+        result = {"ts": [round(to_wall + value * TS_RESOLUTION_S, 1) for value in ts]}
+        for name, _, _, scale in COLUMNS:
+            if name in columns:
+                values = columns[name].tolist()
+                result[name] = values if scale == 1 else [value * scale for value in values]
+        if raw_flags is not None:
+            flags, decoded = [], {}
+            for i in range(0, len(raw_flags), FLAGS_LENGTH):
+                raw = bytes(raw_flags[i:i + FLAGS_LENGTH])
+                if raw not in decoded:
+                    decoded[raw] = set_flags(raw)
+                flags.append(decoded[raw])
+            result["flags"] = flags
+        return result
+
+
+def set_flags(raw):
+    '''
+    Returns the names of the flags set in the flag register bytes raw (REG22 - REG27).
+    '''
+    return [name for offset, mask, name in FLAG_BITS if raw[offset] & mask]
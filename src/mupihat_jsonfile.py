@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+""" Module mupihat_jsonfile.py, class: AtomicJsonFile
+Atomic, change-aware writer of the MuPiHAT status file (e.g. /tmp/mupihat.json).
+
+- the JSON is written to a temporary file in the same directory and renamed over
+  the status file (os.replace), readers like jq never see a truncated file
+- the file is only rewritten if the payload changed
+- every written payload carries "seq", increasing with every write (also across
+  restarts of the service), so consumers can detect fresh data cheaply
+
+Usage
+-----
+writer = AtomicJsonFile("/tmp/mupihat.json")
+writer.write(hat.to_json())   # True if the file was written
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import json
+import os
+import tempfile
+
+
+class AtomicJsonFile:
+    """
+    Writes a dict as JSON file, atomically and only on change.
+
+    Parameters
+    ----------
+    path : str
+        path of the JSON file.
+    indent : int
+        pretty-print indentation, None for compact JSON (default).
+    mode : int
+        file permissions (default: 0o644, readable for the consumers).
+
+    Attributes
+    ----------
+    seq : int
+        "seq" of the last written payload, continued from an existing file.
+    writes : int
+        number of written files.
+    skipped : int
+        number of writes skipped because the payload did not change.
+    """
+    def __init__(self, path, indent=None, mode=0o644):
+        self.path = path
+        self.indent = indent
+        self.mode = mode
+        self.seq = self._last_seq()
+        self.writes = 0
+        self.skipped = 0
+        self._last = None
+
+    def _last_seq(self):
+        ''' seq of an existing file, 0 if there is none '''
+        try:
+            with open(self.path) as infile:
+                seq = json.load(infile).get("seq", 0)
+            return seq if isinstance(seq, int) else 0
+        except (OSError, ValueError, AttributeError):
+            return 0
+
+    def _dumps(self, data):
+        if self.indent is None:
+            return json.dumps(data, separators=(",", ":"))
+        return json.dumps(data, indent=self.indent)
+
+    def write(self, data):
+        '''
+        Writes data with the next "seq" if it differs from the last written data.
+        Returns True if the file was written, False if it was unchanged.
+        Raises OSError if the file could not be written.
+        '''
+        payload = self._dumps(data)
+        if payload == self._last:
+            self.skipped += 1
+            return False
+        seq = self.seq + 1
+        body = self._dumps(dict(data, seq=seq)).encode()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(self.path) + ".")
+        try:
+            with os.fdopen(fd, "wb") as outfile:
+                os.fchmod(outfile.fileno(), self.mode)
+                outfile.write(body)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.seq = seq
+        self.writes += 1
+        self._last = payload
+        return True
@@ -0,0 +1,223 @@
+#!/usr/bin/python3
+""" Load test of the MuPiHAT web API against the simulated BQ25792
+The web API (mupihat.app) runs with the I2C poller in a server process, as in the
+service, on the simulated bus. Concurrent keep-alive clients in this process request
+the API and the latency per request and the delay of the poller are reported.
+
+Parameters
+----------
+-c <clients> : int
+    Concurrent clients (default: 20)
+-d <seconds> : float
+    Duration of the test (default: 10)
+-s <server> : str
+    HTTP server: auto, waitress or dev (default: auto)
+--threads <n> : int
+    Worker threads of the waitress server
+--path <path> : str
+    Requested path (default: /api/registers)
+--etag : send If-None-Match, as a polling dashboard does
+--max-p99-ms <ms> : float
+    Exit code 1 if the p99 latency is above
+--json : print the results as JSON
+
+Call
+-------
+python3 -B mupihat_loadtest.py -c 20 -s waitress
+python3 -B mupihat_loadtest.py -c 20 -s dev
+
+Returns
+-------
+exit code 0, 1 if requests failed or the p99 latency is above --max-p99-ms
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import threading
+import time
+from collections import Counter
+
+from mupihat_server import DEFAULT_THREADS, SERVERS
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "mupihatconfig.json")
+
+# poll period of the server process in s, shorter than in the service to load the poller
+POLL_PERIOD_S = 0.5
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def run_server(server_name, threads, ready, stop, results):
+    '''
+    Server process: simulated charger, poller thread and web API.
+    Puts the port into ready and the poller statistics into results when stop is set.
+    '''
+    import mupihat
+    from mupihat_bq25792 import bq25792
+    from mupihat_server import make_server
+    from mupihat_sim import SimulatedBQ25792
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    mupihat.hat = hat = bq25792(battery_conf_file=CONFIG_FILE, bus=SimulatedBQ25792())
+    hat.MuPiHAT_Default()
+    hat.read_all_register()
+    mupihat.cached_registers()
+
+    cycles, delays = [], []
+
+    def poll():
+        scheduled = time.monotonic()
+        while not stop.is_set():
+            start = time.monotonic()
+            delays.append(start - scheduled)
+            hat.watchdog_reset()
+            hat.read_registers()
+            mupihat.cached_registers()
+            cycles.append(time.monotonic() - start)
+            scheduled += POLL_PERIOD_S
+            time.sleep(max(0.0, scheduled - time.monotonic()))
+
+    server = make_server(mupihat.app, server_name, "127.0.0.1", 0, threads)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    poller = threading.Thread(target=poll, daemon=True)
+    poller.start()
+    ready.put((server.port, server.name))
+    stop.wait()
+    poller.join()
+    server.close()
+    cycles.sort()
+    delays.sort()
+    results.put({
+        "polls": len(cycles),
+        "poll_p99_ms": percentile(cycles, 0.99) * 1e3,
+        "poll_delay_p99_ms": percentile(delays, 0.99) * 1e3,
+        "poll_delay_max_ms": delays[-1] * 1e3 if delays else 0.0,
+    })
+
+
+def run_client(port, path, etag, deadline, results):
+    '''
+    One keep-alive client, requests path until deadline.
+    Appends its (latencies, status counter) to results.
+    '''
+    latencies, statuses = [], Counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    headers = {}
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+            if etag and response.getheader("ETag"):
+                headers["If-None-Match"] = response.getheader("ETag")
+        except (OSError, http.client.HTTPException) as _error:
+            status = type(_error).__name__
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+    conn.close()
+    results.append((latencies, statuses))
+
+
+def parse_arguments():
+    """Parses command-line arguments using argparse."""
+    parser = argparse.ArgumentParser(description="MuPiHAT web API load test (simulated BQ25792)")
+    parser.add_argument("-c", "--clients", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("-d", "--duration", type=float, default=10, help="Duration of the test in s")
+    parser.add_argument("-s", "--server", type=str, choices=SERVERS, default="auto", help="HTTP server")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="Worker threads of the waitress server")
+    parser.add_argument("--path", type=str, default="/api/registers", help="Requested path")
+    parser.add_argument("--etag", action="store_true", help="Send If-None-Match with the last ETag")
+    parser.add_argument("--max-p99-ms", type=float, help="Exit code 1 if the p99 latency is above")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    ready, results = multiprocessing.Queue(), multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(target=run_server, args=(args.server, args.threads, ready, stop, results))
+    process.start()
+    port, server_name = ready.get(timeout=60)
+
+    deadline = time.monotonic() + args.duration
+    client_results = []
+    clients = [threading.Thread(target=run_client, args=(port, args.path, args.etag, deadline, client_results))
+               for _ in range(args.clients)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    latencies, statuses = [], Counter()
+    for client_latencies, client_statuses in client_results:
+        latencies += client_latencies
+        statuses += client_statuses
+    stop.set()
+    result = results.get(timeout=60)
+    process.join()
+
+    latencies.sort()
+    errors = sum(n for status, n in statuses.items() if status not in (200, 304))
+    result.update({
+        "server": server_name,
+        "clients": args.clients,
+        "requests": len(latencies),
+        "rps": len(latencies) / args.duration,
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3 if latencies else 0.0,
+        "errors": errors,
+        "statuses": {str(status): n for status, n in statuses.items()},
+    })
+
+    if args.json:
+        print(json.dumps(result, indent=4))
+    else:
+        print("%s, Python %s, %s server, %d clients, %.0f s, GET %s%s" % (
+            platform.machine(), platform.python_version(), server_name, args.clients, args.duration,
+            args.path, " (If-None-Match)" if args.etag else ""))
+        print("requests %d, %.0f req/s, errors %d, status %s" % (
+            result["requests"], result["rps"], errors, ", ".join("%s: %d" % item for item in result["statuses"].items())))
+        print("latency  p50 %.1f ms, p99 %.1f ms, max %.1f ms" % (result["p50_ms"], result["p99_ms"], result["max_ms"]))
+        print("poller   %d polls, cycle p99 %.1f ms, delay p99 %.1f ms, max %.1f ms" % (
+            result["polls"], result["poll_p99_ms"], result["poll_delay_p99_ms"], result["poll_delay_max_ms"]))
+
+    if errors or (args.max_p99_ms is not None and result["p99_ms"] > args.max_p99_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
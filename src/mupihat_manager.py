@@ -0,0 +1,357 @@
+#!/usr/bin/python3
+""" Module mupihat_manager.py, classes: ChargerManager, ChargerDevice
+Polls many BQ25792 chargers on several I2C buses, e.g. a battery qualification
+rig with HATs behind I2C multiplexers (every mux channel is an I2C bus of its
+own, /dev/i2c-<n>).
+
+Every bus has one worker thread, the devices of a bus are read one after the
+other, the start device rotates every cycle (round-robin). The buses are
+polled in parallel, the throughput scales with the number of buses. Each
+device keeps its own snapshot, watchdog and error statistics.
+
+Parameters
+----------
+-d <bus>:<address> : str
+    Device on I2C bus <bus> at address <address>, e.g. 1:0x6b, repeat for every device
+-b <backend> : str
+    I2C bus backend: auto, rdwr, smbus or sim (simulated chargers)
+--period <s> : float
+    Poll period of every device in s (default: 1)
+-p <port> : int
+    HTTP port of the web API (default: 5000)
+
+Web API
+-------
+/api/chargers                           status of all devices
+/api/chargers/summary                   aggregate of all devices
+/api/chargers/<bus>/<address>           status of a device
+/api/chargers/<bus>/<address>/registers all registers of a device
+
+Call
+-------
+python3 -B mupihat_manager.py -d 1:0x6b -d 3:0x6b -d 4:0x6b
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import argparse
+import functools
+import logging
+import sys
+import threading
+import time
+
+from mupihat_bq25792 import bq25792, I2CError
+from mupihat_server import make_server, SERVERS, DEFAULT_THREADS
+from mupihat_watchdog import WatchdogKeeper
+
+# register groups of a poll (see mupihat_registers.REGISTER_GROUPS)
+DEFAULT_GROUPS = ("status", "flags", "adc")
+DEFAULT_PERIOD_S = 1.0
+# CHG_STAT codes of an active charge cycle
+CHARGING = (1, 2, 3, 4, 6)
+
+
+def parse_device(value):
+    '''
+    Returns the key (bus, address) of a device argument "<bus>:<address>", e.g. "1:0x6b".
+    '''
+    bus, sep, addr = value.partition(":")
+    try:
+        return int(bus), int(addr, 0) if sep else 0x6b
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid device %r, expected <bus>:<address>, e.g. 1:0x6b" % value)
+
+
+class ChargerDevice:
+    """
+    One charger of the manager.
+
+    Attributes
+    ----------
+    key : tuple
+        (bus, address)
+    hat : bq25792
+        the driver of the charger.
+    reads, errors : int
+        number of successful and failed polls.
+    last_ok : float
+        monotonic time of the last successful poll, None before.
+    """
+    def __init__(self, key, hat):
+        self.key = key
+        self.hat = hat
+        self.watchdog = None
+        self.reads = 0
+        self.errors = 0
+        self.last_ok = None
+
+    @property
+    def name(self):
+        return "%d:0x%02x" % self.key
+
+    def online(self, max_age_s):
+        ''' True if the last successful poll is younger than max_age_s '''
+        return self.last_ok is not None and time.monotonic() - self.last_ok <= max_age_s
+
+    def status(self, max_age_s):
+        '''
+        Returns the status of the device: bus, address, poll statistics and bq25792.to_json().
+        '''
+        status = {
+            "bus": self.key[0],
+            "address": "0x%02x" % self.key[1],
+            "online": self.online(max_age_s),
+            "age_s": None if self.last_ok is None else round(time.monotonic() - self.last_ok, 3),
+            "reads": self.reads,
+            "errors": self.errors,
+        }
+        status.update(self.hat.to_json())
+        return status
+
+
+class ChargerManager:
+    """
+    Owns the chargers and polls them, one worker thread per I2C bus.
+
+    Parameters
+    ----------
+    devices : iterable
+        keys (bus, address) of the chargers.
+    bus : str
+        bus backend of mupihat_bus: "auto", "rdwr", "smbus" or "sim" (default: "auto").
+    groups : tuple
+        register groups read every poll (default: status, flags, adc).
+    period_s : float
+        poll period of every device in s (default: 1).
+    battery_conf_file : str
+        battery configuration of all chargers.
+    defaults : bool
+        write the MuPiHAT default settings to every charger at the start (default: True).
+
+    Attributes
+    ----------
+    late : dict
+        {bus: number of cycles that took longer than period_s}
+    """
+    def __init__(self, devices, bus="auto", groups=DEFAULT_GROUPS, period_s=DEFAULT_PERIOD_S,
+                 battery_conf_file="/etc/mupibox/mupiboxconfig.json", defaults=True):
+        self.groups = tuple(groups)
+        self.period_s = period_s
+        self.defaults = defaults
+        self.devices = {}
+        if bus == "sim":
+            from mupihat_sim import SimulatedBQ25792
+        for key in devices:
+            if key in self.devices:
+                raise ValueError("device %d:0x%02x given twice" % key)
+            backend = functools.partial(SimulatedBQ25792, i2c_addr=key[1]) if bus == "sim" else bus
+            hat = bq25792(i2c_device=key[0], i2c_addr=key[1], battery_conf_file=battery_conf_file, bus=backend)
+            self.devices[key] = ChargerDevice(key, hat)
+        self.buses = {}
+        for key in self.devices:
+            self.buses.setdefault(key[0], []).append(self.devices[key])
+        self.late = dict.fromkeys(self.buses, 0)
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        '''
+        Starts the worker thread of every bus.
+        '''
+        self._stop.clear()
+        for bus, devices in self.buses.items():
+            thread = threading.Thread(target=self._run, args=(bus, devices), name="mupihat-bus-%d" % bus, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _setup(self, device):
+        '''
+        Default settings and first full read of a device, False if it did not answer.
+        The setup is repeated by the next poll until it succeeded.
+        '''
+        hat = device.hat
+        if self.defaults and hat.MuPiHAT_Default() == -1:
+            return False
+        if hat.read_all_register() == -1:
+            return False
+        device.watchdog = WatchdogKeeper(hat)
+        return True
+
+    def poll(self, device):
+        '''
+        Reads the register groups of a device and kicks its watchdog when due.
+        Returns the new snapshot, -1 if the read failed. A failing device does not
+        stop the polling of the other devices of its bus.
+        '''
+        try:
+            if device.watchdog is None:
+                snapshot = device.hat.snapshot if self._setup(device) else -1
+            else:
+                now = time.monotonic()
+                if device.watchdog.due(now, polling=True):
+                    device.watchdog.kick(now)
+                snapshot = device.hat.read_registers(self.groups)
+        except I2CError as _error:
+            logging.error("charger %s: %s", device.name, str(_error))
+            snapshot = -1
+        except Exception:
+            logging.exception("charger %s: poll failed", device.name)
+            snapshot = -1
+        if snapshot == -1:
+            device.errors += 1
+        else:
+            device.reads += 1
+            device.last_ok = time.monotonic()
+        return snapshot
+
+    def _run(self, bus, devices):
+        ''' worker of one bus, polls its devices round-robin every period_s '''
+        start = 0
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            for i in range(len(devices)):
+                self.poll(devices[(start + i) % len(devices)])
+            # the next cycle starts with the next device, no device is always last
+            start = (start + 1) % len(devices)
+            deadline += self.period_s
+            now = time.monotonic()
+            if deadline < now:
+                self.late[bus] += 1
+                deadline = now
+            self._stop.wait(deadline - now)
+
+    def device(self, key):
+        ''' ChargerDevice of key (bus, address), KeyError if unknown '''
+        return self.devices[key]
+
+    def snapshot(self, key):
+        ''' last RegisterSnapshot of the device key '''
+        return self.devices[key].hat.snapshot
+
+    def status(self):
+        '''
+        Returns the status of all devices, see ChargerDevice.status().
+        '''
+        return [device.status(3 * self.period_s) for device in self.devices.values()]
+
+    def summary(self):
+        '''
+        Returns the aggregate of all devices: device counts, total currents and the battery voltage range.
+        '''
+        online = [device for device in self.devices.values() if device.online(3 * self.period_s)]
+        snapshots = [device.hat.snapshot for device in online]
+        vbat = [snapshot.value("VBAT_ADC") for snapshot in snapshots]
+        return {
+            "devices": len(self.devices),
+            "buses": len(self.buses),
+            "online": len(online),
+            "charging": sum(1 for snapshot in snapshots if snapshot.value("CHG_STAT") in CHARGING),
+            "reads": sum(device.reads for device in self.devices.values()),
+            "errors": sum(device.errors for device in self.devices.values()),
+            "late_cycles": sum(self.late.values()),
+            "IBAT_total": sum(snapshot.value("IBAT_ADC") for snapshot in snapshots),
+            "IBUS_total": sum(snapshot.value("IBUS_ADC") for snapshot in snapshots),
+            "VBAT_min": min(vbat, default=None),
+            "VBAT_max": max(vbat, default=None),
+        }
+
+
+def create_app(manager):
+    '''
+    Returns the Flask app of the web API of manager.
+    '''
+    from flask import Flask, jsonify
+
+    app = Flask(__name__)
+
+    def lookup(bus, address):
+        try:
+            return manager.device((bus, int(address, 0)))
+        except (KeyError, ValueError):
+            return None
+
+    @app.route("/api/chargers")
+    def api_chargers():
+        return jsonify(manager.status())
+
+    @app.route("/api/chargers/summary")
+    def api_summary():
+        return jsonify(manager.summary())
+
+    @app.route("/api/chargers/<int:bus>/<address>")
+    def api_charger(bus, address):
+        device = lookup(bus, address)
+        if device is None:
+            return jsonify({"error": "unknown device %d:%s" % (bus, address)}), 404
+        return jsonify(device.status(3 * manager.period_s))
+
+    @app.route("/api/chargers/<int:bus>/<address>/registers")
+    def api_charger_registers(bus, address):
+        device = lookup(bus, address)
+        if device is None:
+            return jsonify({"error": "unknown device %d:%s" % (bus, address)}), 404
+        return jsonify(device.hat.to_json_registers())
+
+    return app
+
+
+def parse_arguments():
+    """Parses command-line arguments using argparse."""
+    parser = argparse.ArgumentParser(description="MuPiHAT multi-charger manager")
+    parser.add_argument("-d", "--device", type=parse_device, action="append", required=True,
+                        help="Charger as <bus>:<address>, e.g. 1:0x6b, repeat for every charger")
+    parser.add_argument("-b", "--bus", type=str, choices=["auto", "rdwr", "smbus", "sim"], default="auto",
+                        help="I2C bus backend, sim: simulated chargers")
+    parser.add_argument("--period", type=float, default=DEFAULT_PERIOD_S, help="Poll period of every charger in s")
+    parser.add_argument("-c", "--config", type=str, default="/etc/mupihat/mupihatconfig.json", help="Battery config (Json) file")
+    parser.add_argument("-s", "--server", type=str, choices=SERVERS, default="auto", help="HTTP server")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="Worker threads of the waitress server")
+    parser.add_argument("-p", "--port", type=int, default=5000, help="HTTP port of the web API")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    try:
+        manager = ChargerManager(args.device, args.bus, period_s=args.period, battery_conf_file=args.config)
+    except ValueError as e:
+        logging.error("MuPiHAT manager: %s", str(e))
+        sys.exit(1)
+    manager.start()
+    logging.info("MuPiHAT manager: %d chargers on %d buses", len(manager.devices), len(manager.buses))
+    try:
+        server = make_server(create_app(manager), args.server, "0.0.0.0", args.port, args.threads)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("MuPiHAT manager stopped by Keyboard Interrupt")
+    finally:
+        manager.stop()
+
+
+if __name__ == "__main__":
+    main()
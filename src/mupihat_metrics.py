@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+""" Module mupihat_metrics.py, class: Metrics
+Prometheus metrics of the charger and the poller for /metrics.
+
+The exposition text is rendered once per poll from the current snapshot and
+served as cached bytes, a scrape costs the same regardless of the number of
+metrics or scrapers. Only the age of the last successful read is computed per
+scrape.
+
+Metrics
+-------
+mupihat_vbat_volts, mupihat_ibat_amperes, mupihat_vbus_volts, mupihat_ibus_amperes,
+mupihat_vsys_volts, mupihat_tdie_celsius, mupihat_ts_percent     ADC values
+mupihat_charge_state{state}      1 for the current REG1C CHG_STAT, else 0
+mupihat_fault{fault}             fault status of REG20 / REG21
+mupihat_battery_soc_percent      state of charge estimate (battery_soc())
+mupihat_battery_state{state}     OK, LOW, SHUTDOWN
+mupihat_snapshot_generation      generation of the last snapshot
+mupihat_last_success_timestamp_seconds, mupihat_last_success_age_seconds
+mupihat_i2c_errors_total         failed I2C accesses
+mupihat_poll_duration_seconds    histogram of the register reads of a poll
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import threading
+import time
+
+import mupihat_registers as registers
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (metric, help, bitfield, scale to the base unit)
+GAUGES = (
+    ("mupihat_vbat_volts", "Battery voltage", "VBAT_ADC", 0.001),
+    ("mupihat_ibat_amperes", "Battery current, negative when discharging", "IBAT_ADC", 0.001),
+    ("mupihat_vbus_volts", "Bus voltage", "VBUS_ADC", 0.001),
+    ("mupihat_ibus_amperes", "Bus current", "IBUS_ADC", 0.001),
+    ("mupihat_vsys_volts", "System voltage", "VSYS_ADC", 0.001),
+    ("mupihat_tdie_celsius", "Charger IC temperature", "TemperatureIC", 1),
+    ("mupihat_ts_percent", "TS pin voltage in percent of REGN", "TS_ADC", 0.0976563),
+)
+
+# label values of REG1C CHG_STAT
+CHARGE_STATES = ("not_charging", "trickle", "precharge", "fast", "taper", "reserved", "topoff", "done")
+
+# fault status bitfields of REG20 and REG21
+FAULTS = tuple(f.name for addr in (0x20, 0x21) for f in registers.REGISTERS_BY_ADDR[addr].fields)
+
+BATTERY_STATES = ("OK", "LOW", "SHUTDOWN")
+
+# upper bounds of the poll duration histogram in s
+POLL_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _header(lines, name, kind, text):
+    lines.append("# HELP %s %s" % (name, text))
+    lines.append("# TYPE %s %s" % (name, kind))
+
+
+class Metrics:
+    """
+    Poller statistics and the cached exposition text of the last poll.
+    """
+    def __init__(self, buckets=POLL_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # last: +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+        self._cache = (None, None)  # (exposition bytes, monotonic time of the snapshot)
+
+    def observe_poll(self, duration_s):
+        '''
+        Adds the duration of the register reads of a poll to the histogram.
+        '''
+        i = 0
+        while i < len(self.buckets) and duration_s > self.buckets[i]:
+            i += 1
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += duration_s
+
+    def render(self, hat):
+        '''
+        Renders the exposition text of the current snapshot of hat, called once per poll.
+        '''
+        snapshot = hat.snapshot
+        lines = []
+        for name, text, field, scale in GAUGES:
+            _header(lines, name, "gauge", text)
+            lines.append("%s %s" % (name, repr(round(snapshot.value(field) * scale, 4))))
+
+        chg_stat = snapshot.value("CHG_STAT")
+        _header(lines, "mupihat_charge_state", "gauge", "Charger status (REG1C CHG_STAT)")
+        for code, state in enumerate(CHARGE_STATES):
+            lines.append('mupihat_charge_state{state="%s"} %d' % (state, code == chg_stat))
+
+        _header(lines, "mupihat_fault", "gauge", "Fault status (REG20, REG21)")
+        for fault in FAULTS:
+            lines.append('mupihat_fault{fault="%s"} %d' % (fault, snapshot.value(fault)))
+
+        soc, state = hat.battery_soc(snapshot.value("VBAT_ADC"))
+        _header(lines, "mupihat_battery_soc_percent", "gauge", "Battery state of charge estimate")
+        lines.append("mupihat_battery_soc_percent %s" % (soc.rstrip("%") if soc else "NaN"))
+        _header(lines, "mupihat_battery_state", "gauge", "Battery state")
+        for name in BATTERY_STATES:
+            lines.append('mupihat_battery_state{state="%s"} %d' % (name, name == state))
+
+        _header(lines, "mupihat_snapshot_generation", "gauge", "Generation of the last register snapshot")
+        lines.append("mupihat_snapshot_generation %d" % snapshot.generation)
+        _header(lines, "mupihat_last_success_timestamp_seconds", "gauge", "Unix time of the last successful register read")
+        lines.append("mupihat_last_success_timestamp_seconds %.3f" % snapshot.wall)
+        _header(lines, "mupihat_i2c_errors_total", "counter", "Failed I2C accesses")
+        lines.append("mupihat_i2c_errors_total %d" % hat.i2c_errors)
+
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        _header(lines, "mupihat_poll_duration_seconds", "histogram", "Duration of the register reads of a poll")
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), counts):
+            cumulative += count
+            lines.append('mupihat_poll_duration_seconds_bucket{le="%s"} %d' % (bound, cumulative))
+        lines.append("mupihat_poll_duration_seconds_sum %s" % repr(round(total, 6)))
+        lines.append("mupihat_poll_duration_seconds_count %d" % cumulative)
+
+        _header(lines, "mupihat_last_success_age_seconds", "gauge", "Time since the last successful register read")
+        # replaced in a single assignment, a scrape sees either the old or the new text
+        self._cache = (("\n".join(lines) + "\n").encode(), snapshot.monotonic)
+
+    def exposition(self, hat=None):
+        '''
+        Returns the exposition text of the last poll as bytes, with the current age of the last read.
+        Renders the text from hat if no poll rendered it yet.
+        '''
+        if self._cache[0] is None and hat is not None:
+            self.render(hat)
+        body, monotonic = self._cache
+        if body is None:
+            return b""
+        return body + b"mupihat_last_success_age_seconds %.3f\n" % max(0.0, time.monotonic() - monotonic)
@@ -0,0 +1,825 @@
+#!/usr/bin/python3
+""" Module mupihat_registers.py, BQ25792 register map
+Declarative description of the BQ25792 register file and the generic
+decoder / encoder used by mupihat_bq25792.bq25792 for every register.
+
+Every register is described once by its address, size, access type,
+power-on value and a list of bitfields. A bitfield knows its bit mask,
+shift, signedness, step size and offset (physical value = code * step + offset)
+and optionally the datasheet strings for each code.
+
+RegisterSnapshot holds one immutable image of the register file, as read in
+one poll, and decodes its bitfields on demand.
+
+Parameters
+----------
+none
+
+Returns
+-------
+none
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import time
+from collections import namedtuple
+from functools import reduce
+from operator import or_
+
+# number of bytes in the BQ25792 register file (REG00 - REG48)
+REGISTER_FILE_SIZE = 0x49
+
+# Bitfield of a register
+#   name    : attribute name of the decoded value
+#   mask    : bit mask inside the (8 or 16 bit) register value
+#   shift   : position of the lsb of the field
+#   bits    : width of the field in bits
+#   signed  : field is reported in 2's complement
+#   step    : bit step size, physical value = code * step + offset
+#   offset  : fixed offset
+#   strings : datasheet string for each code (or None)
+#   strg    : attribute name of the decoded string (or None)
+Field = namedtuple("Field", "name mask shift bits signed step offset strings strg")
+
+# Register of the BQ25792
+#   addr    : register address
+#   name    : attribute name of the register view in bq25792
+#   size    : 1 or 2 bytes, 16 bit registers are stored msb first
+#   access  : "RW" read/write, "R" read only, "RC" read only and cleared on read
+#   por     : power-on reset value
+#   fields  : tuple of Field
+#   self_clearing : mask of the bits the chip resets to 0 by itself after they were written with 1
+Register = namedtuple("Register", "addr name size access por fields self_clearing")
+
+
+def field(name, msb, lsb, step=1, offset=0, signed=False, strings=None, strg=None):
+    '''
+    Describe a bitfield by its bit positions msb:lsb as given in the datasheet.
+    If strings are given the decoded string is stored as <name>_STRG unless strg is set.
+    '''
+    bits = msb - lsb + 1
+    if strings is not None:
+        strings = tuple(strings)
+        if strg is None:
+            strg = name + "_STRG"
+    return Field(name, ((1 << bits) - 1) << lsb, lsb, bits, signed, step, offset, strings, strg)
+
+
+def register(addr, name, size=1, access="RW", por=0, fields=(), self_clearing=0):
+    '''
+    Describe a register of the BQ25792.
+    '''
+    return Register(addr, name, size, access, por, tuple(fields), self_clearing)
+
+
+def _flag(name, text, normal="Normal"):
+    ''' 1 bit status / flag field with the datasheet strings for 0h and 1h '''
+    return field(name, 0, 0, strings=(normal, text))
+
+
+def _mask(name, event, pulse=False):
+    ''' 1 bit interrupt mask field, 0h = event produces INT, 1h = it does not '''
+    suffix = " pulse" if pulse else ""
+    return field(name, 0, 0, strings=(event + " does produce INT" + suffix, event + " does NOT produce INT" + suffix))
+
+
+def _at(bit, f):
+    ''' move a 1 bit field (built at bit 0) to its bit position '''
+    return f._replace(mask=1 << bit, shift=bit)
+
+
+REGISTERS = (
+    register(0x00, "REG00_Minimal_System_Voltage", por=0x12, fields=(
+        field("VSYSMIN", 5, 0, step=250, offset=2500),
+    )),
+    register(0x01, "REG01_Charge_Voltage_Limit", size=2, por=0x0348, fields=(
+        field("VREG", 10, 0, step=10),
+    )),
+    register(0x03, "REG03_Charge_Current_Limit", size=2, por=0x00C8, fields=(
+        field("ICHG", 8, 0, step=10),
+    )),
+    register(0x05, "REG05_Input_Voltage_Limit", por=0x24, fields=(
+        field("VINDPM", 7, 0, step=100),
+    )),
+    register(0x06, "REG06_Input_Current_Limit", size=2, por=0x012C, fields=(
+        field("IINDPM", 8, 0, step=10),
+    )),
+    register(0x08, "REG08_Precharge_Control", por=0xC3, fields=(
+        field("VBAT_LOWV", 7, 6),
+        field("IPRECHG", 5, 0, step=40),
+    )),
+    register(0x09, "REG09_Termination_Control", por=0x05, self_clearing=0x40, fields=(
+        field("REG_RST", 6, 6),
+        field("ITERM", 4, 0, step=40),
+    )),
+    register(0x0A, "REG0A_Recharge_Control", por=0x63, fields=(
+        field("CELL", 7, 6),
+        field("TRECHG", 5, 4),
+        field("VRECHG", 3, 0, step=50, offset=50),
+    )),
+    register(0x0B, "REG0B_VOTG_regulation", size=2, por=0x00DC, fields=(
+        field("VOTG", 10, 0, step=10, offset=2800),
+    )),
+    register(0x0D, "REG0D_IOTG_regulation", por=0x4B, fields=(
+        field("PRECHG_TMR", 7, 7),
+        field("IOTG", 6, 0, step=40),
+    )),
+    register(0x0E, "REG0E_Timer_Control", por=0x3D, fields=(
+        field("TOPOFF_TMR", 7, 6),
+        field("EN_TRICHG_TMR", 5, 5),
+        field("EN_PRECHG_TMR", 4, 4),
+        field("EN_CHG_TMR", 3, 3),
+        field("CHG_TMR", 2, 1),
+        field("TMR2X_EN", 0, 0),
+    )),
+    register(0x0F, "REG0F_Charger_Control_0", por=0xA2, self_clearing=0x08, fields=(
+        field("EN_AUTO_IBATDIS", 7, 7),
+        field("FORCE_IBATDIS", 6, 6),
+        field("EN_CHG", 5, 5),
+        field("EN_ICO", 4, 4),
+        field("FORCE_ICO", 3, 3),
+        field("EN_HIZ", 2, 2),
+        field("EN_TERM", 1, 1),
+    )),
+    register(0x10, "REG10_Charger_Control_1", por=0x05, self_clearing=0x08, fields=(
+        field("VAC_OVP", 5, 4),
+        field("WD_RST", 3, 3),
+        field("WATCHDOG", 2, 0),
+    )),
+    register(0x11, "REG11_Charger_Control_2", por=0x40, self_clearing=0x80, fields=(
+        field("FORCE_INDET", 7, 7),
+        field("AUTO_INDET_EN", 6, 6),
+        field("EN_12V", 5, 5),
+        field("EN_9V", 4, 4),
+        field("HVDCP_EN", 3, 3),
+        field("SDRV_CTRL", 2, 1),
+        field("SDRV_DLY", 0, 0),
+    )),
+    register(0x12, "REG12_Charger_Control_3", fields=(
+        field("DIS_ACDRV", 7, 7),
+        field("EN_OTG", 6, 6),
+        field("PFM_OTG_DIS", 5, 5),
+        field("PFM_FWD_DIS", 4, 4),
+        field("WKUP_DLY", 3, 3),
+        field("DIS_LDO", 2, 2),
+        field("DIS_OTG_OOA", 1, 1),
+        field("DIS_FWD_OOA", 0, 0),
+    )),
+    register(0x13, "REG13_Charger_Control_4", por=0x01, self_clearing=0x02, fields=(
+        field("EN_ACDRV2", 7, 7),
+        field("EN_ACDRV1", 6, 6),
+        field("PWM_FREQ", 5, 5),
+        field("DIS_STAT", 4, 4),
+        field("DIS_VSYS_SHORT", 3, 3),
+        field("DIS_VOTG_UVP", 2, 2),
+        field("FORCE_VINDPM_DET", 1, 1),
+        field("EN_IBUS_OCP", 0, 0),
+    )),
+    register(0x14, "REG14_Charger_Control_5", por=0x16, fields=(
+        field("SFET_PRESENT", 7, 7),
+        field("EN_IBAT", 5, 5),
+        field("IBAT_REG", 4, 3),
+        field("EN_IINDPM", 2, 2),
+        field("EN_EXTILIM", 1, 1),
+        field("EN_BATOC", 0, 0),
+    )),
+    register(0x15, "REG15_Reserved", access="R"),
+    register(0x16, "REG16_Temperature_Control", por=0xC0, fields=(
+        field("TREG", 7, 6, strings=("60°C", "80°C", "100°C", "120°C"), strg="TREG_str"),
+        field("TSHUT", 5, 4, strings=("150°C", "130°C", "120°C", "85°C"), strg="TSHUT_str"),
+        field("VBUS_PD_EN", 3, 3),
+        field("VAC1_PD_EN", 2, 2),
+        field("VAC2_PD_EN", 1, 1),
+    )),
+    register(0x17, "REG17_NTC_Control_0", por=0x7A, fields=(
+        field("JEITA_VSET", 7, 5, strg="JEITA_VSET_str", strings=(
+            "Charge Suspend",
+            "Set VREG to VREG-800mV",
+            "Set VREG to VREG-600mV",
+            "Set VREG to VREG-400mV (default)",
+            "Set VREG to VREG-300mV",
+            "Set VREG to VREG-200mV",
+            "Set VREG to VREG-100mV",
+            "VREG unchanged")),
+        field("JEITA_ISETH", 4, 3, strg="JEITA_ISETH_str", strings=(
+            "Charge Suspend",
+            "Set ICHG to 20%* ICHG",
+            "Set ICHG to 40%* ICHG",
+            "ICHG unchanged (default)")),
+        field("JEITA_ISETC", 2, 1, strg="JEITA_ISETC_str", strings=(
+            "Charge Suspend",
+            "Set ICHG to 20%* ICHG (default)",
+            "Set ICHG to 40%* ICHG",
+            "ICHG unchanged")),
+    )),
+    register(0x18, "REG18_NTC_Control_1", por=0x54, fields=(
+        field("TS_COOL", 7, 6, strings=("5°C", "10°C", "15°C", "20°C")),
+        field("TS_WARM", 5, 4, strings=("40°C", "45°C", "50°C", "55°C")),
+        field("BHOT", 3, 2, strings=("55°C", "60°C", "65°C", "Disable")),
+        field("BCOLD", 1, 1, strings=("-10°C", "-20°C")),
+        field("TS_IGNORE", 0, 0, strings=("NOT ignore (Default)", "Ignore")),
+    )),
+    register(0x19, "REG19_ICO_Current_Limit", size=2, access="R", fields=(
+        field("ICO_ILIM", 8, 0, step=10),
+    )),
+    register(0x1B, "REG1B_Charger_Status_0", access="R", fields=(
+        field("IINDPM_STAT", 7, 7),
+        field("VINDPM_STAT", 6, 6),
+        field("WD_STAT", 5, 5),
+        field("POORSRC_STAT", 4, 4),
+        field("PG_STAT", 3, 3),
+        field("AC2_PRESENT_STAT", 2, 2),
+        field("AC1_PRESENT_STAT", 1, 1),
+        field("VBUS_PRESENT_STAT", 0, 0),
+    )),
+    register(0x1C, "REG1C_Charger_Status_1", access="R", fields=(
+        field("CHG_STAT", 7, 5, strings=(
+            "Not Charging",
+            "Trickle Charge",
+            "Pre-charge",
+            "Fast charge (CC mode)",
+            "Taper Charge (CV mode)",
+            "Reserved",
+            "Top-off Timer Active Charging",
+            "Charge Termination Done")),
+        field("VBUS_STAT", 4, 1, strings=(
+            "No Input or BHOT or BCOLD in OTG mode",
+            "USB SDP (500mA)",
+            "USB CDP (1.5A)",
+            "USB DCP (3.25A)",
+            "Adjustable High Voltage DCP (HVDCP) (1.5A)",
+            "Unknown adaptor (3A)",
+            "Non-Standard Adapter (1A/2A/2.1A/2.4A)",
+            "In OTG mode",
+            "Not qualified adaptor",
+            "Reserved",
+            "Reserved",
+            "Device directly powered from VBUS",
+            "Reserved",
+            "Reserved",
+            "Reserved",
+            "Reserved")),
+    )),
+    register(0x1D, "REG1D_Charger_Status_2", access="R", fields=(
+        field("ICO_STAT", 7, 6),
+        _at(2, _flag("TREG_STAT", "Device in thermal regulation")),
+        field("DPDM_STAT", 1, 1),
+        field("VBAT_PRESENT_STAT", 0, 0),
+    )),
+    register(0x1E, "REG1E_Charger_Status_3", access="R", fields=(
+        field("ACRB2_STAT", 7, 7),
+        field("ACRB1_STAT", 6, 6),
+        field("ADC_DONE_STAT", 5, 5),
+        field("VSYS_STAT", 4, 4),
+        field("CHG_TMR_STAT", 3, 3),
+        field("TRICHG_TMR_STAT", 2, 2),
+        field("PRECHG_TMR_STAT", 1, 1),
+    )),
+    register(0x1F, "REG1F_Charger_Status_4", access="R", fields=(
+        _at(4, _flag("VBATOTG_LOW_STAT", "The battery volage is too low to enable the OTG operation",
+                     normal="The battery voltage is high enough to enable the OTG operation")),
+        _at(3, _flag("TS_COLD_STAT", "TS status is in cold range", normal="TS status is NOT in cold range")),
+        _at(2, _flag("TS_COOL_STAT", "TS status is in cool range", normal="TS status is NOT in cool range")),
+        _at(1, _flag("TS_WARM_STAT", "TS status is in warm range", normal="TS status is NOT in warm range")),
+        _at(0, _flag("TS_HOT_STAT", "TS status is in hot range", normal="TS status is NOT in hot range")),
+    )),
+    register(0x20, "REG20_FAULT_Status_0", access="R", fields=(
+        _at(7, _flag("IBAT_REG_STAT", "Device in battery discharging current regulation")),
+        _at(6, _flag("VBUS_OVP_STAT", "Device in over voltage protection")),
+        _at(5, _flag("VBAT_OVP_STAT", "Device in over voltage protection")),
+        _at(4, _flag("IBUS_OCP_STAT", "Device in over current protection")),
+        _at(3, _flag("IBAT_OCP_STAT", "Device in over current protection")),
+        _at(2, _flag("CONV_OCP_STAT", "Converter in over current protection")),
+        _at(1, _flag("VAC2_OVP_STAT", "Device in over voltage protection")),
+        _at(0, _flag("VAC1_OVP_STAT", "Device in over voltage protection")),
+    )),
+    register(0x21, "REG21_FAULT_Status_1", access="R", fields=(
+        _at(7, _flag("VSYS_SHORT_STAT", "Device in SYS short circuit protection")),
+        _at(6, _flag("VSYS_OVP_STAT", "Device in over voltage protection")),
+        _at(5, _flag("OTG_OVP_STAT", "Device in OTG over voltage")),
+        _at(4, _flag("OTG_UVP_STAT", "Device in OTG under voltage protection")),
+        _at(2, _flag("TSHUT_STAT", "Device in thermal shutdown protection")),
+    )),
+    register(0x22, "REG22_Charger_Flag_0", access="RC", fields=(
+        _at(7, _flag("IINDPM_FLAG", "IINDPM / IOTG signal rising edge detected")),
+        _at(6, _flag("VINDPM_FLAG", "VINDPM signal rising edge detected")),
+        _at(5, _flag("WD_FLAG", "WD timer signal rising edge detected")),
+        _at(4, _flag("POORSRC_FLAG", "Poor source status rising edge detected")),
+        _at(3, _flag("PG_FLAG", "Any change in PG_STAT even (adapter good qualification or adapter good going away)")),
+        _at(2, _flag("VAC2_PRESENT_FLAG", "VAC2 present status changed")),
+        _at(1, _flag("VAC1_PRESENT_FLAG", "VAC1 present status changed")),
+        _at(0, _flag("VBUS_PRESENT_FLAG", "VBUS present status changed")),
+    )),
+    register(0x23, "REG23_Charger_Flag_1", access="RC", fields=(
+        _at(7, _flag("CHG_FLAG", "Charger status changed")),
+        _at(6, _flag("ICO_FLAG", "ICO status changed")),
+        _at(4, _flag("VBUS_FLAG", "VBUS status changed")),
+        _at(2, _flag("TREG_FLAG", "TREG signal rising threshold detected")),
+        _at(1, _flag("VBAT_PRESENT_FLAG", "VBAT present status changed")),
+        _at(0, _flag("BC1_2_DONE_FLAG", "BC1.2 detection status changed")),
+    )),
+    register(0x24, "REG24_Charger_Flag_2", access="RC", fields=(
+        _at(6, _flag("DPDM_DONE_FLAG", "D+/D- detection is completed",
+                     normal="D+/D- detection is NOT started or still ongoing")),
+        _at(5, _flag("ADC_DONE_FLAG", "Conversion completed", normal="Conversion NOT completed")),
+        _at(4, _flag("VSYS_FLAG", "Entered or existed VSYSMIN regulation")),
+        _at(3, _flag("CHG_TMR_FLAG", "Fast charge timer expired rising edge detected")),
+        _at(2, _flag("TRICHG_TMR_FLAG", "Trickle charger timer expired rising edge detected")),
+        _at(1, _flag("PRECHG_TMR_FLAG", "Pre-charge timer expired rising edge detected")),
+        _at(0, _flag("TOPOFF_TMR_FLAG", "Top off timer expired rising edge detected")),
+    )),
+    register(0x25, "REG25_Charger_Flag_3", access="RC", fields=(
+        _at(4, _flag("VBATOTG_LOW_FLAG", "VBAT falls below the threshold to enable the OTG mode")),
+        _at(3, _flag("TS_COLD_FLAG", "TS across cold temperature (T1) is detected")),
+        _at(2, _flag("TS_COOL_FLAG", "TS across cool temperature (T2) is detected")),
+        _at(1, _flag("TS_WARM_FLAG", "TS across warm temperature (T3) is detected")),
+        _at(0, _flag("TS_HOT_FLAG", "TS across hot temperature (T5) is detected")),
+    )),
+    register(0x26, "REG26_FAULT_Flag_0", access="RC", fields=(
+        _at(7, _flag("IBAT_REG_FLAG", "Enter or exit IBAT regulation")),
+        _at(6, _flag("VBUS_OVP_FLAG", "VBUS over voltage protection triggered")),
+        _at(5, _flag("VBAT_OVP_FLAG", "VBAT over voltage protection triggered")),
+        _at(4, _flag("IBUS_OCP_FLAG", "IBUS over current protection triggered")),
+        _at(3, _flag("IBAT_OCP_FLAG", "IBAT over current protection triggered")),
+        _at(2, _flag("CONV_OCP_FLAG", "Converter over current protection triggered")),
+        _at(1, _flag("VAC2_OVP_FLAG", "VAC2 over voltage protection triggered")),
+        _at(0, _flag("VAC1_OVP_FLAG", "VAC1 over voltage protection triggered")),
+    )),
+    register(0x27, "REG27_FAULT_Flag_1", access="RC", fields=(
+        _at(7, _flag("VSYS_SHORT_FLAG", "Stop switching due to system short")),
+        _at(6, _flag("VSYS_OVP_FLAG", "Stop switching due to system over-voltage")),
+        _at(5, _flag("OTG_OVP_FLAG", "Stop OTG due to VBUS over voltage")),
+        _at(4, _flag("OTG_UVP_FLAG", "Stop OTG due to VBUS under voltage")),
+        _at(2, _flag("TSHUT_FLAG", "TS shutdown signal rising threshold detected")),
+    )),
+    register(0x28, "REG28_Charger_Mask_0", fields=(
+        _at(7, _mask("IINDPM_MASK", "Enter IINDPM / IOTG", pulse=True)),
+        _at(6, _mask("VINDPM_MASK", "Enter VINDPM / VOTG", pulse=True)),
+        _at(5, _mask("WD_MASK", "I2C watch dog timer expired", pulse=True)),
+        _at(4, _mask("POORSRC_MASK", "Poor source detected")),
+        _at(3, _mask("PG_MASK", "PG toggle")),
+        _at(2, _mask("VAC2_PRESENT_MASK", "VAC2 present status change")),
+        _at(1, _mask("VAC1_PRESENT_MASK", "VAC1 present status change")),
+        _at(0, _mask("VBUS_PRESENT_MASK", "VBUS present status change")),
+    )),
+    register(0x29, "REG29_Charger_Mask_1", fields=(
+        _at(7, _mask("CHG_MASK", "Charging status change")),
+        _at(6, _mask("ICO_MASK", "ICO status change")),
+        _at(4, _mask("VBUS_MASK", "VBUS status change")),
+        _at(2, _mask("TREG_MASK", "TREG status change")),
+        _at(1, _mask("VBAT_PRESENT_MASK", "VBAT present status change")),
+        _at(0, _mask("BC1_2_DONE_MASK", "BC1.2 done status change")),
+    )),
+    register(0x2A, "REG2A_Charger_Mask_2", fields=(
+        _at(6, _mask("DPDM_DONE_MASK", "D+/D- detection done", pulse=True)),
+        _at(5, _mask("ADC_DONE_MASK", "ADC conversion done", pulse=True)),
+        _at(4, _mask("VSYS_MASK", "enter or exit VSYSMIN regulation", pulse=True)),
+        _at(3, _mask("CHG_TMR_MASK", "Fast charge timer expire")),
+        _at(2, _mask("TRICHG_TMR_MASK", "Trickle charge timer expire")),
+        _at(1, _mask("PRECHG_TMR_MASK", "Precharge timer expire")),
+        _at(0, _mask("TOPOFF_TMR_MASK", "Top off timer expire")),
+    )),
+    register(0x2B, "REG2B_Charger_Mask_3", fields=(
+        _at(4, _mask("VBATOTG_LOW_MASK", "VBAT falling below the threshold to enable the OTG mode,")),
+        _at(3, _mask("TS_COLD_MASK", "TS across cold temperature (T1)")),
+        _at(2, _mask("TS_COOL_MASK", "TS across cool temperature (T2)")),
+        _at(1, _mask("TS_WARM_MASK", "TS across warm temperature (T3)")),
+        _at(0, _mask("TS_HOT_MASK", "TS across hot temperature (T5)")),
+    )),
+    register(0x2C, "REG2C_FAULT_Mask_0", fields=(
+        _at(7, _mask("IBAT_REG_MASK", "enter or exit IBAT regulation")),
+        _at(6, _mask("VBUS_OVP_MASK", "entering VBUS OVP")),
+        _at(5, _mask("VBAT_OVP_MASK", "entering VBAT OVP")),
+        _at(4, _mask("IBUS_OCP_MASK", "entering IBUS OCP")),
+        _at(3, _mask("IBAT_OCP_MASK", "entering IBAT OCP")),
+        _at(2, _mask("CONV_OCP_MASK", "entering converter OCP")),
+        _at(1, _mask("VAC2_OVP_MASK", "entering VAC2 OVP")),
+        _at(0, _mask("VAC1_OVP_MASK", "entering VAC1 OVP")),
+    )),
+    register(0x2D, "REG2D_FAULT_Mask_1", fields=(
+        _at(7, _mask("VSYS_SHORT_MASK", "entering VSYS short circuit")),
+        _at(6, _mask("VSYS_OVP_MASK", "entering VSYS OVP")),
+        _at(5, _mask("OTG_OVP_MASK", "OTG VBUS over-voltage fault")),
+        _at(4, _mask("OTG_UVP_MASK", "OTG VBUS under-voltage fault")),
+        _at(2, _mask("TSHUT_MASK", "entering thermal shutdown")),
+    )),
+    register(0x2E, "REG2E_ADC_Control", por=0x30, fields=(
+        field("ADC_EN", 7, 7),
+        field("ADC_RATE", 6, 6),
+        field("ADC_SAMPLE", 5, 4),
+        field("ADC_AVG", 3, 3),
+        field("ADC_AVG_INIT", 2, 2),
+    )),
+    register(0x2F, "REG2F_ADC_Function_Disable_0", fields=(
+        _at(7, field("IBUS_ADC_DIS", 0, 0, strings=("Enable IBUS ADC", "Disable IBUS ADC"))),
+        _at(6, field("IBAT_ADC_DIS", 0, 0, strings=("Enable IBAT ADC", "Disable IBAT ADC"))),
+        _at(5, field("VBUS_ADC_DIS", 0, 0, strings=("Enable VBUS ADC", "Disable VBUS ADC"))),
+        _at(4, field("VBAT_ADC_DIS", 0, 0, strings=("Enable VBAT ADC", "Disable VBAT ADC"))),
+        _at(3, field("VSYS_ADC_DIS", 0, 0, strings=("Enable VSYS ADC", "Disable VSYS ADC"))),
+        _at(2, field("TS_ADC_DIS", 0, 0, strings=("Enable TS ADC", "Disable TS ADC"))),
+        _at(1, field("TDIE_ADC_DIS", 0, 0, strings=("Enable TDIE ADC", "Disable TDIE ADC"))),
+    )),
+    register(0x30, "REG30_ADC_Function_Disable_1", fields=(
+        _at(7, field("DP_ADC_DIS", 0, 0, strings=("Enable (Default)", "Disable"))),
+        _at(6, field("DM_ADC_DIS", 0, 0, strings=("Enable (Default)", "Disable"))),
+        _at(5, field("VAC2_ADC_DIS", 0, 0, strings=("Enable VAC2 ADC", "Disable VAC2 ADC"))),
+        _at(4, field("VAC1_ADC_DIS", 0, 0, strings=("Enable VAC1 ADC", "Disable VAC1 ADC"))),
+    )),
+    register(0x31, "REG31_IBUS_ADC", size=2, access="R", fields=(
+        field("IBUS_ADC", 15, 0, signed=True),
+    )),
+    register(0x33, "REG33_IBAT_ADC", size=2, access="R", fields=(
+        field("IBAT_ADC", 15, 0, signed=True),
+    )),
+    register(0x35, "REG35_VBUS_ADC", size=2, access="R", fields=(
+        field("VBUS_ADC", 15, 0),
+    )),
+    register(0x37, "REG37_VAC1_ADC", size=2, access="R", fields=(
+        field("VAC1_ADC", 15, 0),
+    )),
+    register(0x39, "REG39_VAC2_ADC", size=2, access="R", fields=(
+        field("VAC2_ADC", 15, 0),
+    )),
+    register(0x3B, "REG3B_VBAT_ADC", size=2, access="R", fields=(
+        field("VBAT_ADC", 15, 0),
+    )),
+    register(0x3D, "REG3D_VSYS_ADC", size=2, access="R", fields=(
+        field("VSYS_ADC", 15, 0),
+    )),
+    register(0x3F, "REG3F_TS_ADC", size=2, access="R", fields=(
+        field("TS_ADC", 15, 0),
+    )),
+    register(0x41, "REG41_TDIE_ADC", size=2, access="R", fields=(
+        field("TDIE_ADC", 15, 0, signed=True),
+        field("TemperatureIC", 15, 0, step=0.5, signed=True),
+    )),
+    register(0x43, "REG43_DP_ADC", size=2, access="R", fields=(
+        field("DP_ADC", 15, 0),
+    )),
+    register(0x45, "REG45_DM_ADC", size=2, access="R", fields=(
+        field("DM_ADC", 15, 0),
+    )),
+    register(0x47, "REG47_DPDM_Driver", fields=(
+        field("DPLUS_DAC", 7, 5, strings=("HIZ", "0V", "0.6V", "1.2V", "2.0V", "2.7V", "3.3V", "D+/D- Short")),
+        field("DMINUS_DAC", 4, 2, strings=("HIZ", "0V", "0.6V", "1.2V", "2.0V", "2.7V", "3.3V", "reserved")),
+    )),
+    register(0x48, "REG48_Part_Information", access="R", por=0x08, fields=(
+        field("PART_NUMBER", 5, 3, strings=("Reserved", "BQ25792") + ("Reserved",) * 6),
+        field("PART_REVISION", 2, 0, strings=("BQ25792",) + ("Reserved",) * 7),
+    )),
+)
+
+REGISTERS_BY_ADDR = {reg.addr: reg for reg in REGISTERS}
+REGISTERS_BY_NAME = {reg.name: reg for reg in REGISTERS}
+
+
+def raw_value(reg, registers):
+    '''
+    Returns the raw (8 or 16 bit) value of reg from a register file image
+    (list or bytes indexed by register address). 16 bit registers are msb first.
+    '''
+    if reg.size == 2:
+        return (registers[reg.addr] << 8) | registers[reg.addr + 1]
+    return registers[reg.addr]
+
+
+def raw_bytes(reg, value):
+    '''
+    Returns the bytes of a raw register value in bus order (msb first).
+    '''
+    if reg.size == 2:
+        return [(value >> 8) & 0xFF, value & 0xFF]
+    return [value & 0xFF]
+
+
+def decode_field(f, raw):
+    '''
+    Decodes the physical value of bitfield f from the raw register value.
+    '''
+    code = (raw & f.mask) >> f.shift
+    if f.signed and code >> (f.bits - 1):
+        code -= 1 << f.bits
+    if f.step != 1 or f.offset:
+        return code * f.step + f.offset
+    return code
+
+
+def decode_into(reg, raw, out):
+    '''
+    Decodes all bitfields of reg from the raw register value into the dict out,
+    including the datasheet strings of enumerated fields.
+    '''
+    for name, mask, shift, bits, signed, step, offset, strings, strg in reg.fields:
+        code = (raw & mask) >> shift
+        if signed and code >> (bits - 1):
+            code -= 1 << bits
+        if step != 1 or offset:
+            out[name] = code * step + offset
+        else:
+            out[name] = code
+        if strings is not None:
+            out[strg] = strings[code] if 0 <= code < len(strings) else "unknown"
+    return out
+
+
+def decode_registers(raw):
+    '''
+    Decodes all registers of the register file image raw into new dicts
+    {register name: {bitfield: value, ...}}, in address order.
+    '''
+    return {reg.name: decode_into(reg, raw_value(reg, raw), {}) for reg in REGISTERS}
+
+
+def encode_field(f, value, raw):
+    '''
+    Encodes the physical value of bitfield f into the raw register value and
+    returns the new raw value. Bits outside of the field are kept.
+    '''
+    if f.step != 1 or f.offset:
+        code = int(round((value - f.offset) / f.step))
+    else:
+        code = int(value)
+    return (raw & ~f.mask) | ((code << f.shift) & f.mask)
+
+
+def encode_register(reg, values, raw=0):
+    '''
+    Encodes all bitfields of reg found in the mapping values into the raw
+    register value and returns the new raw value.
+    Fields sharing their bits with a previous field (e.g. scaled views) are skipped.
+    '''
+    used = 0
+    for f in reg.fields:
+        if f.mask & used or f.name not in values:
+            continue
+        raw = encode_field(f, values[f.name], raw)
+        used |= f.mask
+    return raw
+
+
+# maximum length of one SMBus block transfer
+BLOCK_SIZE = 32
+
+# contiguous register ranges (start address, length) of the register groups
+#   config : charger configuration and interrupt masks, changes only on write
+#   status : charger and fault status registers
+#   flags  : clear-on-read interrupt flag registers
+#   adc    : ADC results
+#   part   : D+/D- driver and part information
+REGISTER_GROUPS = {
+    "config": ((0x00, 0x1B), (0x28, 0x09)),
+    "status": ((0x1B, 0x07),),
+    "flags": ((0x22, 0x06),),
+    "adc": ((0x31, 0x16),),
+    "part": ((0x47, 0x02),),
+}
+
+
+def group_ranges(groups, max_length=BLOCK_SIZE):
+    '''
+    Returns the register ranges (start address, length) of the given groups,
+    sorted, with adjacent ranges merged into block transfers of up to max_length bytes.
+    '''
+    ranges = []
+    for group in groups:
+        if group not in REGISTER_GROUPS:
+            raise ValueError("unknown register group %r, expected one of %s" % (group, ", ".join(REGISTER_GROUPS)))
+        ranges.extend(REGISTER_GROUPS[group])
+    merged = []
+    for start, length in sorted(set(ranges)):
+        if merged:
+            last_start, last_length = merged[-1]
+            end = max(last_start + last_length, start + length)
+            if start <= last_start + last_length and end - last_start <= max_length:
+                merged[-1] = (last_start, end - last_start)
+                continue
+        merged.append((start, length))
+    return merged
+
+
+# bitfields (and their strings) by name -> (register, field)
+FIELDS_BY_NAME = {}
+for _reg in REGISTERS:
+    for _f in _reg.fields:
+        FIELDS_BY_NAME[_f.name] = (_reg, _f)
+        if _f.strg:
+            FIELDS_BY_NAME[_f.strg] = (_reg, _f)
+del _reg, _f
+
+# clear-on-read interrupt flags of REG22 - REG27, in register order
+FLAGS = tuple(f.name for reg in REGISTERS if reg.access == "RC" for f in reg.fields)
+FLAG_ADDRESSES = tuple(reg.addr for reg in REGISTERS if reg.access == "RC")
+
+# interrupt mask registers REG28 - REG2D, a set bit masks the INT pulse of its flag
+MASK_ADDRESSES = tuple(range(0x28, 0x2E))
+
+
+def interrupt_masks(flags):
+    '''
+    Returns the interrupt mask register values {addr: value} with all interrupts masked
+    except the ones of the given flags (e.g. "VBUS_PRESENT_FLAG").
+    Raises ValueError for an unknown flag.
+    '''
+    masks = dict.fromkeys(MASK_ADDRESSES, 0xFF)
+    for flag in flags:
+        if flag not in FLAGS:
+            raise ValueError("unknown interrupt flag %r" % (flag,))
+        reg, f = FIELDS_BY_NAME[flag[:-len("_FLAG")] + "_MASK"]
+        masks[reg.addr] &= ~f.mask & 0xFF
+    return masks
+
+
+def _byte_table(value):
+    ''' per address table of a register attribute, 16 bit values split msb first '''
+    table = bytearray(REGISTER_FILE_SIZE)
+    for reg in REGISTERS:
+        table[reg.addr:reg.addr + reg.size] = bytes(raw_bytes(reg, value(reg)))
+    return bytes(table)
+
+
+# per address masks of the writable and of the self-clearing bits
+WRITABLE = _byte_table(lambda reg: 0xFFFF if reg.access == "RW" else 0)
+WRITABLE_ADDRESSES = frozenset(addr for addr, mask in enumerate(WRITABLE) if mask)
+SELF_CLEARING = _byte_table(lambda reg: reg.self_clearing)
+# per address mask of the bits covered by bitfields
+FIELD_MASK = _byte_table(lambda reg: reduce(or_, (f.mask for f in reg.fields), 0))
+# per address mask of the bits that read back as written (bitfields without self-clearing bits)
+VERIFY_MASK = bytes(field & ~clearing & 0xFF for field, clearing in zip(FIELD_MASK, SELF_CLEARING))
+
+
+def coalesce(pending, shadow, forced=(), max_length=BLOCK_SIZE):
+    '''
+    Plans the bus writes for the pending register values {address: byte}.
+    Contiguous addresses are merged into blocks of up to max_length bytes.
+    A block is dropped if all its bytes equal the shadow (last known chip value,
+    None if unknown), unless one of its addresses is in forced or a self-clearing
+    bit (e.g. WD_RST) is set.
+    Returns a list of (start address, list of bytes).
+    '''
+    blocks = []
+    start, data, dirty = None, [], False
+    for addr in sorted(pending):
+        if addr not in WRITABLE_ADDRESSES:
+            raise ValueError("register 0x%02X is not writable" % addr)
+        if start is None or addr != start + len(data) or len(data) >= max_length:
+            if dirty:
+                blocks.append((start, data))
+            start, data, dirty = addr, [], False
+        value = pending[addr]
+        data.append(value)
+        dirty = dirty or addr in forced or shadow[addr] != value or value & SELF_CLEARING[addr]
+    if dirty:
+        blocks.append((start, data))
+    return blocks
+
+
+def read_back_errors(start, written, read):
+    '''
+    Compares written register bytes with the bytes read back from start,
+    ignoring reserved and self-clearing bits.
+    Returns a list of (address, written, read) for every mismatch.
+    '''
+    return [(start + i, w, r) for i, (w, r) in enumerate(zip(written, read))
+            if (w ^ r) & VERIFY_MASK[start + i]]
+
+
+def por_image():
+    '''
+    Returns the 73 byte register file image after power-on reset.
+    '''
+    image = bytearray(REGISTER_FILE_SIZE)
+    for reg in REGISTERS:
+        image[reg.addr:reg.addr + reg.size] = bytes(raw_bytes(reg, reg.por))
+    return bytes(image)
+
+
+class RegisterSnapshot:
+    """
+    Immutable image of the BQ25792 register file as read in one poll.
+
+    Attributes
+    ----------
+    raw : bytes
+        73 bytes, indexed by register address.
+    monotonic : float
+        time.monotonic() of the read.
+    wall : float
+        time.time() of the read.
+    generation : int
+        publication number, incremented by every update, e.g. for cache validation.
+
+    Bitfields are decoded on first access and cached, so publishing a new
+    snapshot is a single reference assignment and readers need no lock.
+    """
+    __slots__ = ("raw", "monotonic", "wall", "generation", "_values", "_registers")
+
+    def __init__(self, raw, monotonic=None, wall=None, generation=0):
+        raw = bytes(raw)
+        if len(raw) != REGISTER_FILE_SIZE:
+            raise ValueError("register image must have %d bytes, got %d" % (REGISTER_FILE_SIZE, len(raw)))
+        setattr_ = object.__setattr__
+        setattr_(self, "raw", raw)
+        setattr_(self, "monotonic", time.monotonic() if monotonic is None else monotonic)
+        setattr_(self, "wall", time.time() if wall is None else wall)
+        setattr_(self, "generation", generation)
+        setattr_(self, "_values", {})
+        setattr_(self, "_registers", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RegisterSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("RegisterSnapshot is immutable")
+
+    def __getitem__(self, addr):
+        return self.raw[addr]
+
+    def __len__(self):
+        return REGISTER_FILE_SIZE
+
+    def __repr__(self):
+        return "RegisterSnapshot(generation=%d, monotonic=%.3f, wall=%.3f)" % (self.generation, self.monotonic, self.wall)
+
+    def updated(self, blocks, monotonic=None, wall=None):
+        '''
+        Returns a new snapshot of the next generation with the register blocks (start address, data) replaced.
+        Decoded values of registers outside of the blocks are taken over from this snapshot,
+        except the clear-on-read flag registers: flags not read are 0, a flag is only reported
+        by the snapshot of the read that cleared it.
+        '''
+        raw = bytearray(self.raw)
+        spans = []
+        for start, data in blocks:
+            raw[start:start + len(data)] = bytes(data)
+            spans.append((start, start + len(data)))
+        for addr in FLAG_ADDRESSES:
+            if not any(lo <= addr < hi for lo, hi in spans):
+                raw[addr] = 0
+                spans.append((addr, addr + 1))
+
+        def untouched(reg):
+            return all(reg.addr + reg.size <= lo or reg.addr >= hi for lo, hi in spans)
+
+        snapshot = RegisterSnapshot(raw, monotonic, wall, self.generation + 1)
+        for name, decoded in self._registers.items():
+            if untouched(REGISTERS_BY_NAME[name]):
+                snapshot._registers[name] = decoded
+        for name, value in self._values.items():
+            if untouched(FIELDS_BY_NAME[name][0]):
+                snapshot._values[name] = value
+        return snapshot
+
+    def raw_value(self, reg):
+        '''
+        Returns the raw (8 or 16 bit) value of reg, given as Register, name or address.
+        '''
+        if not isinstance(reg, Register):
+            reg = REGISTERS_BY_NAME[reg] if isinstance(reg, str) else REGISTERS_BY_ADDR[reg]
+        return raw_value(reg, self.raw)
+
+    def value(self, name):
+        '''
+        Returns the decoded value of the bitfield name, e.g. "VBAT_ADC",
+        or its datasheet string, e.g. "CHG_STAT_STRG".
+        '''
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        reg, f = FIELDS_BY_NAME[name]
+        if name == f.name:
+            value = decode_field(f, raw_value(reg, self.raw))
+        else:
+            value = self.register(reg.name)[name]
+        self._values[name] = value
+        return value
+
+    def register(self, name):
+        '''
+        Returns a dict with all decoded bitfields of the register name, e.g. "REG1C_Charger_Status_1".
+        '''
+        decoded = self._registers.get(name)
+        if decoded is None:
+            reg = REGISTERS_BY_NAME[name]
+            decoded = decode_into(reg, raw_value(reg, self.raw), {})
+            self._registers[name] = decoded
+        return dict(decoded)
@@ -0,0 +1,185 @@
+#!/usr/bin/python3
+""" Module mupihat_samplelog.py, class: SampleLog
+Sample log of the charger values, one CSV or JSON-lines row per sample.
+
+All values of a row come from the same register snapshot. The rows are written
+to a buffered file that is flushed every flush_s and rotated at max_bytes
+(<path>.1 ... <path>.<backups>), every CSV file starts with the header row.
+
+Columns
+-------
+time          : local time of the register read, YYYY-mm-dd HH:MM:SS.fff
+CHG_STAT      : charger status string (REG1C)
+VBAT, VBUS, VSYS : voltages in mV
+IBAT, IBUS    : currents in mA (IBAT negative when discharging)
+TDIE          : charger IC temperature in °C
+TREG_STAT     : 1 if the charger is in thermal regulation
+TREG, TSHUT   : thermal regulation / shutdown threshold
+VREG          : charge voltage limit in mV
+IINDPM        : input current limit in mA
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import csv
+import io
+import json
+import os
+import time
+
+FORMATS = ("csv", "jsonl")
+
+# (column, snapshot value)
+COLUMNS = (
+    ("CHG_STAT", "CHG_STAT_STRG"),
+    ("VBAT", "VBAT_ADC"),
+    ("IBAT", "IBAT_ADC"),
+    ("VBUS", "VBUS_ADC"),
+    ("IBUS", "IBUS_ADC"),
+    ("VSYS", "VSYS_ADC"),
+    ("TDIE", "TemperatureIC"),
+    ("TREG_STAT", "TREG_STAT"),
+    ("TREG", "TREG_str"),
+    ("TSHUT", "TSHUT_str"),
+    ("VREG", "VREG"),
+    ("IINDPM", "IINDPM"),
+)
+HEADER = ("time",) + tuple(column for column, _ in COLUMNS)
+
+# defaults: 1 MB per file, two backups, flushed every 30 s
+MAX_BYTES = 1024 * 1024
+BACKUPS = 2
+FLUSH_S = 30
+BUFFER_SIZE = 64 * 1024
+
+
+def format_from_path(path):
+    ''' "jsonl" for a .jsonl / .json file, else "csv" '''
+    return "jsonl" if os.path.splitext(path)[1] in (".jsonl", ".json") else "csv"
+
+
+class SampleLog:
+    """
+    Buffered, size-capped, rotating sample log.
+
+    Parameters
+    ----------
+    path : str
+        path of the log file, the directory must exist.
+    fmt : str
+        "csv" or "jsonl" (default: from the file extension).
+    max_bytes : int
+        size of a file before it is rotated (default: 1 MB).
+    backups : int
+        number of rotated files kept (default: 2).
+    flush_s : float
+        maximal time in s a row stays in the buffer (default: 30).
+
+    Attributes
+    ----------
+    rows : int
+        number of written rows.
+    """
+    def __init__(self, path, fmt=None, max_bytes=MAX_BYTES, backups=BACKUPS, flush_s=FLUSH_S):
+        fmt = format_from_path(path) if fmt is None else fmt
+        if fmt not in FORMATS:
+            raise ValueError("unknown sample log format %r, expected one of %s" % (fmt, ", ".join(FORMATS)))
+        self.path = path
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_s = flush_s
+        self.rows = 0
+        self._file = None
+        self._size = 0
+        self._header_size = len(self._header().encode("utf-8"))
+        self._last_flush = time.monotonic()
+        self._open()
+
+    def _header(self):
+        if self.fmt != "csv":
+            return ""
+        return self._csv_row(HEADER)
+
+    @staticmethod
+    def _csv_row(values):
+        out = io.StringIO()
+        csv.writer(out, lineterminator="\n").writerow(values)
+        return out.getvalue()
+
+    def _open(self):
+        ''' opens the log file for appending, a file with another header is rotated first '''
+        header = self._header()
+        if header and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, encoding="utf-8") as infile:
+                if infile.readline() != header:
+                    self._rotate_files()
+        self._file = open(self.path, "ab", buffering=BUFFER_SIZE)
+        self._size = os.fstat(self._file.fileno()).st_size
+        if self._size == 0:
+            self._file.write(header.encode("utf-8"))
+            self._size = self._header_size
+
+    def _rotate_files(self):
+        ''' path -> path.1 -> ... -> path.<backups>, the oldest is deleted '''
+        if self.backups < 1:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists("%s.%d" % (self.path, i)):
+                os.replace("%s.%d" % (self.path, i), "%s.%d" % (self.path, i + 1))
+        os.replace(self.path, self.path + ".1")
+
+    def format(self, snapshot):
+        '''
+        Returns the row of a RegisterSnapshot as line.
+        '''
+        ms = int(snapshot.wall * 1000) % 1000
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot.wall)) + ".%03d" % ms
+        values = [snapshot.value(value) for _, value in COLUMNS]
+        if self.fmt == "csv":
+            return self._csv_row([stamp] + values)
+        return json.dumps(dict(zip(HEADER, [stamp] + values)), ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def write(self, snapshot):
+        '''
+        Appends the row of a RegisterSnapshot. Raises OSError if the file could not be written.
+        '''
+        line = self.format(snapshot).encode("utf-8")
+        if self._size + len(line) > self.max_bytes and self._size > self._header_size:
+            self._file.close()
+            self._rotate_files()
+            self._open()
+        self._file.write(line)
+        self._size += len(line)
+        self.rows += 1
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_s:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
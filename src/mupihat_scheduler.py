@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+""" Module mupihat_scheduler.py, class: PollScheduler
+Deadline scheduler of the poll loop, every job (a register group of
+mupihat_registers.REGISTER_GROUPS or another periodic task) has its own period.
+
+The deadlines are kept in a heap on the monotonic clock: a job runs at
+start + n * period no matter how long the other jobs took, a late job is not
+repeated to catch up. Jobs due within the slack are returned together, so their
+register groups are read in one pass (bq25792.read_registers merges adjacent
+groups into one block read).
+
+Usage
+-----
+scheduler = PollScheduler({"adc": 1.0, "config": 5.0, "part": None})
+while True:
+    hat.read_registers(scheduler.due())
+    time.sleep(scheduler.wait_s())
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import heapq
+import time
+
+# jobs due within this time in s run together with the due jobs
+DEFAULT_SLACK_S = 0.05
+
+
+class PollScheduler:
+    """
+    Monotonic deadline heap of periodic jobs.
+
+    Parameters
+    ----------
+    periods : dict
+        {job: period in s}, None or 0 runs the job only once. All jobs are due at the start.
+    slack_s : float
+        jobs due within slack_s are returned with the due jobs (default: 0.05).
+
+    Attributes
+    ----------
+    runs : dict
+        {job: number of runs}
+    late : int
+        number of deadlines skipped because the loop was late by more than a period.
+    """
+    def __init__(self, periods, slack_s=DEFAULT_SLACK_S, now=None):
+        for job, period in periods.items():
+            if period is not None and period < 0:
+                raise ValueError("period of %s must not be negative, got %s" % (job, period))
+        self.periods = dict(periods)
+        self.slack_s = slack_s
+        self.runs = dict.fromkeys(self.periods, 0)
+        self.late = 0
+        now = time.monotonic() if now is None else now
+        self._order = {job: i for i, job in enumerate(self.periods)}
+        self._deadline = dict.fromkeys(self.periods, now)
+        self._heap = [(now, self._order[job], job) for job in self.periods]
+        heapq.heapify(self._heap)
+
+    def due(self, now=None):
+        '''
+        Returns the jobs due at now (default: monotonic time) in the order of periods
+        and schedules their next run.
+        '''
+        now = time.monotonic() if now is None else now
+        heap = self._heap
+        jobs = []
+        while heap and heap[0][0] <= now + self.slack_s:
+            deadline, _, job = heapq.heappop(heap)
+            if self._deadline.get(job) != deadline:
+                continue  # replaced by trigger()
+            jobs.append(job)
+            self.runs[job] += 1
+            period = self.periods[job]
+            if not period:
+                del self._deadline[job]
+                continue
+            deadline += period
+            if deadline <= now:
+                # more than a period late, continue from now instead of catching up
+                self.late += 1
+                deadline = now + period
+            self._deadline[job] = deadline
+            heapq.heappush(heap, (deadline, self._order[job], job))
+        jobs.sort(key=self._order.get)
+        return jobs
+
+    def trigger(self, job, now=None):
+        '''
+        Makes job due at now (default: monotonic time), its period continues from there.
+        '''
+        if job not in self.periods:
+            raise ValueError("unknown job %r, expected one of %s" % (job, ", ".join(self.periods)))
+        now = time.monotonic() if now is None else now
+        self._deadline[job] = now
+        heapq.heappush(self._heap, (now, self._order[job], job))
+
+    def next_deadline(self):
+        '''
+        Returns the monotonic time of the next due job, None if no job is left.
+        '''
+        heap = self._heap
+        while heap and self._deadline.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)  # replaced by trigger()
+        return heap[0][0] if heap else None
+
+    def wait_s(self, now=None):
+        '''
+        Returns the time in s until the next due job, None if no job is left.
+        '''
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - (time.monotonic() if now is None else now))
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+""" Module mupihat_server.py, HTTP serving of the MuPiHAT web API
+The web API runs in the same process as the I2C poller, so the server must
+neither start unbounded threads nor keep dead connections forever.
+
+Servers
+-------
+waitress : production WSGI server (pip install waitress), bounded worker pool,
+           HTTP/1.1 keep-alive, connection limit and idle timeout
+dev      : Werkzeug development server of Flask, one thread per request
+auto     : waitress if installed, else dev
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import logging
+
+SERVERS = ("auto", "waitress", "dev")
+
+# worker threads of the waitress server
+DEFAULT_THREADS = 6
+# idle connections are closed after this time in s, longer than the SSE keep-alive
+DEFAULT_TIMEOUT_S = 30
+# maximal number of open connections, beyond new connections wait in the backlog
+CONNECTION_LIMIT = 64
+
+
+class WaitressServer:
+    """
+    waitress with a bounded worker pool, keep-alive and idle connection timeout.
+    """
+    name = "waitress"
+
+    def __init__(self, app, host, port, threads=DEFAULT_THREADS, timeout_s=DEFAULT_TIMEOUT_S):
+        import waitress
+        # a full task queue is expected under load, not worth a warning per request
+        logging.getLogger("waitress.queue").setLevel(logging.ERROR)
+        self.threads = threads
+        self.server = waitress.create_server(
+            app, host=host, port=port, threads=threads,
+            channel_timeout=timeout_s, connection_limit=CONNECTION_LIMIT,
+            ident="mupihat", clear_untrusted_proxy_headers=True)
+        self.port = int(self.server.effective_port)  # waitress returns the port as str
+
+    def serve_forever(self):
+        self.server.run()
+
+    def close(self):
+        self.server.close()
+
+
+class DevServer:
+    """
+    Werkzeug development server, a new thread for every request.
+    """
+    name = "dev"
+
+    def __init__(self, app, host, port, threads=None, timeout_s=None):
+        from werkzeug.serving import make_server
+        self.threads = threads
+        self.server = make_server(host, port, app, threaded=True)
+        self.port = self.server.server_port
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_server(app, server="auto", host="0.0.0.0", port=5000, threads=DEFAULT_THREADS, timeout_s=DEFAULT_TIMEOUT_S):
+    '''
+    Returns the server for the WSGI app, port 0 selects a free port (see .port).
+    "auto" uses waitress and falls back to the dev server if waitress is not installed.
+    Raises ValueError for an unknown server, ImportError if waitress is requested but missing.
+    '''
+    if server not in SERVERS:
+        raise ValueError("unknown server %r, expected one of %s" % (server, ", ".join(SERVERS)))
+    if server in ("auto", "waitress"):
+        try:
+            return WaitressServer(app, host, port, threads, timeout_s)
+        except ImportError as _error:
+            if server == "waitress":
+                raise
+            logging.warning("waitress not installed, using the development server, %s", str(_error))
+    return DevServer(app, host, port, threads, timeout_s)
@@ -0,0 +1,286 @@
+#!/usr/bin/python3
+""" Module mupihat_shm.py, classes: StatusPublisher, StatusClient
+Latest MuPiHAT status (bq25792.to_json()) in a shared memory segment for the
+consumers on the box, instead of reading /tmp/mupihat.json with jq.
+
+The service writes the segment every poll, a reader copies it without any
+request to the service. Concurrent writes are detected by a seqlock: the
+sequence number is odd while the payload is written, a reader retries if it
+was odd or changed during the copy, a CRC32 of the payload guards against
+reordered stores on weakly ordered CPUs. A reader returns the decoded status of
+an unchanged sequence number from its cache, a read takes about 1 µs then.
+
+The segment is a plain file in /dev/shm mapped with mmap (not
+multiprocessing.shared_memory, its resource tracker unlinks the segment when a
+reading process exits). The service reuses an existing segment, so readers keep
+their mapping across restarts of the service.
+
+For shell scripts the publisher also writes the status as key=value lines to
+<path>.env (written to a temporary file and renamed, a reader never sees a
+partial file). A script sources it without starting any process, the
+MUPIHAT_TS line (Unix time of the register read) detects a stale status:
+
+    . /dev/shm/mupihat.env && [ $(( $(printf '%(%s)T' -1) - MUPIHAT_TS )) -le 300 ]
+
+Segment (little endian)
+-------
+magic       8s  b"MUPISHM\\0"
+version     H   1
+header_size H   48
+capacity    I   payload capacity in bytes
+seq         Q   seqlock sequence number, odd while the payload is written
+generation  Q   snapshot generation of the payload
+wall        d   Unix time of the register read
+length      I   payload length
+crc         I   CRC32 of the payload
+payload         compact JSON of bq25792.to_json()
+
+Call
+-------
+python3 -B mupihat_shm.py Vbus Bat_Stat                       # one value per line
+eval "$(python3 -B mupihat_shm.py --shell Vbus Bat_Stat)"     # sets Vbus and Bat_Stat
+python3 -B mupihat_shm.py                                     # JSON of all values
+
+Returns
+-------
+exit code 0, 1 if the segment is missing or invalid, 2 if the status is older than --max-age
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import argparse
+import json
+import mmap
+import os
+import re
+import shlex
+import struct
+import sys
+import time
+import zlib
+
+SHM_PATH = "/dev/shm/mupihat"
+MAGIC = b"MUPISHM\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQdII")
+SEQ = struct.Struct("<Q")
+SEQ_OFFSET = 16
+# payload fields behind the sequence number: generation, wall, length, crc
+STATE = struct.Struct("<QdII")
+STATE_OFFSET = SEQ_OFFSET + SEQ.size
+
+# payload capacity in bytes, to_json() takes about 250
+CAPACITY = 4096
+
+# suffix of the key=value file for shell scripts
+ENV_SUFFIX = ".env"
+# keys of the status that are valid shell variable names
+SHELL_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+# reads of a reader before it gives up on a segment that is written continuously
+READ_RETRIES = 100
+
+
+class ShmError(Exception):
+    """Custom exception for a missing, invalid or unreadable status segment."""
+    pass
+
+
+class StatusPublisher:
+    """
+    Writer of the status segment, used by the service.
+
+    Parameters
+    ----------
+    path : str
+        path of the segment (default: /dev/shm/mupihat).
+    capacity : int
+        payload capacity in bytes of a new segment (default: 4096).
+    mode : int
+        file permissions (default: 0o644, readable for the consumers).
+    env_path : str
+        key=value file for shell scripts (default: path + ".env"), None to disable.
+    """
+    def __init__(self, path=SHM_PATH, capacity=CAPACITY, mode=0o644, env_path=""):
+        self.path = path
+        self.mode = mode
+        self.env_path = path + ENV_SUFFIX if env_path == "" else env_path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, mode)
+        try:
+            size = os.fstat(fd).st_size
+            header = HEADER.unpack(os.pread(fd, HEADER.size, 0)) if size >= HEADER.size else None
+            if header is None or header[:3] != (MAGIC, VERSION, HEADER.size) or size != HEADER.size + header[3]:
+                # new segment or one of another version
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, HEADER.size + capacity)
+                os.pwrite(fd, HEADER.pack(MAGIC, VERSION, HEADER.size, capacity, 0, 0, 0.0, 0, 0), 0)
+                size = HEADER.size + capacity
+            os.fchmod(fd, mode)
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.capacity = size - HEADER.size
+        # continue the sequence of a previous run, even: no write in progress
+        self.seq = (SEQ.unpack_from(self._mm, SEQ_OFFSET)[0] + 1) & ~1
+
+    def publish(self, data, generation=0, wall=None):
+        '''
+        Writes data (dict) as new status of the snapshot generation, read at wall.
+        Raises ValueError if the payload exceeds the capacity, OSError if the env file can not be written.
+        '''
+        body = json.dumps(data, separators=(",", ":")).encode()
+        if len(body) > self.capacity:
+            raise ValueError("status of %d bytes exceeds the segment capacity of %d bytes" % (len(body), self.capacity))
+        wall = time.time() if wall is None else wall
+        mm = self._mm
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq + 1)  # odd: write in progress
+        mm[HEADER.size:HEADER.size + len(body)] = body
+        STATE.pack_into(mm, STATE_OFFSET, generation, wall, len(body), zlib.crc32(body))
+        self.seq += 2
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq)
+        if self.env_path:
+            self.write_env(data, generation, wall)
+
+    def write_env(self, data, generation, wall):
+        '''
+        Replaces the key=value file with the status, scalar values only.
+        '''
+        lines = ["MUPIHAT_GENERATION=%d" % generation, "MUPIHAT_TS=%d" % wall]
+        for key, value in data.items():
+            if SHELL_KEY.match(key) and not isinstance(value, (dict, list)):
+                lines.append("%s=%s" % (key, shlex.quote(str(value))))
+        temp = "%s.%d.tmp" % (self.env_path, os.getpid())
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, self.mode)
+        try:
+            os.write(fd, ("\n".join(lines) + "\n").encode())
+            os.fchmod(fd, self.mode)
+        finally:
+            os.close(fd)
+        os.replace(temp, self.env_path)
+
+    def close(self):
+        self._mm.close()
+
+
+class StatusClient:
+    """
+    Reader of the status segment.
+
+    Parameters
+    ----------
+    path : str
+        path of the segment (default: /dev/shm/mupihat).
+
+    Attributes
+    ----------
+    generation : int
+        snapshot generation of the last read status.
+    wall : float
+        Unix time of the register read of the last read status.
+
+    Raises ShmError if the segment does not exist or is no MuPiHAT status segment.
+    """
+    def __init__(self, path=SHM_PATH):
+        self.path = path
+        try:
+            with open(path, "rb") as infile:
+                self._mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as _error:
+            raise ShmError("%s: %s" % (path, str(_error))) from _error
+        if len(self._mm) < HEADER.size:
+            raise ShmError("%s: segment too short" % path)
+        magic, version, header_size, capacity = HEADER.unpack_from(self._mm)[:4]
+        if magic != MAGIC or version != VERSION or header_size != HEADER.size:
+            raise ShmError("%s: no MuPiHAT status segment" % path)
+        self._seq = None
+        self._data = None
+        self.generation = 0
+        self.wall = 0.0
+
+    def read(self):
+        '''
+        Returns the latest status as dict, the cached dict if it did not change since the last read.
+        Raises ShmError if the service has not published a status yet or the segment stays inconsistent.
+        '''
+        mm = self._mm
+        for _ in range(READ_RETRIES):
+            seq = SEQ.unpack_from(mm, SEQ_OFFSET)[0]
+            if seq == self._seq:
+                return self._data
+            if seq == 0:
+                raise ShmError("%s: no status published yet" % self.path)
+            if seq & 1:
+                time.sleep(0)  # write in progress
+                continue
+            generation, wall, length, crc = STATE.unpack_from(mm, STATE_OFFSET)
+            body = mm[HEADER.size:HEADER.size + min(length, len(mm) - HEADER.size)]
+            if SEQ.unpack_from(mm, SEQ_OFFSET)[0] != seq or zlib.crc32(body) != crc:
+                continue  # overwritten during the copy
+            self._data = json.loads(body)
+            self._seq, self.generation, self.wall = seq, generation, wall
+            return self._data
+        raise ShmError("%s: no consistent status after %d reads" % (self.path, READ_RETRIES))
+
+    def get(self, key, default=None):
+        ''' value of key of the latest status '''
+        return self.read().get(key, default)
+
+    @property
+    def age(self):
+        ''' age of the last read status in s '''
+        return time.time() - self.wall
+
+    def close(self):
+        self._mm.close()
+
+
+def parse_arguments():
+    """Parses command-line arguments using argparse."""
+    parser = argparse.ArgumentParser(description="Query the MuPiHAT status without parsing /tmp/mupihat.json")
+    parser.add_argument("keys", nargs="*", help="Values to print, e.g. Vbus Bat_Stat (default: all as JSON)")
+    parser.add_argument("--path", type=str, default=SHM_PATH, help="Status segment of the service")
+    parser.add_argument("--shell", action="store_true", help="Print key=value lines for eval in shell scripts")
+    parser.add_argument("--max-age", type=float, help="Exit code 2 if the status is older than max-age s")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    try:
+        client = StatusClient(args.path)
+        data = client.read()
+    except ShmError as _error:
+        sys.stderr.write("mupihat_shm: %s\n" % str(_error))
+        sys.exit(1)
+    if not args.keys:
+        print(json.dumps(dict(data, generation=client.generation, ts=client.wall)))
+    for key in args.keys:
+        value = data.get(key, "")
+        if args.shell:
+            print("%s=%s" % (key, shlex.quote(str(value))))
+        else:
+            print(value)
+    if args.max_age is not None and client.age > args.max_age:
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/python3
+""" Module mupihat_sim.py, class: SimulatedBQ25792
+In-process simulation of the BQ25792 charger IC on the I2C bus, to run the
+driver, mupihat.py and the web API without MuPiHAT hardware.
+
+Modelled behaviour
+------------------
+- 73 byte register file with power-on reset values
+- writes change only the bitfields of RW registers, RO registers ignore writes
+- the flag registers REG22 - REG27 are cleared on read
+- REG_RST resets all registers, REG_RST / WD_RST / FORCE_* bits clear themselves
+- I2C watchdog (REG10 WATCHDOG), expiry sets WD_STAT / WD_FLAG and resets the configuration
+- one-shot ADC conversion (ADC_RATE = 1) sets ADC_DONE_STAT / ADC_DONE_FLAG and clears ADC_EN
+- scriptable ADC and status values, a dict or a function of the simulation time
+- INT pin: a flag set with its interrupt unmasked (REG28 - REG2D) pulses int_line
+
+Usage
+-----
+sim = SimulatedBQ25792(values={"VBAT_ADC": 7600, "VBAT_PRESENT_STAT": 1})
+hat = bq25792(bus=sim)
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import errno
+import threading
+import time
+
+import mupihat_registers as registers
+
+# watchdog timeout in s for the REG10 WATCHDOG codes, 0 = disabled
+WATCHDOG_TIMEOUT_S = (0, 0.5, 1, 2, 20, 40, 80, 160)
+
+# clear-on-read flag registers REG22 - REG27
+CLEAR_ON_READ = frozenset(reg.addr for reg in registers.REGISTERS if reg.access == "RC")
+
+# status bits and the flag set on their change
+STATUS_FLAGS = {
+    "IINDPM_STAT": "IINDPM_FLAG",
+    "VINDPM_STAT": "VINDPM_FLAG",
+    "POORSRC_STAT": "POORSRC_FLAG",
+    "PG_STAT": "PG_FLAG",
+    "AC2_PRESENT_STAT": "VAC2_PRESENT_FLAG",
+    "AC1_PRESENT_STAT": "VAC1_PRESENT_FLAG",
+    "VBUS_PRESENT_STAT": "VBUS_PRESENT_FLAG",
+    "CHG_STAT": "CHG_FLAG",
+    "ICO_STAT": "ICO_FLAG",
+    "VBUS_STAT": "VBUS_FLAG",
+    "TREG_STAT": "TREG_FLAG",
+    "VBAT_PRESENT_STAT": "VBAT_PRESENT_FLAG",
+    "VSYS_STAT": "VSYS_FLAG",
+    "TS_COLD_STAT": "TS_COLD_FLAG",
+    "TS_COOL_STAT": "TS_COOL_FLAG",
+    "TS_WARM_STAT": "TS_WARM_FLAG",
+    "TS_HOT_STAT": "TS_HOT_FLAG",
+}
+
+# values of a charging MuPiHAT with a 2s battery on USB-C
+DEFAULT_VALUES = {
+    "VBUS_PRESENT_STAT": 1,
+    "PG_STAT": 1,
+    "CHG_STAT": 3,
+    "VBUS_STAT": 3,
+    "VBAT_PRESENT_STAT": 1,
+    "IBUS_ADC": 850,
+    "IBAT_ADC": 1200,
+    "VBUS_ADC": 5050,
+    "VAC1_ADC": 5050,
+    "VBAT_ADC": 7600,
+    "VSYS_ADC": 7650,
+    "TS_ADC": 512,
+    "TDIE_ADC": 70,
+    "ICO_ILIM": 2200,
+}
+
+
+class SimulatedBQ25792:
+    """
+    Simulated BQ25792, usable as bus object of bq25792 (bus=SimulatedBQ25792(...) or bus="sim").
+
+    Parameters
+    ----------
+    i2c_device : int
+        ignored, for the bus factory interface.
+    i2c_addr : int
+        device address the simulation answers on (default: 0x6b).
+    values : dict or callable
+        bitfield values (e.g. {"VBAT_ADC": 7400}) applied on every read, or a function
+        of the simulation time in s returning such a dict (default: DEFAULT_VALUES).
+    clock : callable
+        monotonic clock in s (default: time.monotonic).
+    adc_conversion_s : float
+        duration of a one-shot ADC conversion in s (default: 0.0).
+    int_line : object
+        INT pin, trigger() is called for every unmasked flag that is set,
+        e.g. mupihat_events.FakeLine (default: None).
+    byte_time_s : float
+        bus time per transferred byte in s, a transaction blocks for
+        (address + register + data bytes) * byte_time_s, e.g. 25e-6 at 400 kHz (default: 0.0).
+
+    Attributes
+    ----------
+    transactions : int
+        number of bus transactions.
+    bytes_transferred : int
+        number of register bytes read and written.
+    """
+    max_block = 0x100
+
+    def __init__(self, i2c_device=1, i2c_addr=0x6b, values=None, clock=time.monotonic, adc_conversion_s=0.0, int_line=None, byte_time_s=0.0):
+        self.i2c_addr = i2c_addr
+        self.values = DEFAULT_VALUES if values is None else values
+        self.clock = clock
+        self.adc_conversion_s = adc_conversion_s
+        self.int_line = int_line
+        self.byte_time_s = byte_time_s
+        self.transactions = 0
+        self.bytes_transferred = 0
+        self._lock = threading.Lock()
+        self._start = clock()
+        self._adc_started = None
+        self.power_on_reset()
+
+    def power_on_reset(self):
+        '''
+        Resets the register file to the power-on values and restarts the watchdog.
+        '''
+        self.regs = bytearray(registers.por_image())
+        self._kicked = self.clock()
+        self._adc_started = None
+        self._apply_values(adc=True)
+
+    def set_values(self, **values):
+        '''
+        Sets bitfield values, e.g. set_values(VBAT_ADC=6900, CHG_STAT=0).
+        Fixed values are merged into the scripted values, a script is replaced.
+        '''
+        with self._lock:
+            if callable(self.values):
+                self.values = dict(values)
+            else:
+                self.values = dict(self.values, **values)
+            self._apply_values(adc=True)
+
+    def set_field(self, name, value):
+        '''
+        Sets a single bitfield in the register file, e.g. a status or flag bit.
+        '''
+        reg, f = registers.FIELDS_BY_NAME[name]
+        raw = registers.encode_field(f, value, registers.raw_value(reg, self.regs))
+        self.regs[reg.addr:reg.addr + reg.size] = bytes(registers.raw_bytes(reg, raw))
+
+    def field(self, name):
+        '''
+        Returns the decoded value of a bitfield of the register file.
+        '''
+        reg, f = registers.FIELDS_BY_NAME[name]
+        return registers.decode_field(f, registers.raw_value(reg, self.regs))
+
+    def _set_flag(self, name):
+        '''
+        Sets a flag and pulses the INT pin if its interrupt is not masked.
+        '''
+        self.set_field(name, 1)
+        if self.int_line is not None and not self.field(name[:-len("_FLAG")] + "_MASK"):
+            self.int_line.trigger()
+
+    def _apply_values(self, adc=False):
+        '''
+        Applies the scripted values, ADC results (*_ADC) only if adc is set.
+        A changed status bit sets its flag.
+        '''
+        values = self.values(self.clock() - self._start) if callable(self.values) else self.values
+        for name, value in values.items():
+            if name.endswith("_ADC") and not adc:
+                continue
+            if name in STATUS_FLAGS and self.field(name) != value:
+                self._set_flag(STATUS_FLAGS[name])
+            self.set_field(name, value)
+
+    def _update(self):
+        '''
+        Advances watchdog and ADC to the current time.
+        '''
+        now = self.clock()
+        timeout = WATCHDOG_TIMEOUT_S[self.field("WATCHDOG")]
+        if timeout and now - self._kicked > timeout:
+            self._watchdog_expired()
+            self._kicked = now
+        if self._adc_started is not None and now - self._adc_started >= self.adc_conversion_s:
+            # one-shot conversion done
+            self._adc_started = None
+            self._apply_values(adc=True)
+            self.set_field("ADC_EN", 0)
+            self.set_field("ADC_DONE_STAT", 1)
+            self._set_flag("ADC_DONE_FLAG")
+        else:
+            # continuous conversion updates the ADC results
+            self._apply_values(adc=self._adc_started is None and self.field("ADC_EN"))
+
+    def _watchdog_expired(self):
+        '''
+        Watchdog expiry: configuration back to power-on values, WD_STAT and WD_FLAG set.
+        '''
+        por = registers.por_image()
+        for addr in registers.WRITABLE_ADDRESSES:
+            self.regs[addr] = por[addr]
+        self.set_field("WD_STAT", 1)
+        self._set_flag("WD_FLAG")
+
+    def _check_addr(self, i2c_addr):
+        if i2c_addr != self.i2c_addr:
+            # no acknowledge from the address, as the i2c-dev driver reports it
+            raise OSError(errno.EREMOTEIO, "Remote I/O error")
+        self.transactions += 1
+
+    def _transfer(self, length):
+        ''' occupies the bus for a transaction of length data bytes '''
+        if self.byte_time_s:
+            time.sleep((length + 2) * self.byte_time_s)
+
+    def _write(self, register, data):
+        for i, value in enumerate(data):
+            addr = register + i
+            if addr >= registers.REGISTER_FILE_SIZE or addr not in registers.WRITABLE_ADDRESSES:
+                continue
+            mask = registers.FIELD_MASK[addr]
+            self.regs[addr] = (self.regs[addr] & ~mask & 0xFF) | (value & mask)
+        self.bytes_transferred += len(data)
+        if self.field("REG_RST"):
+            self.power_on_reset()
+            return
+        if self.field("WD_RST"):
+            self._kicked = self.clock()
+            self.set_field("WD_STAT", 0)
+        if self.field("ADC_EN") and self.field("ADC_RATE") and self._adc_started is None:
+            self._adc_started = self.clock()
+            self.set_field("ADC_DONE_STAT", 0)
+        # self-clearing bits read back as 0
+        for addr in range(register, min(register + len(data), registers.REGISTER_FILE_SIZE)):
+            self.regs[addr] &= ~registers.SELF_CLEARING[addr] & 0xFF
+
+    # bus interface
+    def read_i2c_block_data(self, i2c_addr, register, length):
+        with self._lock:
+            self._check_addr(i2c_addr)
+            self._transfer(length)
+            self._update()
+            data = [self.regs[addr] if addr < registers.REGISTER_FILE_SIZE else 0
+                    for addr in range(register, register + length)]
+            for addr in CLEAR_ON_READ.intersection(range(register, register + length)):
+                self.regs[addr] = 0
+            self.bytes_transferred += length
+            return data
+
+    def write_byte_data(self, i2c_addr, register, value):
+        with self._lock:
+            self._check_addr(i2c_addr)
+            self._transfer(1)
+            self._update()
+            self._write(register, [value])
+
+    def write_i2c_block_data(self, i2c_addr, register, data):
+        with self._lock:
+            self._check_addr(i2c_addr)
+            self._transfer(len(data))
+            self._update()
+            self._write(register, list(data))
+
+    def close(self):
+        pass
@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+""" Module mupihat_stream.py, classes: SnapshotStream, StreamClient
+Server-Sent Events (SSE) stream of the register snapshots for /api/stream.
+
+Every new snapshot is encoded once, as full "registers" event and as "changes"
+event holding only the changed bitfields, and the same bytes are queued for all
+clients. A client queue is bounded: a client that can not keep up loses the
+queued events and gets the latest full state instead (drop-to-latest), so a slow
+client never blocks the poller or the other clients.
+
+Events
+------
+id: <generation>
+event: registers | changes
+data: {"REG1C_Charger_Status_1": {"CHG_STAT": 3, ...}, ...}
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import json
+import threading
+from collections import deque
+
+# comment line sent to idle clients, keeps proxies from closing the connection
+KEEPALIVE = b": keep-alive\n\n"
+
+
+def sse_event(event, generation, data):
+    '''
+    Returns the SSE message bytes of data as compact JSON.
+    '''
+    body = json.dumps(data, separators=(",", ":"))
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (generation, event.encode(), body.encode())
+
+
+def changed_fields(previous, current):
+    '''
+    Returns the bitfields of current that differ from previous, {register: {bitfield: value}}.
+    '''
+    changes = {}
+    for name, fields in current.items():
+        before = previous.get(name)
+        if before == fields:
+            continue
+        if not isinstance(fields, dict) or not isinstance(before, dict):
+            changes[name] = fields
+            continue
+        changes[name] = {key: value for key, value in fields.items() if key not in before or before[key] != value}
+    return changes
+
+
+class StreamClient:
+    """
+    Bounded event queue of one stream client.
+
+    Attributes
+    ----------
+    dropped : int
+        number of queue overflows, each replaced the queued events by the latest full state.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.closed = False
+        self._items = deque()
+        self._full = True  # the first event is always the full state
+        self._condition = threading.Condition()
+
+    def put(self, message):
+        '''
+        Queues message (generation, full event, changes event), never blocks.
+        '''
+        with self._condition:
+            if len(self._items) >= self.maxsize:
+                # drop-to-latest, the client continues with the full state
+                self._items.clear()
+                self._full = True
+                self.dropped += 1
+            self._items.append(message)
+            self._condition.notify()
+
+    def get(self, timeout_s):
+        '''
+        Returns the next SSE message bytes, None if there was none within timeout_s.
+        '''
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items or self.closed, timeout_s) or not self._items:
+                return None
+            generation, full, changes = self._items.popleft()
+            if self._full or changes is None:
+                self._full = False
+                return full
+            return changes
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+
+
+class SnapshotStream:
+    """
+    Publishes the register data of each snapshot generation to the stream clients.
+
+    Parameters
+    ----------
+    max_clients : int
+        maximal number of clients, subscribe() returns None beyond (default: 32).
+    queue_size : int
+        events queued per client before drop-to-latest (default: 8).
+    """
+    def __init__(self, max_clients=32, queue_size=8):
+        self.max_clients = max_clients
+        self.queue_size = queue_size
+        self._clients = set()
+        self._lock = threading.Lock()
+        self._last = None       # (generation, full event, changes event)
+        self._last_data = None
+
+    @property
+    def clients(self):
+        return len(self._clients)
+
+    def subscribe(self):
+        '''
+        Returns a new StreamClient holding the latest full state, None if there are too many clients.
+        '''
+        with self._lock:
+            if len(self._clients) >= self.max_clients:
+                return None
+            client = StreamClient(self.queue_size)
+            if self._last is not None:
+                client.put(self._last)
+            self._clients.add(client)
+            return client
+
+    def unsubscribe(self, client):
+        with self._lock:
+            self._clients.discard(client)
+        client.close()
+
+    def publish(self, generation, data):
+        '''
+        Encodes data of the snapshot generation once and queues it for all clients.
+        '''
+        with self._lock:
+            if self._last is not None and self._last[0] == generation:
+                return
+            changes = None
+            if self._last_data is not None:
+                changed = changed_fields(self._last_data, data)
+                if not changed:
+                    return  # nothing to send, the clients have this state
+                changes = sse_event("changes", generation, changed)
+            full = sse_event("registers", generation, data)
+            self._last = (generation, full, changes)
+            self._last_data = data
+            for client in self._clients:
+                client.put(self._last)
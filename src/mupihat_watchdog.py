@@ -0,0 +1,183 @@
+#!/usr/bin/python3
+""" Module mupihat_watchdog.py, class: WatchdogKeeper
+Keeps the I2C watchdog of the BQ25792 (REG10 WATCHDOG) from expiring, with as
+few REG10 writes as possible. When the watchdog expires the charger resets its
+configuration to the defaults.
+
+- the watchdog is kicked (WD_RST) at a fraction of the programmed timeout, on
+  its own monotonic deadline
+- a kick rides along with a register read of the poll loop once the piggyback
+  part of the kick interval passed, the poll loop does not wake up for it
+- a monitor thread logs an error if there was no kick for the margin of the
+  timeout, i.e. the poll loop stalled and the configuration will be lost
+
+With the 160 s watchdog of write_defaults() and the 1 Hz poll the watchdog is
+kicked about every 60 s instead of every 5 s.
+
+Licence
+-------
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>
+"""
+__author__ = "Lars Stopfkuchen"
+__license__ = "GPLv3"
+__version__ = "0.1.0"
+__email__ = "larsstopfkuchen@mupihat.de"
+__status__ = "released"
+
+import logging
+import threading
+import time
+
+# watchdog timeout in s of the REG10 WATCHDOG codes, None: disabled
+WATCHDOG_TIMEOUTS_S = (None, 0.5, 1.0, 2.0, 20.0, 40.0, 80.0, 160.0)
+
+# kick interval, part of the timeout
+DEFAULT_FRACTION = 0.5
+# a kick rides along with a poll after this part of the kick interval
+DEFAULT_PIGGYBACK = 0.75
+# stall alert if there was no kick for this part of the timeout
+DEFAULT_MARGIN = 0.8
+# a failed kick is retried after this time in s (at most the kick interval)
+RETRY_S = 2.0
+# interval in s of the error log while the kicks fail
+FAILURE_LOG_INTERVAL_S = 60.0
+
+
+class WatchdogKeeper:
+    """
+    Kicks the watchdog of a bq25792 on its own deadline.
+
+    Parameters
+    ----------
+    hat : bq25792
+        the charger, the programmed timeout is taken from its snapshot.
+    fraction : float
+        kick interval as part of the timeout (default: 0.5).
+    piggyback : float
+        part of the kick interval after which a kick rides along with a poll (default: 0.75).
+    margin : float
+        part of the timeout without kick after which a stall is alerted (default: 0.8).
+
+    Attributes
+    ----------
+    kicks : int
+        number of watchdog kicks.
+    stalls : int
+        number of alerted stalls.
+    failures : int
+        number of failed kicks.
+    retry_at : float
+        monotonic time of the retry of a failed kick, None after a successful kick.
+    """
+    def __init__(self, hat, fraction=DEFAULT_FRACTION, piggyback=DEFAULT_PIGGYBACK, margin=DEFAULT_MARGIN):
+        if not 0 < fraction < margin < 1:
+            raise ValueError("expected 0 < fraction < margin < 1, got fraction %s, margin %s" % (fraction, margin))
+        self.hat = hat
+        self.fraction = fraction
+        self.piggyback = piggyback
+        self.margin = margin
+        self.kicks = 0
+        self.stalls = 0
+        self.failures = 0
+        self.retry_at = None
+        self._failure_logged = None
+        # write_defaults() kicked the watchdog
+        self.last_kick = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def timeout_s(self):
+        ''' programmed watchdog timeout in s, None if the watchdog is disabled '''
+        return WATCHDOG_TIMEOUTS_S[self.hat.snapshot.value("WATCHDOG")]
+
+    def wait_s(self, now=None):
+        '''
+        Returns the time in s until the next kick is due, None if the watchdog is disabled.
+        '''
+        timeout_s = self.timeout_s
+        if timeout_s is None:
+            return None
+        now = time.monotonic() if now is None else now
+        deadline = self.last_kick + self.fraction * timeout_s
+        if self.retry_at is not None:
+            deadline = max(deadline, self.retry_at)
+        return max(0.0, deadline - now)
+
+    def due(self, now=None, polling=False):
+        '''
+        Returns True if a kick is due at now, with polling (registers are read now) already
+        after the piggyback part of the kick interval. After a failed kick not before retry_at.
+        '''
+        timeout_s = self.timeout_s
+        if timeout_s is None:
+            return False
+        now = time.monotonic() if now is None else now
+        if self.retry_at is not None and now < self.retry_at:
+            return False
+        elapsed = (now - self.last_kick) / (self.fraction * timeout_s)
+        return elapsed >= (self.piggyback if polling else 1.0)
+
+    def kick(self, now=None):
+        '''
+        Resets the watchdog timer. Returns 0, -1 if the write failed, the kick is
+        retried after RETRY_S then.
+        '''
+        now = time.monotonic() if now is None else now
+        if self.hat.watchdog_reset() == -1:
+            self.failures += 1
+            self.retry_at = now + min(RETRY_S, self.fraction * (self.timeout_s or RETRY_S))
+            if self._failure_logged is None or now - self._failure_logged >= FAILURE_LOG_INTERVAL_S:
+                self._failure_logged = now
+                logging.error("watchdog kick failed (%d failures), retry in %.1f s", self.failures, self.retry_at - now)
+            return -1
+        self.retry_at = None
+        self._failure_logged = None
+        self.last_kick = now
+        self.kicks += 1
+        return 0
+
+    def stalled(self, now=None):
+        ''' True if there was no kick for the margin of the timeout '''
+        timeout_s = self.timeout_s
+        if timeout_s is None:
+            return False
+        now = time.monotonic() if now is None else now
+        return now - self.last_kick > self.margin * timeout_s
+
+    def start(self):
+        '''
+        Starts the monitor thread alerting a stalled poll loop.
+        '''
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mupihat-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        alerted = None
+        while not self._stop.wait((self.timeout_s or WATCHDOG_TIMEOUTS_S[-1]) * (1 - self.margin) / 2):
+            last_kick = self.last_kick
+            if last_kick == alerted or not self.stalled():
+                continue
+            alerted = last_kick
+            self.stalls += 1
+            age = time.monotonic() - last_kick
+            logging.error("watchdog not kicked for %.0f s, the poll loop stalled, the charger resets its configuration in %.0f s",
+                          age, max(0.0, self.timeout_s - age))
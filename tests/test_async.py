@@ -0,0 +1,58 @@
+import asyncio
+
+from mupihat_async import AsyncBQ25792
+from mupihat_bq25792 import bq25792
+from mupihat_sim import SimulatedBQ25792
+
+
+def make_async_hat():
+    # 1 ms per byte, a read of the poll groups takes some 10 ms
+    hat = bq25792(bus=lambda i2c_device: SimulatedBQ25792(i2c_device, byte_time_s=1e-3), battery_conf_file="/nonexistent")
+    hat.read_all_register()
+    return AsyncBQ25792(hat)
+
+
+def test_concurrent_reads_share_one_bus_read():
+    async_hat = make_async_hat()
+    sim = async_hat.hat.bq
+    try:
+        before = sim.transactions
+        asyncio.run(async_hat.read_snapshot())
+        one_read = sim.transactions - before
+
+        async def readers():
+            return await asyncio.gather(*(async_hat.read_snapshot() for _ in range(10)))
+
+        before = sim.transactions
+        snapshots = asyncio.run(readers())
+        assert sim.transactions - before == one_read
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert (async_hat.reads, async_hat.shared) == (2, 9)
+        # the finished read is not shared with later calls
+        assert not async_hat._inflight
+    finally:
+        async_hat.close()
+
+
+def test_cancelled_waiter_does_not_cancel_shared_read():
+    async_hat = make_async_hat()
+    sim = async_hat.hat.bq
+    generation = async_hat.snapshot.generation
+    try:
+        async def cancel_first():
+            first = asyncio.ensure_future(async_hat.read_snapshot())
+            second = asyncio.ensure_future(async_hat.read_snapshot(("adc",)))
+            await asyncio.sleep(0)
+            first.cancel()
+            snapshot = await second
+            assert first.cancelled()
+            return snapshot
+
+        before = sim.transactions
+        snapshot = asyncio.run(cancel_first())
+        assert snapshot != -1 and snapshot.generation == generation + 1
+        assert async_hat.snapshot is snapshot
+        assert sim.transactions > before
+        assert (async_hat.reads, async_hat.shared) == (1, 1)
+    finally:
+        async_hat.close()
@@ -0,0 +1,60 @@
+import pytest
+
+from mupihat_bq25792 import bq25792
+from mupihat_dump import DumpWriter, DumpReader, capture, rows, to_json, to_json_registers
+from mupihat_sim import SimulatedBQ25792
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def hat():
+    hat = bq25792(bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    hat.write_defaults()
+    hat.read_all_register()
+    return hat
+
+
+def test_decoded_dump_equals_live_views(hat, tmp_path):
+    path = str(tmp_path / "charger.dump")
+    writer = DumpWriter(path, battery_conf=hat.battery_conf)
+    snapshots = []
+    for i in range(25):
+        hat.bq.set_values(VBAT_ADC=6600 + 75 * i, IBAT_ADC=1500 - 150 * i, CHG_STAT=i % 8, VBUS_ADC=5000 + i)
+        snapshot = hat.read_registers(("status", "flags", "adc"))
+        writer.append(snapshot)
+        snapshots.append(snapshot)
+        if i % 7 == 6:
+            writer.flush()  # several chunks
+    writer.close()
+
+    reader = DumpReader(path)
+    ts, raw = reader.read()
+    assert raw.shape == (25, 73)
+    assert [image.tobytes() for image in raw] == [snapshot.raw for snapshot in snapshots]
+    # running total of the ms deltas, across the chunks
+    expected = [writer.base_time + round((snapshot.monotonic - writer._base_monotonic) * 1000) / 1000.0
+                for snapshot in snapshots]
+    assert ts.tolist() == pytest.approx(expected, abs=1e-6)
+    assert rows(to_json(raw, reader.battery_conf), len(ts)) == [hat.to_json(snapshot) for snapshot in snapshots]
+    assert rows(to_json_registers(raw, reader.battery_conf), len(ts)) == [hat.to_json_registers(snapshot) for snapshot in snapshots]
+    # time range selection
+    selected, _ = reader.read(ts[5], ts[9])
+    assert selected.tolist() == ts[(ts >= ts[5]) & (ts <= ts[9])].tolist()
+
+
+def test_capture_and_truncated_chunk(hat, tmp_path):
+    path = str(tmp_path / "capture.dump")
+    writer = DumpWriter(path, battery_conf=hat.battery_conf)
+    samples, errors, late = capture(hat, writer, rate_hz=500, count=5, groups=("adc",))
+    writer.close()
+    assert (samples, errors) == (5, 0)
+    ts, raw = DumpReader(path).read()
+    assert len(ts) == 5 and np.all(np.diff(ts) >= 0)
+    assert rows(to_json(raw, hat.battery_conf), 5)[-1] == hat.to_json()
+
+    with open(path, "rb") as infile:
+        data = infile.read()
+    with open(path, "wb") as outfile:
+        outfile.write(data[:-3])
+    assert len(DumpReader(path).read()[0]) == 0
@@ -0,0 +1,27 @@
+from mupihat_bq25792 import bq25792
+from mupihat_events import ChargerEvents
+from mupihat_sim import SimulatedBQ25792
+
+
+def test_handlers_get_the_snapshot_of_the_flag_read():
+    hat = bq25792(bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    hat.read_all_register()
+    read_registers = hat.read_registers
+
+    def racing_read(groups):
+        snapshot = read_registers(groups)
+        # the poll thread publishes a newer snapshot right after the flag read
+        read_registers(("adc",))
+        return snapshot
+
+    hat.read_registers = racing_read
+    calls = []
+    events = ChargerEvents(hat, line=None)
+    events.add_handler(lambda flags, snapshot: calls.append((flags, snapshot)))
+    hat.bq._set_flag("VBUS_PRESENT_FLAG")
+
+    assert events.handle_interrupt() == ["VBUS_PRESENT_FLAG"]
+    (flags, snapshot), = calls
+    assert snapshot is not hat.snapshot
+    assert snapshot.generation == hat.snapshot.generation - 1
+    assert snapshot.value("VBUS_PRESENT_FLAG") == 1
@@ -0,0 +1,35 @@
+import time
+
+import mupihat_history as history
+import mupihat_registers as registers
+from mupihat_history import TelemetryRing
+
+
+def sample(vbat, monotonic):
+    raw = bytearray(registers.por_image())
+    reg, field = registers.FIELDS_BY_NAME["VBAT_ADC"]
+    raw[reg.addr:reg.addr + 2] = (vbat << field.shift).to_bytes(2, "big")
+    raw[registers.FIELDS_BY_NAME["VBUS_PRESENT_FLAG"][0].addr] = 0xff
+    return registers.RegisterSnapshot(bytes(raw), monotonic=monotonic)
+
+
+def test_query_wraps_and_decodes_flags():
+    ring = TelemetryRing(4)
+    now = time.monotonic()
+    for i in range(6):
+        ring.append(sample(7000 + i, now - 5 + i))
+    result = ring.query(fields=("VBAT", "flags"))
+    assert result["VBAT"] == [7002, 7003, 7004, 7005]
+    assert len(result["ts"]) == 4 and result["ts"] == sorted(result["ts"])
+    assert "VBUS_PRESENT_FLAG" in result["flags"][0]
+    assert result["flags"][0] is result["flags"][3]
+
+
+def test_query_default_window():
+    ring = TelemetryRing(8)
+    now = time.monotonic()
+    ring._epoch = now - 2 * history.DEFAULT_WINDOW_S
+    ring.append(sample(7000, now - history.DEFAULT_WINDOW_S - 60))
+    ring.append(sample(7100, now - 1))
+    assert ring.query(fields=("VBAT",))["VBAT"] == [7100]
+    assert ring.query(since=0, fields=("VBAT",))["VBAT"] == [7000, 7100]
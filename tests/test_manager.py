@@ -0,0 +1,53 @@
+import time
+
+from mupihat_manager import ChargerManager
+from mupihat_sim import SimulatedBQ25792
+
+
+def wait_for(condition, timeout_s=5.0):
+    deadline = time.monotonic() + timeout_s
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_dead_device_does_not_stop_its_bus():
+    # both chargers on bus 1, the simulated chip answers only 0x6b, 0x6a raises EREMOTEIO
+    manager = ChargerManager([(1, 0x6a), (1, 0x6b)], bus=SimulatedBQ25792, period_s=0.01,
+                             battery_conf_file="/nonexistent")
+    dead, alive = manager.device((1, 0x6a)), manager.device((1, 0x6b))
+    manager.start()
+    try:
+        assert wait_for(lambda: alive.reads >= 10 and dead.errors >= 10)
+        assert all(thread.is_alive() for thread in manager._threads)
+    finally:
+        manager.stop()
+    assert dead.reads == 0 and dead.watchdog is None
+    assert alive.errors == 0 and alive.watchdog is not None
+    summary = manager.summary()
+    assert summary["online"] == 1 and summary["devices"] == 2
+
+
+def test_setup_is_retried_until_the_device_answers():
+    manager = ChargerManager([(1, 0x6b)], bus=SimulatedBQ25792, period_s=0.01,
+                             battery_conf_file="/nonexistent")
+    device = manager.device((1, 0x6b))
+    device.hat.i2c_addr = 0x6a
+    assert manager.poll(device) == -1
+    assert device.errors == 1 and device.watchdog is None
+    device.hat.i2c_addr = 0x6b
+    assert manager.poll(device) != -1
+    assert device.reads == 1 and device.watchdog is not None
+
+
+def test_poll_counts_exceptions_of_the_driver():
+    manager = ChargerManager([(1, 0x6b)], bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    device = manager.device((1, 0x6b))
+    assert manager.poll(device) != -1
+
+    def broken(groups):
+        raise RuntimeError("driver bug")
+
+    device.hat.read_registers = broken
+    assert manager.poll(device) == -1
+    assert device.errors == 1 and device.reads == 1
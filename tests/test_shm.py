@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+import mupihat_shm
+from mupihat_shm import StatusClient, StatusPublisher, ShmError, SEQ, SEQ_OFFSET, HEADER
+
+
+def test_read_retries_while_write_in_progress(tmp_path, monkeypatch):
+    path = str(tmp_path / "mupihat")
+    publisher = StatusPublisher(path)
+    publisher.publish({"Vbus": 5000}, generation=1)
+    client = StatusClient(path)
+    assert client.read() == {"Vbus": 5000}
+
+    # a write of the publisher is interrupted: odd sequence number, new payload half written
+    SEQ.pack_into(publisher._mm, SEQ_OFFSET, publisher.seq + 1)
+    publisher._mm[HEADER.size:HEADER.size + 4] = b"{\"Vb"
+    sleeps = []
+
+    def finish_write(seconds):
+        sleeps.append(seconds)
+        publisher.publish({"Vbus": 0}, generation=2)
+
+    monkeypatch.setattr(mupihat_shm.time, "sleep", finish_write)
+    assert client.read() == {"Vbus": 0}
+    assert client.generation == 2
+    assert len(sleeps) == 1
+
+
+def test_read_rejects_corrupt_payload(tmp_path):
+    path = str(tmp_path / "mupihat")
+    publisher = StatusPublisher(path)
+    publisher.publish({"Bat_Stat": "OK"}, generation=1)
+    # payload changed behind an even sequence number, e.g. stores reordered by the CPU
+    publisher._mm[HEADER.size + 2:HEADER.size + 10] = b"Bat_Xtat"
+    client = StatusClient(path)
+    with pytest.raises(ShmError, match="no consistent status"):
+        client.read()
+    assert client._data is None
+
+
+def test_cli_exits_2_if_stale(tmp_path, capsys, monkeypatch):
+    path = str(tmp_path / "mupihat")
+    StatusPublisher(path).publish({"Vbus": 5000}, generation=1, wall=time.time() - 600)
+    monkeypatch.setattr(sys, "argv", ["mupihat_shm.py", "--path", path, "--max-age", "300", "--shell", "Vbus"])
+    with pytest.raises(SystemExit) as exit_info:
+        mupihat_shm.main()
+    assert exit_info.value.code == 2
+    assert capsys.readouterr().out == "Vbus=5000\n"
+
+
+def test_env_file_is_sourced_by_shell(tmp_path):
+    path = str(tmp_path / "mupihat")
+    publisher = StatusPublisher(path)
+    publisher.publish({"Vbus": 5000, "Bat_Stat": "LOW; exit 1", "Bat-Type": "x", "list": [1]}, generation=7, wall=1.5e9)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["mupihat", "mupihat.env"]
+    out = subprocess.run(["bash", "-c", '. "$1" && echo "$MUPIHAT_GENERATION $MUPIHAT_TS $Vbus $Bat_Stat"', "-", path + ".env"],
+                         capture_output=True, text=True, check=True).stdout
+    assert out == "7 1500000000 5000 LOW; exit 1\n"
+    assert "list" not in open(path + ".env").read()
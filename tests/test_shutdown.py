@@ -0,0 +1,43 @@
+import os
+import signal
+
+import pytest
+
+mupihat = pytest.importorskip("mupihat")
+import mupihat_dump
+from mupihat_bq25792 import bq25792
+from mupihat_samplelog import SampleLog
+from mupihat_sim import SimulatedBQ25792
+from mupihat_store import TelemetryStore, segment_files
+
+
+def test_sigterm_flushes_sample_log_and_store(tmp_path, monkeypatch):
+    hat = bq25792(bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    snapshot = hat.read_all_register()
+    sample_log = SampleLog(str(tmp_path / "samples.csv"), flush_s=3600)
+    store = TelemetryStore(str(tmp_path / "store"))
+    for _ in range(3):
+        sample_log.write(snapshot)
+        store.append(snapshot)
+    size = os.path.getsize(tmp_path / "samples.csv")
+    monkeypatch.setattr(mupihat, "sample_log", sample_log)
+    monkeypatch.setattr(mupihat, "store", store)
+    monkeypatch.setattr(mupihat, "stopping", type(mupihat.stopping)())
+    previous = signal.signal(signal.SIGTERM, mupihat.on_sigterm)
+    try:
+        with pytest.raises(SystemExit):
+            os.kill(os.getpid(), signal.SIGTERM)
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        mupihat.shutdown(None)
+
+    assert mupihat.stopping.is_set()
+    assert os.path.getsize(tmp_path / "samples.csv") > size
+    with open(tmp_path / "samples.csv") as infile:
+        assert len(infile.readlines()) == 4
+    assert store._file is None and len(segment_files(str(tmp_path / "store"))) == 1
+
+
+def test_sigterm_ends_dump_capture_like_ctrl_c():
+    with pytest.raises(KeyboardInterrupt):
+        mupihat_dump.on_sigterm(signal.SIGTERM, None)
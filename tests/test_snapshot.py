@@ -0,0 +1,65 @@
+import mupihat_registers as registers
+from mupihat_bq25792 import bq25792
+from mupihat_sim import SimulatedBQ25792
+
+
+def make_hat():
+    return bq25792(bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+
+
+def test_updated_replaces_blocks_and_counts_generation():
+    snapshot = registers.RegisterSnapshot(registers.por_image(), generation=4)
+    vbat = snapshot.value("VBAT_ADC")
+    vreg = snapshot.value("VREG")
+    adc_start, adc_length = registers.REGISTER_GROUPS["adc"][0]
+    data = bytearray(snapshot.raw[adc_start:adc_start + adc_length])
+    offset = registers.FIELDS_BY_NAME["VBAT_ADC"][0].addr - adc_start
+    data[offset:offset + 2] = (7600).to_bytes(2, "big")
+
+    updated = snapshot.updated([(adc_start, data)])
+
+    assert updated.generation == 5
+    assert updated.value("VBAT_ADC") == 7600 != vbat
+    # decoded values outside the read blocks are carried over
+    assert updated._values["VREG"] == vreg
+    assert snapshot.raw != updated.raw
+
+
+def test_read_generations_increase():
+    hat = make_hat()
+    first = hat.read_all_register()
+    second = hat.read_registers(("adc",))
+    assert second.generation == first.generation + 1
+    assert hat.snapshot is second
+
+
+def test_carried_over_wd_stat_does_not_clear_shadow():
+    hat = make_hat()
+    hat.bq.set_field("WD_STAT", 1)
+    hat.read_all_register()
+    hat.write_fields(VREG=8000)
+    assert hat._shadow[registers.FIELDS_BY_NAME["VREG"][0].addr] is not None
+
+    # WD_STAT = 1 is carried over, REG1B is not part of the read
+    snapshot = hat.read_registers(("adc",))
+    assert snapshot.value("WD_STAT") == 1
+    assert hat._shadow[registers.FIELDS_BY_NAME["VREG"][0].addr] is not None
+
+    # a read of REG1B with WD_STAT set clears the shadow
+    hat.read_registers(("status",))
+    assert hat._shadow[registers.FIELDS_BY_NAME["VREG"][0].addr] is None
+
+
+def test_flags_are_not_carried_over():
+    hat = make_hat()
+    hat.read_all_register()
+    hat.bq.set_field("VBUS_OVP_FLAG", 1)
+    assert "VBUS_OVP_FLAG" in hat.read_flags()
+    assert hat.snapshot.value("VBUS_OVP_FLAG") == 1
+
+    # the chip cleared the flag on the read, a snapshot without the flags group reports 0
+    snapshot = hat.read_registers(("status", "adc"))
+    assert snapshot.value("VBUS_OVP_FLAG") == 0
+    flags_start, flags_length = registers.REGISTER_GROUPS["flags"][0]
+    assert snapshot.raw[flags_start:flags_start + flags_length] == bytes(flags_length)
+    assert hat.to_json_registers(snapshot)["REG26_FAULT_Flag_0"]["VBUS_OVP_FLAG"] == 0
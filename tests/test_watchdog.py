@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+mupihat = pytest.importorskip("mupihat")
+import mupihat_watchdog
+from mupihat_bq25792 import bq25792
+from mupihat_sim import SimulatedBQ25792
+from mupihat_watchdog import WatchdogKeeper, RETRY_S
+
+
+class StopLoop(Exception):
+    pass
+
+
+class FakeWakeup:
+    ''' wakeup event of the poll loop, advances the clock by the wait timeout '''
+    def __init__(self, clock, iterations):
+        self.clock = clock
+        self.iterations = iterations
+        self.timeouts = []
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+        if len(self.timeouts) == self.iterations:
+            raise StopLoop()
+        self.clock[0] += timeout
+        return False
+
+    def clear(self):
+        pass
+
+
+def test_poll_loop_backs_off_failing_kick(monkeypatch, caplog):
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    hat = bq25792(bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    hat.read_all_register()
+    watchdog = WatchdogKeeper(hat)
+    assert watchdog.timeout_s == 40.0
+    kicks = []
+
+    def failing_reset():
+        kicks.append(clock[0])
+        return -1
+
+    monkeypatch.setattr(hat, "watchdog_reset", failing_reset)
+    wakeup = FakeWakeup(clock, 300)
+    monkeypatch.setattr(mupihat, "hat", hat)
+    monkeypatch.setattr(mupihat, "watchdog", watchdog)
+    monkeypatch.setattr(mupihat, "wakeup", wakeup)
+    with pytest.raises(StopLoop):
+        mupihat.periodic_json_dump()
+
+    # the loop waits between the retries instead of spinning on the failed kick
+    assert min(wakeup.timeouts) > 0
+    assert len(kicks) > 10
+    assert min(b - a for a, b in zip(kicks, kicks[1:])) >= RETRY_S
+    assert watchdog.failures == len(kicks)
+    logged = [record for record in caplog.records if "watchdog kick failed" in record.message]
+    assert len(logged) <= 1 + (kicks[-1] - kicks[0]) / mupihat_watchdog.FAILURE_LOG_INTERVAL_S
+
+    # the next successful kick ends the retries
+    monkeypatch.setattr(hat, "watchdog_reset", lambda: 0)
+    watchdog.kick(watchdog.retry_at)
+    assert watchdog.retry_at is None
+    assert watchdog.wait_s(clock[0]) == pytest.approx(20.0, abs=RETRY_S)
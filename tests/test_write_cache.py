@@ -0,0 +1,111 @@
+import pytest
+
+import mupihat_registers as registers
+from mupihat_bq25792 import bq25792
+from mupihat_sim import SimulatedBQ25792
+
+REG0F = registers.REGISTERS_BY_NAME["REG0F_Charger_Control_0"].addr
+REG10 = registers.REGISTERS_BY_NAME["REG10_Charger_Control_1"].addr
+REG09 = registers.REGISTERS_BY_NAME["REG09_Termination_Control"].addr
+
+
+class RecordingSim(SimulatedBQ25792):
+    """ simulated charger recording the write transactions (start address, bytes) """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = []
+
+    def write_byte_data(self, i2c_addr, register, value):
+        self.writes.append((register, [value]))
+        super().write_byte_data(i2c_addr, register, value)
+
+    def write_i2c_block_data(self, i2c_addr, register, data):
+        self.writes.append((register, list(data)))
+        super().write_i2c_block_data(i2c_addr, register, data)
+
+
+@pytest.fixture
+def hat():
+    hat = bq25792(bus=RecordingSim, battery_conf_file="/nonexistent")
+    hat.read_all_register()
+    hat.bq.writes.clear()
+    return hat
+
+
+def changed(hat, addr):
+    ''' a value of the writable register addr that differs from the chip '''
+    mask = registers.FIELD_MASK[addr] & ~registers.SELF_CLEARING[addr] & 0xFF
+    return hat.snapshot.raw[addr] ^ (mask & -mask)  # lowest bitfield bit flipped
+
+
+def test_adjacent_registers_are_one_block(hat):
+    values = [changed(hat, REG0F), changed(hat, REG10)]
+    with hat.transaction():
+        hat.queue_write(REG0F, values[:1])
+        hat.queue_write(REG10, values[1:])
+    assert hat.bq.writes == [(REG0F, values)]
+
+
+def test_unchanged_values_are_not_written(hat):
+    hat.queue_write(REG0F, [hat.snapshot.raw[REG0F]])
+    assert hat.bq.writes == []
+    value = changed(hat, REG0F)
+    hat.queue_write(REG0F, [value])
+    hat.queue_write(REG0F, [value])
+    assert hat.bq.writes == [(REG0F, [value])]
+    hat.queue_write(REG0F, [value], force=True)
+    assert len(hat.bq.writes) == 2
+
+
+def test_nested_transactions_flush_once(hat):
+    values = [changed(hat, REG0F), changed(hat, REG10)]
+    with hat.transaction():
+        with hat.transaction():
+            hat.queue_write(REG0F, values[:1])
+        assert hat.bq.writes == []
+        with hat.transaction():
+            hat.queue_write(REG10, values[1:])
+        assert hat.bq.writes == []
+    assert hat.bq.writes == [(REG0F, values)]
+
+
+def test_exception_drops_pending_writes(hat):
+    with pytest.raises(RuntimeError):
+        with hat.transaction():
+            hat.queue_write(REG0F, [changed(hat, REG0F)], verify=True)
+            raise RuntimeError("abort")
+    hat.flush()
+    assert hat.bq.writes == []
+    assert hat._pending == {} and not hat._forced and not hat._verify
+
+
+@pytest.mark.parametrize("name, addr", [("WD_RST", REG10), ("REG_RST", REG09)])
+def test_self_clearing_bits_are_always_written(hat, name, addr):
+    reg, f = registers.FIELDS_BY_NAME[name]
+    assert registers.SELF_CLEARING[addr] & f.mask
+    value = hat.snapshot.raw[addr] | f.mask
+    hat.queue_write(addr, [value])
+    hat.queue_write(addr, [value])
+    assert hat.bq.writes == [(addr, [value]), (addr, [value])]
+    # the bit reads back as 0, the shadow does not keep it
+    assert hat._shadow[addr] == value & ~f.mask
+
+
+def test_write_defaults_failure_returns_error():
+    hat = bq25792(i2c_addr=0x6a, bus=SimulatedBQ25792, battery_conf_file="/nonexistent")
+    assert hat.MuPiHAT_Default() == -1
+    assert hat._pending == {}
+
+
+def test_read_register_word_updates_snapshot_and_shadow(hat):
+    reg = hat.REG06_Input_Current_Limit
+    addr = reg._addr
+    hat.bq.regs[addr:addr + 2] = (2000 // 10).to_bytes(2, "big")
+    generation = hat.snapshot.generation
+    assert hat.read_register_word(reg) == 200
+    assert hat.snapshot.generation == generation + 1
+    assert hat.snapshot.value("IINDPM") == 2000
+    assert hat._shadow[addr:addr + 2] == [0, 200]
+    # the chip holds the value now, the write is skipped
+    hat.queue_write(addr, [0, 200])
+    assert hat.bq.writes == []